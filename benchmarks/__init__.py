@@ -0,0 +1 @@
+"""Offline benchmarks against a synthetic stand-in site."""
@@ -0,0 +1,268 @@
+"""Run Facade and Controller benchmarks against the synthetic site and write a JSON report."""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic_site import SyntheticSite, use_site_selectors
+from constants.settings import Settings
+from controller.controller import Controller
+from controller.facade import Facade
+from driver import PlaywrightDriver
+from logger import configure_application_logging
+from utils.timing import TIMINGS
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Settings pinned for every benchmark so results only depend on the code under test;
+# environment variables are ignored
+BENCH_SETTINGS = {
+    "HEADLESS": True,
+    "SESSION_CACHE": False,
+    "RESUME": False,
+    "FEED_STREAM": False,
+    "RESULT_SINK": "jsonl",
+    "BLOCK_PRESET": "none",
+    "ASSET_CACHE": False,
+    "HTTP_FAST_PATH": False,
+    "PERF_METRICS": False,
+    "ACTION_TIMINGS": True,
+    "BROWSER_ENDPOINT": None,
+}
+
+
+def measure(name: str, func: Callable[[], Any], items: int) -> Dict[str, Any]:
+    """
+    Time one scenario and capture its per-action latency breakdown.
+
+    Args:
+        name: Scenario name
+        func: Scenario body; may return a RunSummary
+        items: Number of items the scenario handles
+
+    Returns:
+        Scenario result
+    """
+    TIMINGS.reset()
+    started = time.perf_counter()
+    outcome = func()
+    elapsed = time.perf_counter() - started
+
+    result = {
+        "name": name,
+        "items": items,
+        "elapsed_s": round(elapsed, 3),
+        "items_per_sec": round(items / elapsed, 2) if elapsed else 0.0,
+        "phases": TIMINGS.summary(),
+    }
+    # Controller.run reports throughput of the processing phase separately
+    if hasattr(outcome, "items_per_sec"):
+        result["processing_items_per_sec"] = round(outcome.items_per_sec, 2)
+        result["failed"] = outcome.failed
+    logger.warning(f"{name}: {result['items_per_sec']} items/s over {result['elapsed_s']}s")
+    return result
+
+
+def peak_memory() -> Dict[str, Optional[float]]:
+    """Peak RSS of this process and of its largest finished child (the browser driver tree)."""
+    if resource is None:
+        return {"python_peak_rss_mb": None, "browser_peak_rss_mb": None}
+
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    scale = 1 / 1_048_576 if sys.platform == "darwin" else 1 / 1024
+    return {
+        "python_peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale, 1),
+        "browser_peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale, 1
+        ),
+    }
+
+
+def run_benchmarks(
+    items: int = 200,
+    latency_ms: float = 0.0,
+    payload_kb: int = 20,
+    concurrency_levels: List[int] = (1, 4),
+    action_items: int = 50,
+) -> Dict[str, Any]:
+    """
+    Run every scenario against a fresh synthetic site and browser.
+
+    Scenarios: Facade.login, Facade.collect_item_ids, serial Facade.item_action
+    over action_items items, then Controller.run at each concurrency level and
+    once more with the HTTP fast path.
+
+    Args:
+        items: Items in the synthetic feed
+        latency_ms: Delay added to every response
+        payload_kb: Approximate feed/item page size
+        concurrency_levels: Worker tab counts for Controller.run
+        action_items: Items for the serial item_action scenario
+
+    Returns:
+        Benchmark report
+    """
+    workdir = Path(tempfile.mkdtemp(prefix="bench_"))
+    use_site_selectors()
+
+    scenarios: List[Dict[str, Any]] = []
+    with SyntheticSite(items, latency_ms, payload_kb) as site:
+        settings = Settings.load(
+            environ={}, BASE_URL=site.url, REPORT_DIR=str(workdir / "reports"), **BENCH_SETTINGS
+        )
+        username, password = "bench", "bench"
+
+        with PlaywrightDriver(user_data_dir=str(workdir / "profile"), settings=settings) as driver:
+            context = driver.page.context
+            facade = Facade(driver.page, settings)
+
+            scenarios.append(measure("facade_login", lambda: facade.login(username, password), 1))
+            ids: List[str] = []
+            scenarios.append(
+                measure(
+                    "facade_collect_item_ids", lambda: ids.extend(facade.collect_item_ids()), items
+                )
+            )
+            sample = ids[:action_items]
+            scenarios.append(
+                measure(
+                    "facade_item_action",
+                    lambda: [facade.item_action(item_id) for item_id in sample],
+                    len(sample),
+                )
+            )
+
+            for concurrency in concurrency_levels:
+                context.clear_cookies()
+                controller = Controller(
+                    driver.page, driver=driver, concurrency=concurrency, settings=settings
+                )
+                scenarios.append(
+                    measure(
+                        f"controller_run_c{concurrency}",
+                        lambda: controller.run(username, password),
+                        items,
+                    )
+                )
+
+            context.clear_cookies()
+            controller = Controller(
+                driver.page,
+                driver=driver,
+                concurrency=max(concurrency_levels),
+                settings=settings.with_overrides(HTTP_FAST_PATH=True),
+            )
+            scenarios.append(
+                measure(
+                    "controller_run_http_fast_path",
+                    lambda: controller.run(username, password),
+                    items,
+                )
+            )
+
+        requests_served = site.requests
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "playwright": version("playwright"),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "params": {
+            "items": items,
+            "latency_ms": latency_ms,
+            "payload_kb": payload_kb,
+            "concurrency_levels": list(concurrency_levels),
+            "action_items": action_items,
+        },
+        "scenarios": scenarios,
+        "requests_served": requests_served,
+        "peak_memory": peak_memory(),
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """
+    Find scenarios whose throughput dropped more than max_regression versus a baseline.
+
+    Args:
+        report: Current report
+        baseline: Earlier report
+        max_regression: Allowed relative drop (0.2 = 20%)
+
+    Returns:
+        Descriptions of regressed scenarios
+    """
+    previous = {s["name"]: s["items_per_sec"] for s in baseline.get("scenarios", [])}
+    regressions = []
+    for scenario in report["scenarios"]:
+        before = previous.get(scenario["name"])
+        if before and scenario["items_per_sec"] < before * (1 - max_regression):
+            regressions.append(
+                f"{scenario['name']}: {scenario['items_per_sec']} items/s (baseline {before})"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200, help="feed size (default: 200)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay per response")
+    parser.add_argument("--payload-kb", type=int, default=20, help="page size (default: 20)")
+    parser.add_argument(
+        "--concurrency", default="1,4", help="comma-separated tab counts (default: 1,4)"
+    )
+    parser.add_argument("--action-items", type=int, default=50, help="serial item_action items")
+    parser.add_argument("--output", help="report path (default: benchmarks/results/...)")
+    parser.add_argument("--baseline", help="earlier report to compare items/sec against")
+    parser.add_argument(
+        "--max-regression", type=float, default=0.2, help="allowed items/sec drop (default: 0.2)"
+    )
+    args = parser.parse_args()
+
+    configure_application_logging(log_level="WARNING", log_file="logs/benchmarks.log")
+
+    report = run_benchmarks(
+        items=args.items,
+        latency_ms=args.latency_ms,
+        payload_kb=args.payload_kb,
+        concurrency_levels=[int(c) for c in args.concurrency.split(",")],
+        action_items=args.action_items,
+    )
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output = Path(args.output or f"benchmarks/results/benchmark_{timestamp}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Benchmark report written to {output}")
+
+    if args.baseline:
+        regressions = compare(
+            report, json.loads(Path(args.baseline).read_text()), args.max_regression
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""Local HTTP server imitating the target site: login form, feed and item pages."""
+
+import hashlib
+import html
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "bench_session"
+
+# Selectors matching the synthetic markup, applied with use_site_selectors()
+SITE_SELECTORS: Dict[str, str] = {
+    "FEED_ITEMS": ".feed",
+    "FEED_ITEM": ".item",
+    "ITEM_DETAILS": ".details",
+    "LOGGED_IN_INDICATOR": "#logout",
+    "USERNAME_INPUT": 'input[name="username"]',
+    "PASSWORD_INPUT": 'input[name="password"]',
+    "LOGIN_BUTTON": 'button[type="submit"]',
+}
+
+STATIC_JS = b"document.documentElement.dataset.ready = '1';\n" + b"//" + b"x" * 40_000 + b"\n"
+STATIC_CSS = b".item{padding:4px}.details{font-weight:bold}\n/*" + b"y" * 20_000 + b"*/\n"
+
+
+class SyntheticSite:
+    """
+    Threaded HTTP server on 127.0.0.1 serving a synthetic site.
+
+    Routes: "/" (login form, or the feed once logged in), POST "/login",
+    "/item/<id>" and cacheable "/static/app.js" and "/static/app.css". Every
+    response waits latency_ms first; feed and item pages are padded to
+    roughly payload_kb.
+    """
+
+    def __init__(self, items: int = 100, latency_ms: float = 0.0, payload_kb: int = 20):
+        """
+        Initialize site.
+
+        Args:
+            items: Number of items in the feed
+            latency_ms: Delay added to every response
+            payload_kb: Approximate size of feed and item pages
+        """
+        self.items = items
+        self.latency_ms = latency_ms
+        self.payload_kb = payload_kb
+        self.requests = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if not self._server:
+            raise RuntimeError("Synthetic site is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SyntheticSite":
+        """Start serving on a free port in a background thread."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="synthetic-site", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Synthetic site with {self.items} items at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "SyntheticSite":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def padding(self) -> str:
+        """Filler markup bringing a page to about payload_kb."""
+        return f'<p class="filler">{"lorem ipsum " * (self.payload_kb * 1024 // 12)}</p>'
+
+    def login_page(self) -> str:
+        return _page(
+            "Login",
+            '<form method="post" action="/login">'
+            '<input name="username"><input name="password" type="password">'
+            '<button type="submit">Sign in</button></form>',
+        )
+
+    def feed_page(self) -> str:
+        items = "".join(
+            f'<div class="item" data-id="{i}"><a href="/item/{i}">Item {i}</a></div>'
+            for i in range(1, self.items + 1)
+        )
+        return _page(
+            "Feed",
+            f'<a id="logout" href="/">Log out</a><div class="feed">{items}</div>{self.padding()}',
+        )
+
+    def item_page(self, item_id: str) -> str:
+        return _page(
+            f"Item {item_id}",
+            f'<a id="logout" href="/">Log out</a>'
+            f'<div class="details">Item {html.escape(item_id)} details</div>{self.padding()}',
+        )
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title>"
+        '<link rel="stylesheet" href="/static/app.css"><script src="/static/app.js"></script>'
+        f"</head><body>{body}</body></html>"
+    )
+
+
+def _make_handler(site: SyntheticSite) -> type:
+    """Build a request handler class bound to a site."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._delay()
+            path = self.path.split("?", 1)[0].split("#", 1)[0]
+            if path == "/static/app.js":
+                self._send(200, STATIC_JS, "application/javascript", cacheable=True)
+            elif path == "/static/app.css":
+                self._send(200, STATIC_CSS, "text/css", cacheable=True)
+            elif not self._logged_in():
+                self._send_html(200, site.login_page())
+            elif path in ("", "/"):
+                self._send_html(200, site.feed_page())
+            elif path.startswith("/item/"):
+                self._send_html(200, site.item_page(path[len("/item/") :]))
+            else:
+                self._send_html(404, _page("Not found", "Not found"))
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._delay()
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode())
+            if self.path != "/login" or not form.get("username"):
+                self._send_html(400, site.login_page())
+                return
+
+            self.send_response(303)
+            self.send_header("Location", "/")
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}=1; Path=/; HttpOnly")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def _delay(self) -> None:
+            site.requests += 1
+            if site.latency_ms:
+                time.sleep(site.latency_ms / 1000)
+
+        def _logged_in(self) -> bool:
+            return f"{SESSION_COOKIE}=1" in (self.headers.get("Cookie") or "")
+
+        def _send_html(self, status: int, markup: str) -> None:
+            self._send(status, markup.encode(), "text/html; charset=utf-8")
+
+        def _send(
+            self, status: int, body: bytes, content_type: str, cacheable: bool = False
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if cacheable:
+                self.send_header("Cache-Control", "public, max-age=3600")
+                self.send_header("ETag", f'"{hashlib.sha1(body).hexdigest()[:16]}"')
+            else:
+                self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def use_site_selectors(selectors: Dict[str, str] = SITE_SELECTORS) -> None:
+    """
+    Point the page objects at the synthetic markup.
+
+    Selector constants are imported by value into the page modules, so they
+    are replaced in every module holding them (and in LOGIN_STATES).
+    """
+    import constants.feed_constants
+    import constants.item_constants
+    import constants.login_constants
+    import pages.async_feed_page
+    import pages.async_item_page
+    import pages.async_login_page
+    import pages.feed_page
+    import pages.item_page
+    import pages.login_page
+
+    modules = (
+        constants.feed_constants,
+        constants.item_constants,
+        constants.login_constants,
+        pages.feed_page,
+        pages.async_feed_page,
+        pages.item_page,
+        pages.async_item_page,
+        pages.login_page,
+        pages.async_login_page,
+    )
+    for module in modules:
+        for name, selector in selectors.items():
+            if hasattr(module, name):
+                setattr(module, name, selector)
+
+    states = pages.login_page.LOGIN_STATES
+    states["logged_in"] = selectors.get("LOGGED_IN_INDICATOR", states["logged_in"])
+    states["login_form"] = selectors.get("LOGIN_BUTTON", states["login_form"])
@@ -0,0 +1,65 @@
+"""Long-lived Chromium that PlaywrightDriver runs can connect to instead of launching their own."""
+
+import argparse
+import logging
+import signal
+import sys
+import threading
+
+from playwright.sync_api import sync_playwright
+
+from driver import CHROMIUM_ARGS
+from logger import configure_application_logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9222
+
+
+def serve(port: int = DEFAULT_PORT, headless: bool = True) -> None:
+    """
+    Launch Chromium with a CDP endpoint and keep it running until interrupted.
+
+    Jobs connect with browser_endpoint = http://127.0.0.1:<port>; each gets its
+    own isolated context, so cookies do not leak between runs (logins are
+    restored from the session cache instead of the browser profile).
+
+    Args:
+        port: Local port for the remote debugging (CDP) endpoint
+        headless: Run browser in headless mode
+    """
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=headless,
+            args=[*CHROMIUM_ARGS, f"--remote-debugging-port={port}"],
+        )
+        logger.info(f"Browser server ready: BROWSER_ENDPOINT=http://127.0.0.1:{port}")
+
+        stop.wait()
+
+        logger.info("Shutting down browser server")
+        browser.close()
+
+
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="CDP port (default: 9222)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args()
+
+    configure_application_logging(log_file="logs/browser_server.log")
+    try:
+        serve(args.port, headless=not args.headed)
+    except Exception as e:
+        logger.error(f"Browser server failed: {e}", exc_info=True)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 """Constants and configuration for web automation."""
 
-from .settings import Settings
+from .settings import Settings, get_settings, reload_settings, set_settings
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "get_settings", "reload_settings", "set_settings"]
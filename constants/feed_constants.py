@@ -1,2 +1,4 @@
 FEED_ITEMS = ""
+FEED_ITEM = ".item"
+FEED_NEXT_PAGE = ""
 VIEWS_URL_SUFFIX = ""
@@ -1 +1,5 @@
 ITEM_DETAILS = ""
+
+# Item id resolution from feed links/attributes; the pattern's first group is the id
+ITEM_ID_PATTERN = r"/item/([^/?#]+)"
+ITEM_ID_ATTRIBUTES = ("data-id", "data-item-id")
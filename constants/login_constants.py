@@ -1,3 +1,9 @@
 USERNAME_INPUT = 'input[name="username"]'
 PASSWORD_INPUT = 'input[name="password"]'
 LOGIN_BUTTON = 'button[type="submit"]'
+
+# Page state indicators for LoginPage.detect_state(); leave empty if not applicable.
+# With LOGGED_IN_INDICATOR set, is_logged_in() returns as soon as either state shows.
+LOGGED_IN_INDICATOR = ""
+LOGIN_ERROR = ""
+CAPTCHA = ""
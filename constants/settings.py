@@ -1,68 +1,292 @@
+"""Application settings: an immutable snapshot of config.ini and the environment."""
+
 import configparser
+import dataclasses
 import os
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Mapping, Optional, Tuple
+
+from utils.exceptions import ConfigurationError
+
+# Searched in order when no config file is given
+CONFIG_PATHS = (Path("config.ini"), Path("config/config.ini"))
+
+BOOLEAN_STATES = configparser.ConfigParser.BOOLEAN_STATES
+
+
+def setting(
+    default: Any,
+    key: str,
+    env: Optional[str] = None,
+    lower: bool = False,
+    minimum: Optional[float] = None,
+    choices: Optional[Tuple[str, ...]] = None,
+    secret: bool = False,
+) -> Any:
+    """
+    Declare a settings field.
+
+    Args:
+        default: Value when neither the environment nor config.ini sets it
+        key: Key in the [Settings] section of config.ini
+        env: Environment variable that takes precedence over the config key
+        lower: Lowercase the value
+        minimum: Smallest accepted value (numbers)
+        choices: Accepted values (strings)
+        secret: Leave the value out of repr()
+    """
+    metadata = {"key": key, "env": env, "lower": lower, "minimum": minimum, "choices": choices}
+    return field(default=default, repr=not secret, metadata=metadata)
 
 
+def _split_list(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated config value into non-empty items."""
+    return tuple(part.strip() for part in value.split(",") if part.strip())
+
+
+def _coerce(spec: dataclasses.Field, raw: str) -> Any:
+    """Convert a raw config or environment string to the field's type."""
+    kind = spec.type
+    if kind is bool:
+        try:
+            return BOOLEAN_STATES[raw.lower()]
+        except KeyError:
+            raise ValueError("expected a boolean such as true/false, yes/no, on/off or 1/0")
+    if kind is int:
+        return int(raw)
+    if kind is float:
+        return float(raw)
+    if kind == Tuple[str, ...]:
+        return _split_list(raw)
+    return raw.lower() if spec.metadata.get("lower") else raw
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Singleton settings class for application configuration."""
+    """
+    Immutable, validated application settings.
+
+    Settings.load() parses and type-checks every value once (environment
+    variables take precedence over config.ini, which takes precedence over
+    the defaults below), so reading a setting is a plain attribute access.
+    Invalid values raise ConfigurationError at load time.
+
+    get_settings() returns the process-wide default; with_overrides() derives
+    copies, e.g. per test worker or account. Page objects, facades,
+    controllers and drivers accept a snapshot, so several configurations can
+    run in one process.
+    """
+
+    BASE_URL: str = setting("", "base_url", env="BASE_URL")
+    BROWSER_TYPE: str = setting("chromium", "browser_type")
+    HEADLESS: bool = setting(True, "headless")
+    TIMEOUT: int = setting(30000, "timeout", minimum=0)
+    LOG_LEVEL: str = setting("INFO", "log_level", env="LOG_LEVEL")
+    LOG_QUEUE: bool = setting(False, "log_queue", env="LOG_QUEUE")
+    LOG_FORMAT: str = setting(
+        "text", "log_format", env="LOG_FORMAT", lower=True, choices=("text", "json")
+    )
+    SCREENSHOT_DIR: str = setting("screenshots", "screenshot_dir")
+    SCREENSHOT_TYPE: str = setting("png", "screenshot_type", lower=True, choices=("png", "jpeg"))
+    SCREENSHOT_QUALITY: int = setting(80, "screenshot_quality", minimum=0)
+    SCREENSHOT_FULL_PAGE: bool = setting(False, "screenshot_full_page")
+    SCREENSHOT_MIN_INTERVAL: float = setting(30.0, "screenshot_min_interval", minimum=0)
+    SCREENSHOT_MAX_MB: int = setting(200, "screenshot_max_mb", minimum=0)
+    REPORT_DIR: str = setting("reports", "report_dir")
+    ENGINE: str = setting("sync", "engine", env="ENGINE", lower=True, choices=("sync", "async"))
+    BROWSER_ENDPOINT: Optional[str] = setting(None, "browser_endpoint", env="BROWSER_ENDPOINT")
+    CONCURRENCY: int = setting(1, "concurrency", env="CONCURRENCY", minimum=1)
+    SHARDS: int = setting(1, "shards", env="SHARDS", minimum=1)
+    BLOCK_PRESET: str = setting(
+        "none",
+        "block_preset",
+        env="BLOCK_PRESET",
+        lower=True,
+        choices=("none", "lean", "aggressive"),
+    )
+    BLOCK_RESOURCE_TYPES: Tuple[str, ...] = setting((), "block_resource_types")
+    BLOCK_DOMAINS: Tuple[str, ...] = setting((), "block_domains")
+    FEED_STREAM: bool = setting(False, "feed_stream")
+    RESUME: bool = setting(True, "resume", env="RESUME")
+    ACTION_TIMINGS: bool = setting(True, "action_timings")
+    PERF_METRICS: bool = setting(False, "perf_metrics")
+    HTTP_FAST_PATH: bool = setting(False, "http_fast_path")
+    RESULT_SINK: str = setting(
+        "jsonl",
+        "result_sink",
+        env="RESULT_SINK",
+        lower=True,
+        choices=("none", "jsonl", "csv", "sqlite"),
+    )
+    SINK_BATCH_SIZE: int = setting(500, "sink_batch_size", minimum=1)
+    SINK_FLUSH_INTERVAL: float = setting(2.0, "sink_flush_interval", minimum=0)
+    SESSION_CACHE: bool = setting(True, "session_cache")
+    SESSION_DIR: str = setting(".sessions", "session_dir")
+    SESSION_MAX_AGE: int = setting(86400, "session_max_age", minimum=0)
+    ASSET_CACHE: bool = setting(False, "asset_cache")
+    ASSET_CACHE_DIR: str = setting(".asset_cache", "asset_cache_dir")
+    ASSET_CACHE_MAX_MB: int = setting(256, "asset_cache_max_mb", minimum=0)
+    USERNAME: Optional[str] = setting(None, "username", env="APP_USERNAME")
+    PASSWORD: Optional[str] = setting(None, "password", env="APP_PASSWORD", secret=True)
+    ACCOUNTS_FILE: Optional[str] = setting(None, "accounts_file", env="ACCOUNTS_FILE")
+
+    # Config file the snapshot was loaded from (None = environment and defaults only)
+    config_path: Optional[Path] = field(default=None, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.BASE_URL:
+            raise ConfigurationError(
+                "Base URL must be provided via the BASE_URL environment variable or config.ini"
+            )
+
+        for spec in dataclasses.fields(self):
+            value = getattr(self, spec.name)
+            choices = spec.metadata.get("choices")
+            if choices and value not in choices:
+                raise ConfigurationError(
+                    f"Invalid {spec.metadata['key']} '{value}', expected one of {list(choices)}"
+                )
+            minimum = spec.metadata.get("minimum")
+            if minimum is not None and value < minimum:
+                raise ConfigurationError(
+                    f"Invalid {spec.metadata['key']} {value}, must be at least {minimum}"
+                )
+
+    @classmethod
+    def load(
+        cls,
+        config_path: Optional[Path] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        **overrides: Any,
+    ) -> "Settings":
+        """
+        Parse config.ini and the environment into a validated snapshot.
+
+        Args:
+            config_path: Config file (default: config.ini or config/config.ini, if present)
+            environ: Environment variables (default: os.environ)
+            **overrides: Field values that take precedence over both (e.g. TIMEOUT=5000)
+
+        Returns:
+            Settings snapshot
+
+        Raises:
+            ConfigurationError: If the given config file is missing or a value is invalid
+        """
+        config = configparser.ConfigParser()
+        if config_path is None:
+            config_path = next((path for path in CONFIG_PATHS if path.exists()), None)
+        elif not Path(config_path).exists():
+            raise ConfigurationError(f"Configuration file not found at {config_path}")
+        if config_path is not None:
+            try:
+                config.read(config_path)
+            except configparser.Error as e:
+                raise ConfigurationError(f"Invalid configuration file {config_path}: {e}")
+
+        section = config["Settings"] if config.has_section("Settings") else {}
+        environ = os.environ if environ is None else environ
+
+        values = {}
+        for spec in dataclasses.fields(cls):
+            key = spec.metadata.get("key")
+            if key is None:
+                continue
+            env = spec.metadata.get("env")
+            raw = (environ.get(env) if env else None) or section.get(key)
+            # Empty values ("browser_endpoint =") mean "not set"
+            if raw is None or not raw.strip():
+                continue
+            try:
+                values[spec.name] = _coerce(spec, raw.strip())
+            except ValueError as e:
+                source = env if env and environ.get(env) else key
+                raise ConfigurationError(f"Invalid value for {source}: {raw!r} ({e})")
+
+        values.update(cls._parse_overrides(overrides))
+        return cls(config_path=Path(config_path) if config_path else None, **values)
+
+    @classmethod
+    def _parse_overrides(cls, overrides: Mapping[str, Any]) -> dict:
+        """Check override names and coerce string values like config.ini values."""
+        specs = {spec.name: spec for spec in dataclasses.fields(cls)}
+        changes = {}
+        for name, value in overrides.items():
+            spec = specs.get(name)
+            if spec is None:
+                raise ConfigurationError(f"Unknown setting: {name}")
+            if isinstance(value, str) and "key" in spec.metadata:
+                try:
+                    value = _coerce(spec, value.strip()) if value.strip() else spec.default
+                except ValueError as e:
+                    raise ConfigurationError(f"Invalid value for {name}: {value!r} ({e})")
+            elif isinstance(value, list):
+                value = tuple(value)
+            changes[name] = value
+        return changes
+
+    def with_overrides(self, **overrides: Any) -> "Settings":
+        """
+        Derive a copy with some settings changed.
+
+        String values are parsed like config.ini values, so
+        with_overrides(CONCURRENCY="4") and with_overrides(CONCURRENCY=4) are
+        equivalent. The copy is validated like a loaded snapshot.
 
-    _instance: Optional["Settings"] = None
-    _initialized: bool = False
+        Args:
+            **overrides: Field names (e.g. REPORT_DIR) and their new values
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        Returns:
+            New settings snapshot (self if there are no overrides)
 
-    def __init__(self):
-        if self._initialized:
-            return
+        Raises:
+            ConfigurationError: If a name is unknown or a value is invalid
+        """
+        if not overrides:
+            return self
+        return dataclasses.replace(self, **self._parse_overrides(overrides))
 
-        self.config = configparser.ConfigParser()
-        config_path = Path("config.ini")
-        if not config_path.exists():
-            config_path = Path("config/config.ini")
 
-        if config_path.exists():
-            self.config.read(config_path)
-        else:
-            raise FileNotFoundError(f"Configuration file not found at {config_path}")
+_current: Optional[Settings] = None
+_current_lock = threading.Lock()
 
-        Settings._initialized = True
 
-    @property
-    def BASE_URL(self) -> str:
-        return os.getenv("BASE_URL") or self.config.get("Settings", "base_url")
+def get_settings() -> Settings:
+    """
+    Get the process-wide default settings, loading them on first use.
 
-    @property
-    def BROWSER_TYPE(self) -> str:
-        return self.config.get("Settings", "browser_type", fallback="chromium")
+    Raises:
+        ConfigurationError: If the configuration is invalid
+    """
+    global _current
+    if _current is None:
+        with _current_lock:
+            if _current is None:
+                _current = Settings.load()
+    return _current
 
-    @property
-    def HEADLESS(self) -> bool:
-        return self.config.getboolean("Settings", "headless", fallback=True)
 
-    @property
-    def TIMEOUT(self) -> int:
-        return self.config.getint("Settings", "timeout", fallback=30000)
+def reload_settings(**overrides: Any) -> Settings:
+    """
+    Re-read config.ini and the environment and make the result the process-wide default.
 
-    @property
-    def LOG_LEVEL(self) -> str:
-        return os.getenv("LOG_LEVEL") or self.config.get("Settings", "log_level", fallback="INFO")
+    Objects already holding a snapshot keep it; only later get_settings()
+    calls see the new values.
 
-    @property
-    def SCREENSHOT_DIR(self) -> str:
-        return self.config.get("Settings", "screenshot_dir", fallback="screenshots")
+    Args:
+        **overrides: Field values that take precedence over the loaded ones
 
-    @property
-    def REPORT_DIR(self) -> str:
-        return self.config.get("Settings", "report_dir", fallback="reports")
+    Returns:
+        The new default settings
+    """
+    return set_settings(Settings.load(**overrides))
 
-    @property
-    def USERNAME(self) -> Optional[str]:
-        return os.getenv("APP_USERNAME") or self.config.get("Settings", "username", fallback=None)
 
-    @property
-    def PASSWORD(self) -> Optional[str]:
-        return os.getenv("APP_PASSWORD") or self.config.get("Settings", "password", fallback=None)
+def set_settings(settings: Settings) -> Settings:
+    """Make a snapshot the process-wide default returned by get_settings()."""
+    global _current
+    with _current_lock:
+        _current = settings
+    return settings
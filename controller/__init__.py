@@ -1,6 +1,51 @@
 """Controller module for automation workflow orchestration."""
 
-from .controller import Controller
-from .facade import Facade
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["Controller", "Facade"]
+if TYPE_CHECKING:
+    from .async_controller import AsyncController
+    from .async_facade import AsyncFacade
+    from .controller import Controller
+    from .facade import Facade
+    from .multi_account import FairScheduler, run_accounts
+    from .run_summary import RunSummary
+    from .worker_pool import TabWorkerPool
+
+# Exported name -> submodule. Submodules are imported on first attribute access,
+# so importing one module of the package does not load all of them (and both
+# Playwright APIs) as a side effect.
+_EXPORTS = {
+    "AsyncController": ".async_controller",
+    "AsyncFacade": ".async_facade",
+    "Controller": ".controller",
+    "Facade": ".facade",
+    "FairScheduler": ".multi_account",
+    "run_accounts": ".multi_account",
+    "RunSummary": ".run_summary",
+    "TabWorkerPool": ".worker_pool",
+}
+
+__all__ = [
+    "Controller",
+    "Facade",
+    "AsyncController",
+    "AsyncFacade",
+    "RunSummary",
+    "TabWorkerPool",
+    "FairScheduler",
+    "run_accounts",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,212 @@
+"""Asyncio controller for orchestrating automation workflow with concurrent pages."""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Page
+
+from constants.settings import Settings, get_settings
+from controller.async_facade import AsyncFacade
+from controller.run_summary import RunSummary
+from utils.exceptions import AutomationError
+from utils.log_context import log_context, new_run_id, run_id_var
+from utils.perf_metrics import write_perf_report
+from utils.result_sinks import open_result_writer
+from utils.screenshots import get_screenshot_service
+from utils.timing import TIMINGS, write_timings
+
+if TYPE_CHECKING:
+    from controller.multi_account import FairScheduler
+    from driver import AsyncPlaywrightDriver
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncController:
+    """Asyncio controller that keeps several item pages in flight on one event loop."""
+
+    def __init__(
+        self,
+        page: Page,
+        api_key: Optional[str] = None,
+        driver: Optional["AsyncPlaywrightDriver"] = None,
+        concurrency: Optional[int] = None,
+        settings: Optional[Settings] = None,
+        scheduler: Optional["FairScheduler"] = None,
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            page: Async Playwright page object used for login and feed collection
+            api_key: Optional API key for external services
+            driver: Driver used to open worker pages (default: page.context)
+            concurrency: Number of item pages in flight (default: from settings)
+            settings: Settings snapshot (default: get_settings())
+            scheduler: Slots shared with other controllers; each item waits for one
+        """
+        logger.debug("Initializing AsyncController")
+        self.page = page
+        self.api_key = api_key
+        self.driver = driver
+        self.settings = settings or get_settings()
+        self.concurrency = concurrency or self.settings.CONCURRENCY
+        self.scheduler = scheduler
+        self.facade = AsyncFacade(page, self.settings)
+
+    async def run(
+        self, username: Optional[str] = None, password: Optional[str] = None
+    ) -> RunSummary:
+        """
+        Execute the main automation workflow.
+
+        Args:
+            username: Login username
+            password: Login password
+
+        Returns:
+            Summary of the item-processing phase
+
+        Raises:
+            AutomationError: If workflow fails
+        """
+        run_token = run_id_var.set(new_run_id())
+        writer = open_result_writer(self.settings)
+        TIMINGS.enabled = self.settings.ACTION_TIMINGS
+        TIMINGS.reset()
+        try:
+            logger.info("Starting async automation workflow")
+
+            # Steps 1-2: Login and collect items
+            items = await self.login_and_collect(username, password)
+
+            # Step 3: Process items concurrently
+            summary = await self.process_items(
+                items,
+                on_result=(lambda _, details: writer.write_async(details)) if writer else None,
+            )
+
+            logger.info("Async automation workflow completed successfully: %s", summary)
+            return summary
+
+        except Exception as e:
+            logger.error(f"Async automation workflow failed: {e}", exc_info=True)
+            raise AutomationError(f"Workflow execution failed: {e}")
+
+        finally:
+            # Joining the writer and writing reports block on disk; keep them off the loop
+            if writer:
+                await asyncio.to_thread(writer.close)
+            await asyncio.to_thread(write_timings, self.settings.REPORT_DIR)
+            await asyncio.to_thread(write_perf_report, self.facade.perf, self.settings.REPORT_DIR)
+            await asyncio.to_thread(get_screenshot_service(self.settings).flush, timeout=10)
+            run_id_var.reset(run_token)
+
+    async def login_and_collect(
+        self, username: Optional[str] = None, password: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Log in and collect the item identifiers to process.
+
+        Args:
+            username: Login username
+            password: Login password
+
+        Returns:
+            Collected item identifiers
+        """
+        await self.facade.login(username, password)
+
+        items = await self.facade.collect_item_ids(filter_func=AsyncFacade.filter_record)
+
+        logger.info("Collected %s items to process", len(items))
+        return items
+
+    async def process_items(
+        self,
+        items: List[Any],
+        on_result: Optional[Callable[[Any, Dict[str, Any]], Optional[Awaitable[None]]]] = None,
+    ) -> RunSummary:
+        """
+        Process items across a pool of worker pages.
+
+        Each worker owns one page and pulls item ids from a shared queue, so at most
+        `concurrency` navigations are in flight. Failures are logged per item and
+        do not stop the other workers. With a scheduler, every item also waits for
+        one of its slots, and worker pages are only opened once they get one.
+
+        Args:
+            items: Item identifiers to process
+            on_result: Optional callback receiving each item's id and details; a
+                returned awaitable (e.g. BatchedResultWriter.write_async) is awaited
+
+        Returns:
+            Run summary with counts and throughput
+        """
+        summary = RunSummary(total=len(items))
+        if not items:
+            return summary
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, item_id in enumerate(items, 1):
+            queue.put_nowait((index, item_id))
+
+        worker_count = min(self.concurrency, len(items))
+        summary.workers = worker_count
+        started = time.perf_counter()
+        pages: List[Page] = []
+        logger.info("Processing %s items with %s concurrent pages", len(items), worker_count)
+
+        async def worker() -> None:
+            page: Optional[Page] = None
+            while True:
+                async with self._slot():
+                    try:
+                        index, item_id = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        if page is None:
+                            page = await self._new_page()
+                            pages.append(page)
+                        logger.info("Processing item %s/%s: %s", index, len(items), item_id)
+                        with log_context(item_id=item_id):
+                            details = await self.facade.item_action(item_id, page=page)
+                        if on_result:
+                            handled = on_result(item_id, details)
+                            if inspect.isawaitable(handled):
+                                await handled
+                        summary.succeeded += 1
+                    except Exception as e:
+                        logger.error(f"Failed to process item {item_id}: {e}")
+                        summary.failed += 1
+                        # Continue with next item
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(worker_count)))
+        finally:
+            for page in pages:
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.debug("Failed to close worker page: %s", e)
+
+        summary.elapsed = time.perf_counter() - started
+        return summary
+
+    def _slot(self) -> contextlib.AbstractAsyncContextManager:
+        """A scheduler slot for one item, or a no-op without a scheduler."""
+        return self.scheduler.slot(self) if self.scheduler else contextlib.nullcontext()
+
+    async def _new_page(self) -> Page:
+        """Open a worker page through the driver or the controller page's context."""
+        if self.driver:
+            return await self.driver.new_page()
+
+        page = await self.page.context.new_page()
+        page.set_default_timeout(self.settings.TIMEOUT)
+        return page
@@ -0,0 +1,267 @@
+"""Asyncio facade for simplifying complex page interactions."""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Locator, Page
+
+from constants.settings import Settings, get_settings
+from controller import filtering
+from pages.async_feed_page import AsyncFeedPage
+from pages.async_item_page import AsyncItemPage
+from pages.async_login_page import AsyncLoginPage
+from utils.exceptions import LoginError
+from utils.item_ids import IdPattern, match_item_id, resolve_item_id
+from utils.perf_metrics import PerfCollector
+from utils.session_cache import SessionCache, apply_storage_state_async
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFacade:
+    """Facade for high-level asyncio automation operations, mirroring Facade."""
+
+    def __init__(self, page: Page, settings: Optional[Settings] = None):
+        """
+        Initialize facade.
+
+        Args:
+            page: Async Playwright page object
+            settings: Settings snapshot (default: get_settings())
+        """
+        logger.debug("Initializing AsyncFacade")
+        self.page = page
+        self.settings = settings or get_settings()
+        self.session_cache = SessionCache.from_settings(self.settings)
+        self.perf = PerfCollector.from_settings(self.settings)
+
+    async def login(self, username: Optional[str] = None, password: Optional[str] = None) -> None:
+        """
+        Perform login operation, reusing an authenticated session when possible.
+
+        See Facade.login.
+
+        Args:
+            username: Login username (uses settings if not provided)
+            password: Login password (uses settings if not provided)
+
+        Raises:
+            LoginError: If credentials missing or login fails
+        """
+        logger.debug("AsyncFacade.login")
+
+        username = username or self.settings.USERNAME
+        password = password or self.settings.PASSWORD
+
+        if not username or not password:
+            raise LoginError("Username and password are required")
+
+        base_url = self.settings.BASE_URL
+        cached_state = self.session_cache.load(base_url, username) if self.session_cache else None
+        if cached_state:
+            await apply_storage_state_async(self.page.context, cached_state)
+
+        login_page = AsyncLoginPage(self.page, self.settings)
+        await login_page.navigate_to(base_url)
+
+        if await login_page.is_logged_in():
+            logger.info("Reusing authenticated session, skipping login form")
+            return
+
+        if cached_state:
+            logger.info("Cached session was rejected, logging in again")
+            self.session_cache.invalidate(base_url, username)
+
+        await login_page.login(username, password)
+
+        if self.session_cache:
+            await self.session_cache.save_async(self.page.context, base_url, username)
+
+    async def collect_items(
+        self,
+        filter_func: Optional[Callable[[Locator], Awaitable[bool]]] = None,
+        extract_func: Optional[Callable[[Page], Awaitable[Any]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Collect and process items from feed.
+
+        Args:
+            filter_func: Optional async function to filter items
+            extract_func: Async function to extract data from items
+            limit: Maximum number of items to collect
+
+        Returns:
+            List of extracted item data
+        """
+        logger.debug("AsyncFacade.collect_items")
+        feed_page = await AsyncFeedPage(
+            self.page, viewed_my_profile=True, settings=self.settings
+        ).open()
+
+        async def process_item(item: Locator) -> Any:
+            """Process individual item with filter and extraction."""
+            if filter_func and not await filter_func(item):
+                logger.debug("Item filtered out")
+                return None
+
+            try:
+                await item.click()
+                await self.page.wait_for_load_state("domcontentloaded")
+            except Exception as e:
+                logger.warning(f"Failed to click item: {e}")
+
+            if extract_func:
+                return await extract_func(self.page)
+
+            return None
+
+        results = await feed_page.iterate_over_items(process_item, limit)
+        return [r for r in results if r is not None]
+
+    async def collect_item_ids(
+        self,
+        filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        id_pattern: Optional[IdPattern] = None,
+    ) -> List[str]:
+        """
+        Collect item ids straight from the feed DOM, clicking only as a fallback.
+
+        See Facade.collect_item_ids.
+
+        Args:
+            filter_func: Optional function to filter item records
+            limit: Maximum number of feed items to consider
+            id_pattern: Regex for ids in hrefs/URLs (default: ITEM_ID_PATTERN)
+
+        Returns:
+            Item ids in feed order
+        """
+        logger.debug("AsyncFacade.collect_item_ids")
+        feed_page = await AsyncFeedPage(
+            self.page, viewed_my_profile=True, settings=self.settings
+        ).open()
+
+        resolved: Dict[int, str] = {}
+        unresolved: List[Dict[str, Any]] = []
+        for record in await feed_page.get_item_records(limit):
+            if filter_func and not filter_func(record):
+                logger.debug("Item filtered out")
+                continue
+
+            item_id = resolve_item_id(record, id_pattern)
+            if item_id:
+                resolved[record["index"]] = item_id
+            else:
+                unresolved.append(record)
+
+        if unresolved:
+            logger.info("Falling back to click-through for %s items", len(unresolved))
+
+        for record in unresolved:
+            try:
+                await feed_page.item_locator(record["index"]).click()
+                await self.page.wait_for_load_state("domcontentloaded")
+                item_id = match_item_id(self.page.url, id_pattern)
+                if item_id:
+                    resolved[record["index"]] = item_id
+                await self.page.go_back(wait_until="domcontentloaded")
+            except Exception as e:
+                logger.warning(f"Failed to resolve id for item {record['index']}: {e}")
+
+        logger.info("Resolved %s item ids from feed", len(resolved))
+        return [resolved[index] for index in sorted(resolved)]
+
+    async def apply_filters(self, filters: Dict[str, Any]) -> None:
+        """
+        Apply search/filter criteria (see controller.filtering.filter_steps).
+
+        Args:
+            filters: Dictionary of filter criteria
+        """
+        logger.debug("AsyncFacade.apply_filters: %s", filters)
+        feed_page = await AsyncFeedPage(
+            self.page, viewed_my_profile=True, settings=self.settings
+        ).open()
+
+        for method, value in filtering.filter_steps(filters):
+            await getattr(feed_page, method)(value)
+
+    async def item_action(self, item_id: str, page: Optional[Page] = None) -> Dict[str, Any]:
+        """
+        Navigate to an item and perform action on it.
+
+        Each concurrent worker passes its own page, so item navigations overlap
+        instead of queueing behind the facade's main page. With http_fast_path
+        enabled, server-rendered details are read without navigating at all.
+
+        Args:
+            item_id: Item identifier
+            page: Page to use (default: the facade's page)
+
+        Returns:
+            Extracted item details, with the page load's metrics under "perf"
+            when perf_metrics is enabled
+        """
+        logger.debug("AsyncFacade.item_action: %s", item_id)
+        item_page = AsyncItemPage(page or self.page, item_id, self.settings)
+
+        if self.settings.HTTP_FAST_PATH:
+            item_details = await item_page.get_info_http()
+            if item_details is not None:
+                logger.info("Item details (http): %s", item_details)
+                return item_details
+
+        try:
+            await item_page.navigate_to_item(item_id)
+            item_details = await item_page.get_info()
+            logger.info("Item details: %s", item_details)
+
+            if self.perf:
+                item_details["perf"] = await self.perf.collect_async(item_page.page, item_id)
+
+            # Perform action based on item details
+            # await item_page.perform_action()
+
+            return item_details
+
+        except Exception as e:
+            logger.error(f"Failed to perform action on item {item_id}: {e}")
+            raise
+
+    @staticmethod
+    async def filter_item(item: Locator, filter_description: Optional[str] = None) -> bool:
+        """
+        Filter item based on criteria.
+
+        Args:
+            item: Item locator
+            filter_description: Optional filter description
+
+        Returns:
+            True if item passes filter, False otherwise
+        """
+        logger.debug("Applying item filter")
+        return True
+
+    # Implemented in controller.filtering, shared with Facade
+    filter_record = staticmethod(filtering.filter_record)
+
+    @staticmethod
+    async def extract_id(page: Page) -> Optional[str]:
+        """
+        Extract item ID from current page.
+
+        Args:
+            page: Async Playwright page object
+
+        Returns:
+            Extracted item ID or None
+
+        Matches ITEM_ID_PATTERN against the URL by default.
+        """
+        url = page.url
+        logger.debug("Extracting ID from URL: %s", url)
+
+        return match_item_id(url)
@@ -1,12 +1,26 @@
 """Main controller for orchestrating automation workflow."""
 
 import logging
-from typing import Optional
+import time
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sized
 
 from playwright.sync_api import Page
 
+from constants.settings import Settings, get_settings
 from controller.facade import Facade
+from controller.run_journal import JournalState, RunJournal
+from controller.run_summary import RunSummary
+from controller.worker_pool import TabWorkerPool
 from utils.exceptions import AutomationError
+from utils.log_context import log_context, new_run_id, run_id_var
+from utils.perf_metrics import write_perf_report
+from utils.result_sinks import open_result_writer
+from utils.screenshots import get_screenshot_service
+from utils.timing import TIMINGS, write_timings
+
+if TYPE_CHECKING:
+    from driver import PlaywrightDriver
 
 logger = logging.getLogger(__name__)
 
@@ -14,55 +28,220 @@ logger = logging.getLogger(__name__)
 class Controller:
     """Main controller for managing automation flow."""
 
-    def __init__(self, page: Page, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        page: Page,
+        api_key: Optional[str] = None,
+        driver: Optional["PlaywrightDriver"] = None,
+        concurrency: Optional[int] = None,
+        settings: Optional[Settings] = None,
+    ):
         """
         Initialize controller.
 
         Args:
             page: Playwright page object
             api_key: Optional API key for external services
+            driver: Driver used to open worker tabs (default: page.context)
+            concurrency: Number of worker tabs for item processing (default: from settings)
+            settings: Settings snapshot (default: get_settings())
         """
         logger.debug("Initializing Controller")
         self.page = page
         self.api_key = api_key
-        self.facade = Facade(page)
-
-    def run(self, username: Optional[str] = None, password: Optional[str] = None) -> None:
+        self.driver = driver
+        self.settings = settings or get_settings()
+        self.concurrency = concurrency or self.settings.CONCURRENCY
+        self.facade = Facade(page, self.settings)
+
+    def run(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        resume: Optional[bool] = None,
+    ) -> RunSummary:
         """
         Execute the main automation workflow.
 
+        Item details are streamed to the configured result sink and progress
+        is journaled, both in REPORT_DIR. If a previous run for the same site
+        and user was interrupted, feed collection is skipped and only its
+        unfinished items are processed. Page action timings (and, if enabled,
+        page load metrics) for the run are written to REPORT_DIR at the end.
+
         Args:
             username: Login username
             password: Login password
+            resume: Resume an interrupted run (default: from settings)
+
+        Returns:
+            Summary of the item-processing phase
 
         Raises:
             AutomationError: If workflow fails
         """
+        run_token = run_id_var.set(new_run_id())
+        journal = RunJournal.for_run(self.settings, username)
+        writer = open_result_writer(self.settings)
+        TIMINGS.enabled = self.settings.ACTION_TIMINGS
+        TIMINGS.reset()
+
+        def on_result(item_id: Any, details: Dict[str, Any]) -> None:
+            if writer:
+                # Journal the item once its result is in the sink, not just queued
+                writer.write(details, on_written=lambda: journal.mark_done(item_id))
+            else:
+                journal.mark_done(item_id)
+
         try:
             logger.info("Starting automation workflow")
 
-            # Step 1: Login
-            self.facade.login(username, password)
-
-            # Step 2: Collect items
-            items = self.facade.collect_items(
-                filter_func=Facade.filter_item, extract_func=Facade.extract_id, limit=None
-            )
-
-            logger.info(f"Collected {len(items)} items to process")
+            # Steps 1-2: Login and collect items (or resume/stream them)
+            items = self._journaled_items(journal, username, password, resume)
 
             # Step 3: Process each item
-            for index, item_id in enumerate(items, 1):
-                try:
-                    logger.info(f"Processing item {index}/{len(items)}: {item_id}")
-                    self.facade.item_action(item_id)
-                except Exception as e:
-                    logger.error(f"Failed to process item {item_id}: {e}")
-                    # Continue with next item
-                    continue
-
-            logger.info("Automation workflow completed successfully")
+            summary = self.process_items(items, on_result=on_result, on_failure=journal.mark_failed)
+            # Store (and journal) queued results first. After item failures (e.g. the
+            # browser died mid-run) or a sink failure the run stays resumable, so the
+            # next run retries the failed and unstored items instead of starting over
+            if writer:
+                writer.close()
+            if not summary.failed and not (writer and writer.error):
+                journal.finish()
+
+            logger.info("Automation workflow completed successfully: %s", summary)
+            return summary
 
         except Exception as e:
             logger.error(f"Automation workflow failed: {e}", exc_info=True)
             raise AutomationError(f"Workflow execution failed: {e}")
+
+        finally:
+            if writer:
+                writer.close()
+            journal.close()
+            write_timings(self.settings.REPORT_DIR)
+            write_perf_report(self.facade.perf, self.settings.REPORT_DIR)
+            get_screenshot_service(self.settings).flush(timeout=10)
+            run_id_var.reset(run_token)
+
+    def login_and_collect(
+        self, username: Optional[str] = None, password: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Log in and collect the item identifiers to process.
+
+        Args:
+            username: Login username
+            password: Login password
+
+        Returns:
+            Collected item identifiers
+        """
+        self.facade.login(username, password)
+
+        items = self.facade.collect_item_ids(filter_func=Facade.filter_record, limit=None)
+
+        logger.info("Collected %s items to process", len(items))
+        return items
+
+    def process_items(
+        self,
+        items: Iterable[Any],
+        on_result: Optional[Callable[[Any, Dict[str, Any]], None]] = None,
+        on_failure: Optional[Callable[[Any, Exception], None]] = None,
+    ) -> RunSummary:
+        """
+        Process collected items, serially or on a pool of worker tabs.
+
+        With concurrency 1 every item of a list runs on the controller's page;
+        otherwise items are distributed over `concurrency` tabs by
+        TabWorkerPool. Streamed items (iterators, e.g. Facade.stream_item_ids)
+        always go to worker tabs, since the stream keeps reading the feed on the
+        controller's page and must not be navigated away from it.
+
+        Args:
+            items: Item identifiers to process (sequence or iterator)
+            on_result: Optional callback receiving each item's id and details
+            on_failure: Optional callback receiving each failed item's id and error
+
+        Returns:
+            Run summary with counts and throughput
+        """
+        total = len(items) if isinstance(items, Sized) else None
+        if total is None or (self.concurrency > 1 and total > 1):
+            pages = [
+                self._new_page() for _ in range(min(self.concurrency, total or self.concurrency))
+            ]
+            try:
+                return TabWorkerPool(self.facade, pages).process(items, on_result, on_failure)
+            finally:
+                for page in pages:
+                    try:
+                        page.close()
+                    except Exception as e:
+                        logger.debug("Failed to close worker tab: %s", e)
+
+        summary = RunSummary()
+        started = time.perf_counter()
+        for index, item_id in enumerate(items, 1):
+            summary.total += 1
+            try:
+                logger.info("Processing item %s/%s: %s", index, total or "?", item_id)
+                with log_context(item_id=item_id):
+                    details = self.facade.item_action(item_id)
+                # Counted once the result is handed off; a failing callback fails the item
+                if on_result:
+                    on_result(item_id, details)
+                summary.succeeded += 1
+            except Exception as e:
+                logger.error(f"Failed to process item {item_id}: {e}")
+                summary.failed += 1
+                if on_failure:
+                    on_failure(item_id, e)
+                # Continue with next item
+                continue
+
+        summary.elapsed = time.perf_counter() - started
+        return summary
+
+    def _journaled_items(
+        self,
+        journal: RunJournal,
+        username: Optional[str],
+        password: Optional[str],
+        resume: Optional[bool],
+    ) -> Iterable[Any]:
+        """Log in and get the items to process, resuming from the journal when possible."""
+        resume = self.settings.RESUME if resume is None else resume
+        state = journal.load() if resume else JournalState()
+
+        if state.resumable:
+            logger.info(
+                f"Resuming interrupted run: {len(state.pending)} of {len(state.items)} items left"
+            )
+            self.facade.login(username, password)
+            if not state.streaming:
+                return state.pending
+
+            # Finish known items, then keep streaming the feed past them
+            stream = self.facade.stream_item_ids(filter_func=Facade.filter_record)
+            return chain(state.pending, journal.track(stream, skip=state.items))
+
+        if self.settings.FEED_STREAM:
+            self.facade.login(username, password)
+            journal.start(streaming=True)
+            return journal.track(self.facade.stream_item_ids(filter_func=Facade.filter_record))
+
+        items = self.login_and_collect(username, password)
+        journal.start(items)
+        return items
+
+    def _new_page(self) -> Page:
+        """Open a worker tab through the driver or the controller page's context."""
+        if self.driver:
+            return self.driver.new_page()
+
+        page = self.page.context.new_page()
+        page.set_default_timeout(self.settings.TIMEOUT)
+        return page
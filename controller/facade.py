@@ -1,15 +1,19 @@
 """Facade pattern for simplifying complex page interactions."""
 
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from playwright.sync_api import Locator, Page
 
-from constants.settings import Settings
-from pages.feed_page import FeedPage
+from constants.settings import Settings, get_settings
+from controller import filtering
 from pages.item_page import ItemPage
 from pages.login_page import LoginPage
+from pages.page_router import PageRouter
 from utils.exceptions import LoginError
+from utils.item_ids import IdPattern, match_item_id, resolve_item_id
+from utils.perf_metrics import PerfCollector
+from utils.session_cache import SessionCache, apply_storage_state
 
 logger = logging.getLogger(__name__)
 
@@ -17,20 +21,29 @@ logger = logging.getLogger(__name__)
 class Facade:
     """Facade for high-level automation operations."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, settings: Optional[Settings] = None):
         """
         Initialize facade.
 
         Args:
             page: Playwright page object
+            settings: Settings snapshot (default: get_settings())
         """
         logger.debug("Initializing Facade")
         self.page = page
-        self.settings = Settings()
+        self.settings = settings or get_settings()
+        self.session_cache = SessionCache.from_settings(self.settings)
+        self.router = PageRouter(page, self.settings)
+        self.perf = PerfCollector.from_settings(self.settings)
 
     def login(self, username: Optional[str] = None, password: Optional[str] = None) -> None:
         """
-        Perform login operation.
+        Perform login operation, reusing an authenticated session when possible.
+
+        A cached storage state for BASE_URL and the user is restored into the
+        page's context first. If the site then shows the user as logged in
+        (from the cache or the persistent profile), the form is skipped;
+        otherwise a full login runs and its state is cached.
 
         Args:
             username: Login username (uses settings if not provided)
@@ -48,10 +61,27 @@ class Facade:
         if not username or not password:
             raise LoginError("Username and password are required")
 
-        login_page = LoginPage(self.page)
-        login_page.navigate_to(self.settings.BASE_URL)
+        base_url = self.settings.BASE_URL
+        cached_state = self.session_cache.load(base_url, username) if self.session_cache else None
+        if cached_state:
+            apply_storage_state(self.page.context, cached_state)
+
+        login_page = LoginPage(self.page, self.settings)
+        login_page.navigate_to(base_url)
+
+        if login_page.is_logged_in():
+            logger.info("Reusing authenticated session, skipping login form")
+            return
+
+        if cached_state:
+            logger.info("Cached session was rejected, logging in again")
+            self.session_cache.invalidate(base_url, username)
+
         login_page.login(username, password)
 
+        if self.session_cache:
+            self.session_cache.save(self.page.context, base_url, username)
+
     def collect_items(
         self,
         filter_func: Optional[Callable[[Locator], bool]] = None,
@@ -70,7 +100,7 @@ class Facade:
             List of extracted item data
         """
         logger.debug("Facade.collect_items")
-        feed_page = FeedPage(self.page, viewed_my_profile=True)
+        feed_page = self.router.feed(viewed_my_profile=True)
 
         def process_item(item: Locator) -> Any:
             """Process individual item with filter and extraction."""
@@ -86,51 +116,191 @@ class Facade:
             except Exception as e:
                 logger.warning(f"Failed to click item: {e}")
 
-            # Extract data if function provided
-            if extract_func:
-                return extract_func(self.page)
+            try:
+                # Extract data if function provided
+                if extract_func:
+                    return extract_func(self.page)
 
-            return None
+                return None
+            finally:
+                # Item locators are resolved against the feed, so return to it
+                self.router.back_to_feed()
 
         results = feed_page.iterate_over_items(process_item, limit)
         # Filter out None values from filtered items
         return [r for r in results if r is not None]
 
+    def collect_item_ids(
+        self,
+        filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        id_pattern: Optional[IdPattern] = None,
+    ) -> List[str]:
+        """
+        Collect item ids straight from the feed DOM.
+
+        Ids are resolved from each item's data attributes or link href in a
+        single bulk extraction. Only items whose id cannot be resolved are
+        clicked; the page then goes back to the feed for the next one.
+
+        Args:
+            filter_func: Optional function to filter item records
+            limit: Maximum number of feed items to consider
+            id_pattern: Regex for ids in hrefs/URLs (default: ITEM_ID_PATTERN)
+
+        Returns:
+            Item ids in feed order
+        """
+        logger.debug("Facade.collect_item_ids")
+        feed_page = self.router.feed(viewed_my_profile=True)
+
+        resolved: Dict[int, str] = {}
+        unresolved: List[Dict[str, Any]] = []
+        for record in feed_page.get_item_records(limit):
+            if filter_func and not filter_func(record):
+                logger.debug("Item filtered out")
+                continue
+
+            item_id = resolve_item_id(record, id_pattern)
+            if item_id:
+                resolved[record["index"]] = item_id
+            else:
+                unresolved.append(record)
+
+        if unresolved:
+            logger.info("Falling back to click-through for %s items", len(unresolved))
+
+        for record in unresolved:
+            try:
+                feed_page.item_locator(record["index"]).click()
+                self.page.wait_for_load_state("domcontentloaded")
+                item_id = match_item_id(self.page.url, id_pattern)
+                if item_id:
+                    resolved[record["index"]] = item_id
+            except Exception as e:
+                logger.warning(f"Failed to resolve id for item {record['index']}: {e}")
+            finally:
+                # Start every fallback from the feed, even after a failed click
+                try:
+                    self.router.back_to_feed()
+                except Exception as e:
+                    logger.warning(f"Failed to return to feed: {e}")
+
+        logger.info("Resolved %s item ids from feed", len(resolved))
+        return [resolved[index] for index in sorted(resolved)]
+
+    def stream_item_ids(
+        self,
+        filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        id_pattern: Optional[IdPattern] = None,
+    ) -> Iterator[str]:
+        """
+        Lazily yield item ids while scrolling/paginating the feed.
+
+        Unlike collect_item_ids there is no click-through fallback, since
+        leaving the feed would lose the scroll position; items without a
+        resolvable id are skipped.
+
+        Args:
+            filter_func: Optional function to filter item records
+            limit: Maximum number of feed items to yield
+            id_pattern: Regex for ids in hrefs (default: ITEM_ID_PATTERN)
+
+        Yields:
+            Item ids in feed order
+        """
+        logger.debug("Facade.stream_item_ids")
+        feed_page = self.router.feed(viewed_my_profile=True)
+
+        for record in feed_page.stream_items(limit=limit, id_pattern=id_pattern):
+            if filter_func and not filter_func(record):
+                logger.debug("Item filtered out")
+                continue
+
+            if record["item_id"]:
+                yield record["item_id"]
+            else:
+                logger.warning(f"Skipping feed item without resolvable id: {record['href']}")
+
     def apply_filters(self, filters: Dict[str, Any]) -> None:
         """
         Apply search/filter criteria.
 
+        Opens the feed and calls the feed page methods listed by filter_steps.
+
         Args:
             filters: Dictionary of filter criteria
+        """
+        logger.debug("Facade.apply_filters: %s", filters)
+        feed_page = self.router.feed(viewed_my_profile=True)
+
+        for method, value in self.filter_steps(filters):
+            getattr(feed_page, method)(value)
+
+    # Implemented in controller.filtering, shared with AsyncFacade
+    filter_steps = staticmethod(filtering.filter_steps)
 
-        TODO: Implement filter application based on your site's specific filters.
-        Example:
-            if 'min_age' in filters:
-                feed_page.set_age_filter(filters['min_age'])
+    def fetch_item_info(self, item_id: str) -> Optional[Dict[str, Any]]:
         """
-        logger.debug(f"Facade.apply_filters: {filters}")
-        FeedPage(self.page, viewed_my_profile=True)
+        Get item details over HTTP without a page load, if enabled and possible.
 
-        # TODO: Implement your site-specific filter logic here
-        pass
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            Item details, or None when the browser is needed
+        """
+        if not self.settings.HTTP_FAST_PATH:
+            return None
+
+        item_details = ItemPage(self.page, item_id, self.settings).get_info_http()
+        if item_details is not None:
+            logger.info("Item details (http): %s", item_details)
+        return item_details
 
-    def item_action(self, item_id: str) -> None:
+    def item_action(
+        self, item_id: str, page: Optional[Page] = None, use_http: bool = True
+    ) -> Dict[str, Any]:
         """
         Perform action on specific item.
 
+        With http_fast_path enabled, details are first fetched without
+        rendering (see fetch_item_info); the browser page is only used when
+        that is not possible.
+
         Args:
             item_id: Item identifier
+            page: Page already showing the item (default: the facade's page,
+                navigated to the item unless it is already there)
+            use_http: Try the HTTP fast path first
+
+        Returns:
+            Extracted item details, with the page load's metrics under "perf"
+            when perf_metrics is enabled
         """
-        logger.debug(f"Facade.item_action: {item_id}")
-        item_page = ItemPage(self.page, item_id)
+        logger.debug("Facade.item_action: %s", item_id)
+
+        if use_http:
+            item_details = self.fetch_item_info(item_id)
+            if item_details is not None:
+                return item_details
 
         try:
+            item_page = (
+                ItemPage(page, item_id, self.settings) if page else self.router.item(item_id)
+            )
             item_details = item_page.get_info()
-            logger.info(f"Item details: {item_details}")
+            logger.info("Item details: %s", item_details)
+
+            if self.perf:
+                item_details["perf"] = self.perf.collect(item_page.page, item_id)
 
             # Perform action based on item details
             # item_page.perform_action()
 
+            return item_details
+
         except Exception as e:
             logger.error(f"Failed to perform action on item {item_id}: {e}")
             raise
@@ -152,6 +322,8 @@ class Facade:
         logger.debug("Applying item filter")
         return True
 
+    filter_record = staticmethod(filtering.filter_record)
+
     @staticmethod
     def extract_id(page: Page) -> Optional[str]:
         """
@@ -163,13 +335,11 @@ class Facade:
         Returns:
             Extracted item ID or None
 
-        TODO: Implement ID extraction based on your site's URL pattern or page content.
-        Example:
-            return page.url.split('/')[-1]  # Extract from URL
+        Matches ITEM_ID_PATTERN against the URL by default.
+        Customize for ids that live in page content, e.g.:
             return page.locator('[data-id]').get_attribute('data-id')  # From element
         """
         url = page.url
-        logger.debug(f"Extracting ID from URL: {url}")
+        logger.debug("Extracting ID from URL: %s", url)
 
-        # TODO: Implement your site-specific ID extraction here
-        return None
+        return match_item_id(url)
@@ -0,0 +1,47 @@
+"""Item filtering shared by the sync and async facades."""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def filter_steps(filters: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """
+    Translate filter criteria into feed page method calls.
+
+    Used by Facade and AsyncFacade, whose feed pages have the same methods.
+
+    Args:
+        filters: Dictionary of filter criteria
+
+    Returns:
+        (feed page method name, argument) pairs, in the order to apply them
+
+    TODO: Implement filter application based on your site's specific filters.
+    Example:
+        if 'min_age' in filters:
+            steps.append(("set_age_filter", filters["min_age"]))
+    """
+    steps: List[Tuple[str, Any]] = []
+
+    # TODO: Implement your site-specific filter logic here
+    return steps
+
+
+def filter_record(record: Dict[str, Any], filter_description: Optional[str] = None) -> bool:
+    """
+    Filter an item record (see FeedPage.get_item_records) based on criteria.
+
+    Records are plain data, so the same filter serves both facades.
+
+    Args:
+        record: Item record with text, href and attributes
+        filter_description: Optional filter description
+
+    Returns:
+        True if item passes filter, False otherwise
+    """
+    # Implement filtering logic on record["text"] / record["attributes"]
+    logger.debug("Applying item record filter")
+    return True
@@ -0,0 +1,264 @@
+"""Run several accounts concurrently, each in its own context of one shared browser."""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Deque, Dict, Hashable, List, Optional
+
+from constants.settings import Settings, get_settings
+from controller.async_controller import AsyncController
+from controller.run_summary import RunSummary
+from driver import AsyncPlaywrightDriver
+from utils.exceptions import ConfigurationError
+from utils.log_context import log_context, new_run_id, run_id_var
+from utils.perf_metrics import write_perf_report
+from utils.result_sinks import open_result_writer
+from utils.screenshots import get_screenshot_service
+from utils.timing import TIMINGS, write_timings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Account:
+    """Credentials of one account and the name its result files are tagged with."""
+
+    name: str
+    username: str
+    password: str = field(repr=False)
+
+
+def load_accounts(path: Path) -> List[Account]:
+    """
+    Read accounts from a JSON file.
+
+    The file holds a list of objects with "username" and either "password"
+    or "password_env" (the environment variable holding the password), plus
+    an optional "name" for result files (default: the username with unsafe
+    characters replaced).
+
+    Args:
+        path: Accounts file
+
+    Returns:
+        Accounts in file order
+
+    Raises:
+        ConfigurationError: If the file is missing or malformed, or names repeat
+    """
+    try:
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise ConfigurationError(f"Cannot read accounts file {path}: {e}")
+    if not isinstance(entries, list) or not entries:
+        raise ConfigurationError(f"Accounts file {path} must contain a non-empty JSON list")
+
+    accounts: List[Account] = []
+    for number, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get("username"):
+            raise ConfigurationError(f"Account {number} in {path} has no username")
+        password = entry.get("password")
+        if not password and entry.get("password_env"):
+            password = os.getenv(entry["password_env"])
+        if not password:
+            raise ConfigurationError(f"Account {number} in {path} has no password")
+        name = entry.get("name") or re.sub(r"[^\w.-]+", "_", entry["username"])
+        accounts.append(Account(name=name, username=entry["username"], password=password))
+
+    names = [account.name for account in accounts]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ConfigurationError(f"Duplicate account names in {path}: {duplicates}")
+    return accounts
+
+
+class FairScheduler:
+    """
+    Share a fixed number of slots among many clients, round-robin.
+
+    Clients (e.g. one AsyncController per account) hold a slot per unit of
+    work. When slots are scarce, a freed slot goes to the next client in
+    rotation that is waiting, so an account with thousands of items cannot
+    starve one with a handful, and no account gets more than its turn.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize scheduler.
+
+        Args:
+            limit: Slots that can be held at once
+        """
+        if limit < 1:
+            raise ValueError("FairScheduler requires at least one slot")
+        self.limit = limit
+        self.in_use = 0
+        # Waiting clients in rotation order; a client moves to the back when served
+        self._waiters: Dict[Hashable, Deque[asyncio.Future]] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: Hashable) -> AsyncIterator[None]:
+        """
+        Hold a slot for the duration of the block.
+
+        Args:
+            key: Client the slot is counted against
+        """
+        await self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, key: Hashable) -> None:
+        """Wait for a slot; pair with release()."""
+        if self.in_use < self.limit and not self._waiters:
+            self.in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append(future)
+        self._grant()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled right after being granted a slot: pass it on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot and hand it to the next waiting client."""
+        self.in_use -= 1
+        self._grant()
+
+    def _grant(self) -> None:
+        while self.in_use < self.limit and self._waiters:
+            key = next(iter(self._waiters))
+            waiters = self._waiters.pop(key)
+            future = waiters.popleft()
+            if waiters:
+                self._waiters[key] = waiters
+            if not future.done():
+                self.in_use += 1
+                future.set_result(None)
+
+
+async def run_accounts(
+    accounts: Optional[List[Account]] = None,
+    settings: Optional[Settings] = None,
+    headless: Optional[bool] = None,
+) -> Dict[str, Optional[RunSummary]]:
+    """
+    Run the workflow for several accounts in one browser.
+
+    Every account gets an isolated browser context (own cookies and storage)
+    in a single launched or connected browser, and its own AsyncController
+    with settings derived for its credentials. Logins restore sessions from
+    the session cache. All accounts share CONCURRENCY slots through a
+    FairScheduler, taken in turns for each login/collection and each item.
+    Item details go to a result file per account (items_<name>_*), and page
+    load metrics to perf_<name>_*; action timings cover the whole run.
+
+    Args:
+        accounts: Accounts to run (default: read from ACCOUNTS_FILE)
+        settings: Settings snapshot (default: get_settings())
+        headless: Run browser in headless mode (default: from settings)
+
+    Returns:
+        Item summary per account name; None for accounts whose login or
+        feed collection failed
+
+    Raises:
+        ConfigurationError: If no accounts are given or configured
+    """
+    settings = settings or get_settings()
+    if accounts is None:
+        if not settings.ACCOUNTS_FILE:
+            raise ConfigurationError("No accounts given and accounts_file is not set")
+        accounts = load_accounts(Path(settings.ACCOUNTS_FILE))
+
+    with log_context(run_id=run_id_var.get() or new_run_id()):
+        return await _run_accounts(accounts, settings, headless)
+
+
+async def _run_accounts(
+    accounts: List[Account], settings: Settings, headless: Optional[bool]
+) -> Dict[str, Optional[RunSummary]]:
+    scheduler = FairScheduler(settings.CONCURRENCY)
+    TIMINGS.enabled = settings.ACTION_TIMINGS
+    TIMINGS.reset()
+    started = time.perf_counter()
+    logger.info("Running %s accounts with %s shared slots", len(accounts), settings.CONCURRENCY)
+
+    try:
+        # Every account opens its own context, so the driver needs no default page
+        async with AsyncPlaywrightDriver(
+            headless=headless, settings=settings, persistent=False, default_page=False
+        ) as driver:
+            summaries = await asyncio.gather(
+                *(_run_account(driver, account, settings, scheduler) for account in accounts)
+            )
+    finally:
+        await asyncio.to_thread(write_timings, settings.REPORT_DIR)
+        await asyncio.to_thread(get_screenshot_service(settings).flush, timeout=10)
+
+    results = {account.name: summary for account, summary in zip(accounts, summaries)}
+    merged = RunSummary.merge(summary for summary in summaries if summary)
+    merged.elapsed = time.perf_counter() - started
+    failed_accounts = [name for name, summary in results.items() if summary is None]
+    logger.info("Multi-account run completed: %s", merged)
+    if failed_accounts:
+        logger.error(f"Accounts that failed before processing items: {failed_accounts}")
+    return results
+
+
+async def _run_account(
+    driver: AsyncPlaywrightDriver, account: Account, settings: Settings, scheduler: FairScheduler
+) -> Optional[RunSummary]:
+    """Run one account in its own context; failures are logged, not raised."""
+    account_settings = settings.with_overrides(USERNAME=account.username, PASSWORD=account.password)
+    context = await driver.new_context()
+    writer = None
+    controller = None
+    try:
+        page = await context.new_page()
+        controller = AsyncController(page, settings=account_settings, scheduler=scheduler)
+
+        async with scheduler.slot(controller):
+            items = await controller.login_and_collect()
+        logger.info("Account %s: %s items to process", account.name, len(items))
+
+        writer = open_result_writer(account_settings, name=f"items_{account.name}")
+        summary = await controller.process_items(
+            items, on_result=(lambda _, details: writer.write_async(details)) if writer else None
+        )
+        logger.info("Account %s completed: %s", account.name, summary)
+        return summary
+
+    except Exception as e:
+        logger.error(f"Account {account.name} failed: {e}", exc_info=True)
+        return None
+
+    finally:
+        # Every account shares this loop, so sink and report I/O runs in threads
+        if writer:
+            await asyncio.to_thread(writer.close)
+        if controller:
+            await asyncio.to_thread(
+                write_perf_report,
+                controller.facade.perf,
+                settings.REPORT_DIR,
+                name=f"perf_{account.name}",
+            )
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug("Failed to close context of account %s: %s", account.name, e)
@@ -0,0 +1,179 @@
+"""Durable on-disk journal for checkpointing and resuming item runs."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JournalState:
+    """Progress of a run as reconstructed from its journal."""
+
+    items: List[Any] = field(default_factory=list)
+    done: Set[Any] = field(default_factory=set)
+    failed: Dict[Any, str] = field(default_factory=dict)
+    streaming: bool = False
+    started: bool = False
+    finished: bool = False
+
+    @property
+    def pending(self) -> List[Any]:
+        """Items not yet completed successfully, in collection order (failed ones are retried)."""
+        return [item_id for item_id in self.items if item_id not in self.done]
+
+    @property
+    def resumable(self) -> bool:
+        """Whether an interrupted run left work to resume."""
+        return self.started and not self.finished and (bool(self.pending) or self.streaming)
+
+
+class RunJournal:
+    """
+    Append-only JSON Lines journal of a run's items and their completion.
+
+    Each event is written with a single O_APPEND write, so worker processes
+    can share one journal file, and writes are locked, so a result writer
+    thread can mark items done. A torn last line left by a crash is ignored
+    when loading.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize journal.
+
+        Args:
+            path: Journal file path
+        """
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_run(cls, settings: Any, username: Optional[str] = None) -> "RunJournal":
+        """
+        Get the journal for the configured site and user in REPORT_DIR.
+
+        Args:
+            settings: Settings instance
+            username: Account username (default: from settings)
+
+        Returns:
+            Journal (the file may not exist yet)
+        """
+        username = username or settings.USERNAME or ""
+        key = hashlib.sha256(f"{settings.BASE_URL}\0{username}".encode()).hexdigest()[:12]
+        return cls(Path(settings.REPORT_DIR) / f"journal_{key}.jsonl")
+
+    def load(self) -> JournalState:
+        """
+        Replay the journal file.
+
+        Returns:
+            Reconstructed run state (empty if there is no journal)
+        """
+        state = JournalState()
+        if not self.path.exists():
+            return state
+
+        known: Set[Any] = set()
+        with self.path.open() as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping unreadable journal line {line_number} in {self.path}")
+                    continue
+
+                event = entry.get("event")
+                if event == "start":
+                    state = JournalState(started=True, streaming=entry.get("streaming", False))
+                    state.items = list(entry.get("items", []))
+                    known = set(state.items)
+                elif event == "item" and entry["id"] not in known:
+                    state.items.append(entry["id"])
+                    known.add(entry["id"])
+                elif event == "done":
+                    state.done.add(entry["id"])
+                    state.failed.pop(entry["id"], None)
+                elif event == "failed":
+                    state.failed[entry["id"]] = entry.get("error", "")
+                elif event == "finish":
+                    state.finished = True
+
+        return state
+
+    def start(self, items: Optional[List[Any]] = None, streaming: bool = False) -> None:
+        """
+        Begin a new run, discarding any previous journal.
+
+        Args:
+            items: Collected item ids (omit when streaming)
+            streaming: Items will be recorded one by one as they are discovered
+        """
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+        self._write({"event": "start", "items": list(items or []), "streaming": streaming})
+        self._sync()
+
+    def track(self, items: Iterable[Any], skip: Iterable[Any] = ()) -> Iterator[Any]:
+        """
+        Record streamed items as they are discovered.
+
+        Args:
+            items: Item id iterator
+            skip: Ids already journaled; they are not recorded or yielded again
+
+        Yields:
+            New item ids
+        """
+        seen = set(skip)
+        for item_id in items:
+            if item_id in seen:
+                continue
+            seen.add(item_id)
+            self._write({"event": "item", "id": item_id})
+            yield item_id
+
+    def mark_done(self, item_id: Any, details: Optional[Dict[str, Any]] = None) -> None:
+        """Record an item as completed (signature matches process_items on_result)."""
+        self._write({"event": "done", "id": item_id})
+
+    def mark_failed(self, item_id: Any, error: BaseException) -> None:
+        """Record an item failure (signature matches process_items on_failure)."""
+        self._write({"event": "failed", "id": item_id, "error": str(error)})
+
+    def finish(self) -> None:
+        """Mark the run as completed; the next run starts fresh."""
+        self._write({"event": "finish"})
+        self._sync()
+
+    def close(self) -> None:
+        """Flush the journal to disk and close it."""
+        with self._lock:
+            if self._fd is not None:
+                os.fsync(self._fd)
+                os.close(self._fd)
+                self._fd = None
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """Append one event as a single write."""
+        line = (json.dumps(entry) + "\n").encode()
+        with self._lock:
+            if self._fd is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            os.write(self._fd, line)
+
+    def _sync(self) -> None:
+        """Force written events to stable storage."""
+        with self._lock:
+            if self._fd is not None:
+                os.fsync(self._fd)
@@ -0,0 +1,45 @@
+"""Run summary with item counts and throughput."""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass
+class RunSummary:
+    """Counts and timing for one item-processing run."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    workers: int = 1
+
+    @property
+    def items_per_sec(self) -> float:
+        """Processed items (successful or not) per wall-clock second."""
+        done = self.succeeded + self.failed
+        return done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @classmethod
+    def merge(cls, summaries: Iterable["RunSummary"]) -> "RunSummary":
+        """
+        Combine summaries of runs that executed in parallel.
+
+        Counts and workers are summed; elapsed is the longest run, since the
+        runs overlapped in wall-clock time.
+        """
+        merged = cls(workers=0)
+        for summary in summaries:
+            merged.total += summary.total
+            merged.succeeded += summary.succeeded
+            merged.failed += summary.failed
+            merged.workers += summary.workers
+            merged.elapsed = max(merged.elapsed, summary.elapsed)
+        return merged
+
+    def __str__(self) -> str:
+        return (
+            f"{self.succeeded}/{self.total} items succeeded, {self.failed} failed "
+            f"in {self.elapsed:.1f}s with {self.workers} worker(s) "
+            f"({self.items_per_sec:.2f} items/sec)"
+        )
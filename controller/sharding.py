@@ -0,0 +1,322 @@
+"""Process-pool sharding of item processing across several browser instances."""
+
+import logging
+import multiprocessing
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from constants.settings import Settings, get_settings
+from controller.controller import Controller
+from controller.run_journal import JournalState, RunJournal
+from controller.run_summary import RunSummary
+from driver import PlaywrightDriver
+from logger import configure_application_logging, logging_config
+from utils.log_context import log_context, new_run_id, run_id_var
+from utils.perf_metrics import write_perf_report
+from utils.result_sinks import open_result_writer
+from utils.screenshots import get_screenshot_service
+from utils.timing import TIMINGS, write_timings
+
+logger = logging.getLogger(__name__)
+
+# Chromium lock files that must not be copied into a shard's profile
+PROFILE_LOCK_PATTERNS = ("Singleton*", "lockfile", "*.lock")
+
+
+def split_items(items: List[Any], shards: int) -> List[List[Any]]:
+    """
+    Split items into at most `shards` interleaved slices.
+
+    Striping (items[k::shards]) keeps shards balanced even when item cost
+    drifts along the feed order.
+
+    Args:
+        items: Items to split
+        shards: Number of shards
+
+    Returns:
+        Non-empty item slices
+    """
+    if not items:
+        return []
+
+    shards = max(1, min(shards, len(items)))
+    return [items[k::shards] for k in range(shards)]
+
+
+def copy_profile(source: str, shard_index: int) -> str:
+    """
+    Copy a browser profile for one shard, skipping Chromium lock files.
+
+    Args:
+        source: Source profile directory
+        shard_index: Shard number used to name the copy
+
+    Returns:
+        Path of the shard's profile directory
+    """
+    target = f"{source.rstrip('/')}_shard{shard_index}"
+    if Path(source).exists():
+        shutil.copytree(
+            source,
+            target,
+            ignore=shutil.ignore_patterns(*PROFILE_LOCK_PATTERNS),
+            dirs_exist_ok=True,
+        )
+    else:
+        Path(target).mkdir(parents=True, exist_ok=True)
+    return target
+
+
+def remove_profile(path: str) -> None:
+    """
+    Delete a shard's profile copy (see copy_profile) once its browser has closed.
+
+    Args:
+        path: Profile directory returned by copy_profile
+    """
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove shard profile {path}: {e}")
+
+
+def run_shard(
+    shard_index: int,
+    items: List[Any],
+    user_data_dir: str,
+    headless: Optional[bool] = None,
+    journal_path: Optional[str] = None,
+    storage_state: Optional[Dict[str, Any]] = None,
+    run_id: Optional[str] = None,
+    settings: Optional[Settings] = None,
+    log_config: Optional[Dict[str, Any]] = None,
+) -> Tuple[RunSummary, List[Dict[str, Any]]]:
+    """
+    Process one shard in a worker process with its own browser.
+
+    The shard's profile is a copy of the parent's logged-in profile (or, when
+    connected to a browser server, its context is seeded with the parent's
+    storage state), so no login is performed here. With a result sink
+    configured, the shard writes its own file (items_shard<k>_*) and returns
+    no details. Action timings and page load metrics go to
+    timings_shard<k>_* and perf_shard<k>_* in REPORT_DIR.
+
+    Args:
+        shard_index: Shard number (for logging)
+        items: Item identifiers assigned to this shard
+        user_data_dir: Profile directory owned by this shard
+        headless: Run browser in headless mode (default: from settings)
+        journal_path: Run journal shared with the parent and other shards
+        storage_state: Logged-in state for a browser server context
+        run_id: Id of the parent's run, tagged on the shard's log records
+        settings: The parent's settings snapshot (default: get_settings())
+        log_config: The parent's logging configuration (see logger.logging_config);
+            spawned processes start without handlers, so shard logs are lost without it
+
+    Returns:
+        The shard's run summary and item details not written to a sink
+    """
+    if log_config:
+        configure_application_logging(**log_config)
+
+    with log_context(run_id=run_id):
+        return _run_shard(
+            shard_index,
+            items,
+            user_data_dir,
+            headless,
+            journal_path,
+            storage_state,
+            settings or get_settings(),
+        )
+
+
+def _run_shard(
+    shard_index: int,
+    items: List[Any],
+    user_data_dir: str,
+    headless: Optional[bool],
+    journal_path: Optional[str],
+    storage_state: Optional[Dict[str, Any]],
+    settings: Settings,
+) -> Tuple[RunSummary, List[Dict[str, Any]]]:
+    logger.info(f"Shard {shard_index} starting with {len(items)} items")
+    results: List[Dict[str, Any]] = []
+    journal = RunJournal(Path(journal_path)) if journal_path else None
+    writer = open_result_writer(settings, name=f"items_shard{shard_index}")
+    TIMINGS.enabled = settings.ACTION_TIMINGS
+    perf = None
+
+    def on_result(item_id: Any, details: Dict[str, Any]) -> None:
+        if writer:
+            # Journal the item once its result is in the sink, not just queued
+            writer.write(
+                details, on_written=(lambda: journal.mark_done(item_id)) if journal else None
+            )
+        else:
+            results.append(details)
+            if journal:
+                journal.mark_done(item_id)
+
+    try:
+        with PlaywrightDriver(
+            headless=headless,
+            user_data_dir=user_data_dir,
+            storage_state=storage_state,
+            settings=settings,
+        ) as driver:
+            controller = Controller(driver.page, driver=driver, settings=settings)
+            perf = controller.facade.perf
+            summary = controller.process_items(
+                items, on_result=on_result, on_failure=journal.mark_failed if journal else None
+            )
+    finally:
+        if writer:
+            writer.close()
+        if journal:
+            journal.close()
+        write_timings(settings.REPORT_DIR, name=f"timings_shard{shard_index}")
+        write_perf_report(perf, settings.REPORT_DIR, name=f"perf_shard{shard_index}")
+        get_screenshot_service(settings).close()
+
+    logger.info(f"Shard {shard_index} finished: {summary}")
+    return summary, results
+
+
+def run_sharded(
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    shards: Optional[int] = None,
+    headless: Optional[bool] = None,
+    user_data_dir: Optional[str] = None,
+    settings: Optional[Settings] = None,
+) -> Tuple[RunSummary, List[Dict[str, Any]]]:
+    """
+    Log in and collect items once, then process them across worker processes.
+
+    Each worker process gets its own PlaywrightDriver and its own copy of the
+    browser profile, deleted once the run ends, and logs with the parent's
+    logging configuration. Results and failure counts are merged in the parent.
+    Shards append their progress to the run journal, so an interrupted
+    sharded run resumes with only the unfinished items.
+
+    Args:
+        username: Login username
+        password: Login password
+        shards: Number of worker processes (default: from settings)
+        headless: Run browser in headless mode (default: from settings)
+        user_data_dir: Source browser profile directory (default: .browser_data)
+        settings: Settings snapshot, also handed to the shards (default: get_settings())
+
+    Returns:
+        Merged run summary and item details not written to a sink
+    """
+    with log_context(run_id=run_id_var.get() or new_run_id()):
+        return _run_sharded(
+            username, password, shards, headless, user_data_dir, settings or get_settings()
+        )
+
+
+def _run_sharded(
+    username: Optional[str],
+    password: Optional[str],
+    shards: Optional[int],
+    headless: Optional[bool],
+    user_data_dir: Optional[str],
+    settings: Settings,
+) -> Tuple[RunSummary, List[Dict[str, Any]]]:
+    shards = shards or settings.SHARDS
+    run_id = run_id_var.get()
+    journal = RunJournal.for_run(settings, username)
+    TIMINGS.enabled = settings.ACTION_TIMINGS
+    TIMINGS.reset()
+    state = journal.load() if settings.RESUME else JournalState()
+
+    # Collect in the parent; closing the driver releases the profile for copying
+    with PlaywrightDriver(
+        headless=headless, user_data_dir=user_data_dir, settings=settings
+    ) as driver:
+        controller = Controller(driver.page, driver=driver, settings=settings)
+        if state.resumable and not state.streaming:
+            logger.info(f"Resuming interrupted sharded run with {len(state.pending)} items left")
+            controller.facade.login(username, password)
+            items = state.pending
+        else:
+            items = controller.login_and_collect(username, password)
+            journal.start(items)
+        profile_dir = driver.user_data_dir
+        write_timings(settings.REPORT_DIR, name="timings_collect")
+        # Browser server contexts are not persistent; hand the login over explicitly
+        storage_state = driver.get_storage_state() if driver.is_connected else None
+    journal.close()
+
+    if not items:
+        journal.finish()
+        journal.close()
+        return RunSummary(), []
+
+    slices = split_items(items, shards)
+    logger.info(f"Sharding {len(items)} items across {len(slices)} processes")
+
+    summaries: List[RunSummary] = []
+    results: List[Dict[str, Any]] = []
+    crashed_shards = 0
+    started = time.perf_counter()
+    # Browser server shards share the parent's state; launched ones need a profile copy
+    profiles: List[str] = []
+
+    # Playwright's sync API is not fork-safe, so workers are spawned fresh
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=len(slices), mp_context=context) as executor:
+            futures = {}
+            for k, shard in enumerate(slices):
+                if storage_state:
+                    shard_profile = profile_dir
+                else:
+                    shard_profile = copy_profile(profile_dir, k)
+                    profiles.append(shard_profile)
+                future = executor.submit(
+                    run_shard,
+                    k,
+                    shard,
+                    shard_profile,
+                    headless,
+                    str(journal.path),
+                    storage_state,
+                    run_id,
+                    settings,
+                    logging_config(),
+                )
+                futures[future] = k
+            for future in as_completed(futures):
+                shard_index = futures[future]
+                try:
+                    shard_summary, shard_results = future.result()
+                    summaries.append(shard_summary)
+                    results.extend(shard_results)
+                except Exception as e:
+                    logger.error(f"Shard {shard_index} failed: {e}")
+                    lost = len(slices[shard_index])
+                    summaries.append(RunSummary(total=lost, failed=lost))
+                    crashed_shards += 1
+    finally:
+        # The pool has shut down, so every shard's browser has released its copy
+        for shard_profile in profiles:
+            remove_profile(shard_profile)
+
+    summary = RunSummary.merge(summaries)
+    summary.elapsed = time.perf_counter() - started
+
+    # Failed items and those of a crashed shard stay pending for the next run
+    if not crashed_shards and not summary.failed:
+        journal.finish()
+    journal.close()
+    logger.info(f"Sharded run completed: {summary}")
+    return summary, results
@@ -0,0 +1,128 @@
+"""Multi-tab worker pool for processing items on the sync Playwright API."""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sized, Tuple
+
+from playwright.sync_api import Page
+
+from controller.facade import Facade
+from controller.run_summary import RunSummary
+from pages.item_page import ItemPage
+from utils.log_context import log_context
+
+logger = logging.getLogger(__name__)
+
+
+class TabWorkerPool:
+    """
+    Distribute item processing across several tabs of one browser context.
+
+    The sync API cannot wait on two pages at once, so the pool pipelines instead:
+    every idle tab starts its next item navigation (returning once the response
+    commits), then the oldest in-flight tab is finished. While one tab is being
+    read, the browser keeps loading the others. Items served by the HTTP fast
+    path (Facade.fetch_item_info) never occupy a tab.
+    """
+
+    def __init__(self, facade: Facade, pages: List[Page]):
+        """
+        Initialize worker pool.
+
+        Args:
+            facade: Facade used to run the per-item action
+            pages: Worker tabs; each holds at most one item in flight
+        """
+        if not pages:
+            raise ValueError("TabWorkerPool requires at least one page")
+
+        self.facade = facade
+        self.pages = pages
+
+    def process(
+        self,
+        items: Iterable[Any],
+        on_result: Optional[Callable[[Any, Dict[str, Any]], None]] = None,
+        on_failure: Optional[Callable[[Any, Exception], None]] = None,
+    ) -> RunSummary:
+        """
+        Process items across the worker tabs.
+
+        Items are pulled lazily, so a generator (e.g. Facade.stream_item_ids)
+        keeps producing ids while earlier items load. Failures are logged per
+        item and do not stop the run.
+
+        Args:
+            items: Item identifiers to process (sequence or iterator)
+            on_result: Optional callback receiving each item's id and details
+            on_failure: Optional callback receiving each failed item's id and error
+
+        Returns:
+            Run summary with counts and throughput
+        """
+        total = len(items) if isinstance(items, Sized) else "?"
+        summary = RunSummary(workers=len(self.pages))
+        pending = enumerate(items, 1)
+        exhausted = False
+        idle: Deque[Page] = deque(self.pages)
+        in_flight: Deque[Tuple[Page, int, Any]] = deque()
+        started = time.perf_counter()
+
+        while not exhausted or in_flight:
+            # Start navigations on every idle tab
+            while idle and not exhausted:
+                next_item = next(pending, None)
+                if next_item is None:
+                    exhausted = True
+                    break
+
+                index, item_id = next_item
+                summary.total += 1
+                logger.info("Processing item %s/%s: %s", index, total, item_id)
+
+                page: Optional[Page] = None
+                try:
+                    with log_context(item_id=item_id):
+                        details = self.facade.fetch_item_info(item_id)
+                        if details is None:
+                            page = idle.popleft()
+                            ItemPage(page, item_id, self.facade.settings).navigate_to_item(
+                                item_id, wait_until="commit"
+                            )
+                    if details is None:
+                        in_flight.append((page, index, item_id))
+                        continue
+
+                    if on_result:
+                        on_result(item_id, details)
+                    summary.succeeded += 1
+                except Exception as e:
+                    logger.error(f"Failed to process item {item_id}: {e}")
+                    summary.failed += 1
+                    if on_failure:
+                        on_failure(item_id, e)
+                    if page is not None:
+                        idle.append(page)
+
+            if not in_flight:
+                continue
+
+            # Finish the oldest navigation while the others keep loading
+            page, index, item_id = in_flight.popleft()
+            try:
+                with log_context(item_id=item_id):
+                    ItemPage(page, item_id, self.facade.settings).wait_for_navigation()
+                    details = self.facade.item_action(item_id, page=page, use_http=False)
+                if on_result:
+                    on_result(item_id, details)
+                summary.succeeded += 1
+            except Exception as e:
+                logger.error(f"Failed to process item {item_id}: {e}")
+                summary.failed += 1
+                if on_failure:
+                    on_failure(item_id, e)
+            idle.append(page)
+
+        summary.elapsed = time.perf_counter() - started
+        return summary
@@ -2,19 +2,55 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
-from playwright.sync_api import BrowserContext, Page, Playwright, sync_playwright
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import Playwright as AsyncPlaywright
+from playwright.async_api import async_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 
-from constants.settings import Settings
+from constants.settings import Settings, get_settings
+from utils.asset_cache import AssetCache
+from utils.resource_blocker import ResourceBlocker
 
 logger = logging.getLogger(__name__)
 
+StorageState = Union[str, Dict[str, Any]]
+
+# Default viewport shared by sync and async drivers
+VIEWPORT = {"width": 1920, "height": 1080}
+
+# Performance and stealth optimizations
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--memory-pressure-off",
+    "--no-sandbox",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
 
 class PlaywrightDriver:
     """
     Playwright driver for browser automation.
     Manages browser lifecycle and provides context manager support.
+
+    With a browser endpoint (browser_endpoint setting, see browser_server.py)
+    the driver connects to an already running Chromium over CDP and works in a
+    fresh isolated context instead of launching a persistent one; close()
+    disposes of that context and disconnects, leaving the browser running.
     """
 
     def __init__(
@@ -22,6 +58,9 @@ class PlaywrightDriver:
         headless: Optional[bool] = None,
         timeout: Optional[int] = None,
         user_data_dir: Optional[str] = None,
+        browser_endpoint: Optional[str] = None,
+        storage_state: Optional[StorageState] = None,
+        settings: Optional[Settings] = None,
     ):
         """
         Initialize Playwright driver.
@@ -30,16 +69,25 @@ class PlaywrightDriver:
             headless: Run browser in headless mode (default: from settings)
             timeout: Default timeout in milliseconds (default: from settings)
             user_data_dir: Browser profile directory (default: .browser_data)
+            browser_endpoint: CDP endpoint of a running browser (default: from settings)
+            storage_state: State to seed a connected context with (ignored when launching)
+            settings: Settings snapshot (default: get_settings())
         """
         logger.info("Initializing PlaywrightDriver parameters...")
-        settings = Settings()
+        self.settings = settings = settings or get_settings()
 
         # Use provided values or fall back to settings/defaults
         self.headless = headless if headless is not None else settings.HEADLESS
         self.timeout = timeout if timeout is not None else settings.TIMEOUT
         self.user_data_dir = user_data_dir or str(Path.cwd() / ".browser_data")
+        self.browser_endpoint = browser_endpoint or settings.BROWSER_ENDPOINT
+        self.storage_state = storage_state
+
+        self.asset_cache = AssetCache.from_settings(settings)
+        self.resource_blocker = ResourceBlocker.from_settings(settings)
 
         self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
         self._browser_context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
@@ -60,32 +108,22 @@ class PlaywrightDriver:
         try:
             self._playwright = sync_playwright().start()
 
-            # Create persistent context for session persistence
-            self._browser_context = self._playwright.chromium.launch_persistent_context(
-                user_data_dir=self.user_data_dir,
-                headless=self.headless,
-                ignore_https_errors=True,
-                timeout=self.timeout,
-                viewport={"width": 1920, "height": 1080},
-                # Performance and stealth optimizations
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    "--disable-default-apps",
-                    "--disable-sync",
-                    "--disable-translate",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--memory-pressure-off",
-                    "--no-sandbox",
-                    "--no-first-run",
-                    "--no-default-browser-check",
-                ],
-            )
+            if self.browser_endpoint:
+                self._connect_context()
+            else:
+                # Create persistent context for session persistence
+                self._browser_context = self._playwright.chromium.launch_persistent_context(
+                    user_data_dir=self.user_data_dir,
+                    headless=self.headless,
+                    ignore_https_errors=True,
+                    timeout=self.timeout,
+                    viewport=VIEWPORT,
+                    args=CHROMIUM_ARGS,
+                )
+            # Blocker registered last so it runs first and blocked requests skip the cache
+            if self.asset_cache:
+                self.asset_cache.attach(self._browser_context)
+            self.resource_blocker.attach(self._browser_context)
 
             # Get or create page
             if self._browser_context.pages:
@@ -107,11 +145,20 @@ class PlaywrightDriver:
         logger.info("Closing Playwright browser context and stopping Playwright...")
         try:
             if self._browser_context:
+                self.resource_blocker.log_stats()
+                if self.asset_cache:
+                    self.asset_cache.close()
                 self._browser_context.close()
                 self._browser_context = None
                 self.page = None
                 logger.debug("Browser context closed")
 
+            if self._browser:
+                # For a connected browser this only disconnects; the server keeps running
+                self._browser.close()
+                self._browser = None
+                logger.debug("Disconnected from browser server")
+
             if self._playwright:
                 self._playwright.stop()
                 self._playwright = None
@@ -136,6 +183,232 @@ class PlaywrightDriver:
         page.set_default_timeout(self.timeout)
         return page
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the driver is attached to a browser server rather than its own browser."""
+        return self._browser is not None
+
+    def get_storage_state(self) -> Dict[str, Any]:
+        """
+        Capture cookies and localStorage of the current context.
+
+        Returns:
+            Playwright storage state
+        """
+        if not self._browser_context:
+            raise RuntimeError("Browser context not initialized")
+        return self._browser_context.storage_state()
+
+    def _connect_context(self) -> None:
+        """Connect to the browser server and open a fresh isolated context."""
+        logger.info(f"Connecting to browser server at {self.browser_endpoint}")
+        self._browser = self._playwright.chromium.connect_over_cdp(
+            self.browser_endpoint, timeout=self.timeout
+        )
+        self._browser_context = self._browser.new_context(
+            ignore_https_errors=True, viewport=VIEWPORT, storage_state=self.storage_state
+        )
+
+
+class AsyncPlaywrightDriver:
+    """
+    Asyncio variant of PlaywrightDriver built on playwright.async_api.
+    Use as an async context manager; pages created through new_page() share
+    the context and can be driven concurrently on one event loop. Browser
+    server mode works as in PlaywrightDriver.
+
+    With persistent=False the driver launches a plain browser instead of a
+    persistent profile. Like a connected browser, it can then host further
+    isolated contexts (own cookies and storage) via new_context(), e.g. one
+    per account.
+    """
+
+    def __init__(
+        self,
+        headless: Optional[bool] = None,
+        timeout: Optional[int] = None,
+        user_data_dir: Optional[str] = None,
+        browser_endpoint: Optional[str] = None,
+        storage_state: Optional[StorageState] = None,
+        settings: Optional[Settings] = None,
+        persistent: bool = True,
+        default_page: bool = True,
+    ):
+        """
+        Initialize async Playwright driver parameters.
+
+        The browser is started by initialize_driver() or on entering the
+        async context manager.
+
+        Args:
+            headless: Run browser in headless mode (default: from settings)
+            timeout: Default timeout in milliseconds (default: from settings)
+            user_data_dir: Browser profile directory (default: .browser_data)
+            browser_endpoint: CDP endpoint of a running browser (default: from settings)
+            storage_state: State to seed a connected or non-persistent context with
+                (ignored with a persistent profile)
+            settings: Settings snapshot (default: get_settings())
+            persistent: Launch on the profile in user_data_dir; False launches a
+                plain browser that supports new_context()
+            default_page: Open a context and page on start (driver.page); pass
+                False when only new_context() is used, e.g. one per account, to
+                save the renderer (ignored with a persistent profile)
+        """
+        logger.info("Initializing AsyncPlaywrightDriver parameters...")
+        self.settings = settings = settings or get_settings()
+
+        self.headless = headless if headless is not None else settings.HEADLESS
+        self.timeout = timeout if timeout is not None else settings.TIMEOUT
+        self.user_data_dir = user_data_dir or str(Path.cwd() / ".browser_data")
+        self.browser_endpoint = browser_endpoint or settings.BROWSER_ENDPOINT
+        self.storage_state = storage_state
+        self.persistent = persistent
+        self.default_page = default_page
+
+        self.asset_cache = AssetCache.from_settings(settings)
+        self.resource_blocker = ResourceBlocker.from_settings(settings)
+
+        self._playwright: Optional[AsyncPlaywright] = None
+        self._browser: Optional[AsyncBrowser] = None
+        self._browser_context: Optional[AsyncBrowserContext] = None
+        self.page: Optional[AsyncPage] = None
+
+    async def __aenter__(self) -> "AsyncPlaywrightDriver":
+        """Async context manager entry."""
+        await self.initialize_driver()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit with cleanup."""
+        await self.close()
+
+    async def initialize_driver(self) -> None:
+        """Initialize Playwright, browser context, and page."""
+        logger.info("Initializing async Playwright driver...")
+        try:
+            self._playwright = await async_playwright().start()
+
+            if self.browser_endpoint:
+                logger.info(f"Connecting to browser server at {self.browser_endpoint}")
+                self._browser = await self._playwright.chromium.connect_over_cdp(
+                    self.browser_endpoint, timeout=self.timeout
+                )
+            elif not self.persistent:
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless, timeout=self.timeout, args=CHROMIUM_ARGS
+                )
+            else:
+                self._browser_context = await self._playwright.chromium.launch_persistent_context(
+                    user_data_dir=self.user_data_dir,
+                    headless=self.headless,
+                    ignore_https_errors=True,
+                    timeout=self.timeout,
+                    viewport=VIEWPORT,
+                    args=CHROMIUM_ARGS,
+                )
+                await self._attach_routes(self._browser_context)
+
+            if self._browser and not self.default_page:
+                logger.info("Async Playwright browser initialized without a default page")
+                return
+
+            if self._browser:
+                self._browser_context = await self.new_context(self.storage_state)
+
+            if self._browser_context.pages:
+                self.page = self._browser_context.pages[0]
+            else:
+                self.page = await self._browser_context.new_page()
+
+            self.page.set_default_timeout(self.timeout)
+
+            logger.info("Async Playwright browser and page successfully initialized")
+
+        except Exception as e:
+            logger.error(f"Failed to initialize async Playwright driver: {e}", exc_info=True)
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Close browser context and stop Playwright."""
+        logger.info("Closing async Playwright browser context and stopping Playwright...")
+        try:
+            if self._browser_context or self._browser:
+                self.resource_blocker.log_stats()
+                if self.asset_cache:
+                    self.asset_cache.close()
+
+            if self._browser_context:
+                await self._browser_context.close()
+                self._browser_context = None
+                self.page = None
+                logger.debug("Browser context closed")
+
+            if self._browser:
+                # Closes contexts from new_context(); for a connected browser this only
+                # disconnects and the server keeps running
+                await self._browser.close()
+                self._browser = None
+                logger.debug("Browser closed or disconnected")
+
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+                logger.debug("Playwright stopped")
+
+            logger.info("Async Playwright resources closed successfully")
+
+        except Exception as e:
+            logger.error(f"Error while closing async Playwright resources: {e}", exc_info=True)
+
+    async def new_page(self) -> AsyncPage:
+        """
+        Create a new page in the current context.
+
+        Returns:
+            New page object
+        """
+        if not self._browser_context:
+            raise RuntimeError("Browser context not initialized")
+
+        page = await self._browser_context.new_page()
+        page.set_default_timeout(self.timeout)
+        return page
+
+    async def new_context(
+        self, storage_state: Optional[StorageState] = None
+    ) -> AsyncBrowserContext:
+        """
+        Open an isolated context in the launched or connected browser.
+
+        The context gets the driver's timeout, resource blocking and asset
+        cache. Close it when done; close() closes any that are left.
+
+        Args:
+            storage_state: Cookies and local storage to start with
+
+        Returns:
+            New browser context
+
+        Raises:
+            RuntimeError: With a persistent profile, which has a single context
+        """
+        if not self._browser:
+            raise RuntimeError("Isolated contexts require persistent=False or a browser endpoint")
+
+        context = await self._browser.new_context(
+            ignore_https_errors=True, viewport=VIEWPORT, storage_state=storage_state
+        )
+        context.set_default_timeout(self.timeout)
+        await self._attach_routes(context)
+        return context
+
+    async def _attach_routes(self, context: AsyncBrowserContext) -> None:
+        # Blocker registered last so it runs first and blocked requests skip the cache
+        if self.asset_cache:
+            await self.asset_cache.attach_async(context)
+        await self.resource_blocker.attach_async(context)
+
 
 def initialize_driver(headless: bool = True, user_data_dir: str = "") -> Page:
     """
@@ -1,32 +1,76 @@
 """Logging configuration for the application."""
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from constants.settings import Settings
+from constants.settings import get_settings
+from utils.log_context import CorrelationFilter, JsonFormatter
+
+# Listener thread of the queue mode, stopped on reconfiguration and at exit
+_listener: Optional[QueueListener] = None
+# Arguments of the active configure_application_logging call, for worker processes
+_config: Dict[str, Any] = {}
+
+
+class StructuredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting, tracebacks included, to the listener's handlers.
+
+    The stock prepare() formats the record on the calling thread and folds the
+    traceback into the message, so JsonFormatter would lose its exc_info field.
+    Here only the message is merged with its arguments; the traceback travels
+    as exc_text (the traceback object itself would keep frames alive).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
 
 
 def configure_application_logging(
     log_level: Optional[str] = None,
     log_file: str = "logs/automation.log",
     logging_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    use_queue: Optional[bool] = None,
+    json_format: Optional[bool] = None,
 ) -> None:
     """
     Configure the root logger for the entire application.
 
+    With use_queue the file and console handlers run on a QueueListener
+    thread behind a QueueHandler, so log calls on the browser-driving
+    threads never wait for disk or terminal I/O. Every record carries the
+    run_id and item_id of the current log_context (see utils.log_context),
+    which json_format writes out as fields of one JSON object per line.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file
-        logging_format: Log message format
+        logging_format: Log message format (text output)
+        use_queue: Hand records to a listener thread (default: from settings)
+        json_format: Write JSON lines instead of logging_format (default: from settings)
     """
-    # Get log level from parameter or settings
-    if log_level is None:
-        try:
-            log_level = Settings().LOG_LEVEL
-        except Exception:
-            log_level = "INFO"
+    # Get log level and mode from parameters or settings
+    try:
+        settings = get_settings()
+        log_level = log_level or settings.LOG_LEVEL
+        use_queue = settings.LOG_QUEUE if use_queue is None else use_queue
+        json_format = settings.LOG_FORMAT == "json" if json_format is None else json_format
+    except Exception:
+        log_level = log_level or "INFO"
+        use_queue = bool(use_queue)
+        json_format = bool(json_format)
 
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -35,14 +79,15 @@ def configure_application_logging(
     logger = logging.getLogger()
     logger.setLevel(numeric_level)
 
-    # Clear existing handlers to avoid duplicates
+    # Clear existing handlers (and a previous listener) to avoid duplicates
+    stop_logging()
     if logger.handlers:
         for handler in list(logger.handlers):
             logger.removeHandler(handler)
             handler.close()
 
     # Create formatter
-    formatter = logging.Formatter(logging_format)
+    formatter = JsonFormatter() if json_format else logging.Formatter(logging_format)
 
     # Ensure log directory exists
     log_path = Path(log_file)
@@ -61,15 +106,64 @@ def configure_application_logging(
 
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    logger.info(f"Logger configured successfully (level: {log_level})")
+    handlers: List[logging.Handler] = [file_handler, console_handler]
+    if use_queue:
+        global _listener
+        queue_handler = StructuredQueueHandler(queue.SimpleQueue())
+        _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        handlers = [queue_handler]
+
+    # Correlation ids are read on the emitting thread, before any queueing
+    for handler in handlers:
+        handler.addFilter(CorrelationFilter())
+        logger.addHandler(handler)
+
+    _config.clear()
+    _config.update(
+        log_level=log_level,
+        log_file=log_file,
+        logging_format=logging_format,
+        use_queue=use_queue,
+        json_format=json_format,
+    )
+    logger.info(
+        "Logger configured successfully (level: %s, queue: %s, format: %s)",
+        log_level,
+        use_queue,
+        "json" if json_format else "text",
+    )
+
+
+def logging_config() -> Dict[str, Any]:
+    """
+    Get the arguments of the active logging configuration.
+
+    Spawned worker processes start with an unconfigured root logger; passing
+    these to configure_application_logging there gives them the parent's
+    level, file and format.
+
+    Returns:
+        Keyword arguments for configure_application_logging (empty if logging
+        was never configured)
+    """
+    return dict(_config)
+
+
+def stop_logging() -> None:
+    """Stop the queue listener, writing out records still queued; no-op without one."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -85,6 +179,4 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-# Initialize the logger with default settings
-configure_application_logging()
-logger = logging.getLogger(__name__)
+atexit.register(stop_logging)
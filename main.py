@@ -6,9 +6,8 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from constants.settings import Settings
-from controller.controller import Controller
-from driver import PlaywrightDriver
+from constants.settings import Settings, get_settings
+from logger import configure_application_logging
 from utils.exceptions import AutomationError, ConfigurationError
 
 # Load environment variables from .env file
@@ -17,10 +16,8 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-def setup_directories() -> None:
+def setup_directories(settings: Settings) -> None:
     """Create necessary directories for logs, screenshots, etc."""
-    settings = Settings()
-
     directories = [
         Path("logs"),
         Path(settings.SCREENSHOT_DIR),
@@ -32,6 +29,21 @@ def setup_directories() -> None:
         logger.debug(f"Ensured directory exists: {directory}")
 
 
+async def run_async(settings: Settings) -> None:
+    """
+    Run the automation workflow on the asyncio engine.
+
+    Args:
+        settings: Application settings
+    """
+    from controller.async_controller import AsyncController
+    from driver import AsyncPlaywrightDriver
+
+    async with AsyncPlaywrightDriver(settings=settings) as driver:
+        controller = AsyncController(driver.page, driver=driver, settings=settings)
+        await controller.run(settings.USERNAME, settings.PASSWORD)
+
+
 def main() -> int:
     """
     Main automation workflow.
@@ -42,26 +54,47 @@ def main() -> int:
     driver = None
 
     try:
-        logger.info("Starting automation process...")
+        # Load and validate settings once; everything below shares this snapshot
+        settings = get_settings()
 
-        # Setup required directories
-        setup_directories()
-
-        # Load settings
-        settings = Settings()
+        # Setup required directories and logging
+        setup_directories(settings)
+        configure_application_logging()
+        logger.info("Starting automation process...")
 
-        # Validate credentials
-        if not settings.USERNAME or not settings.PASSWORD:
+        # Validate credentials (an accounts file brings its own)
+        if not settings.ACCOUNTS_FILE and (not settings.USERNAME or not settings.PASSWORD):
             raise ConfigurationError(
                 "Username and password must be provided via environment variables "
                 "(APP_USERNAME, APP_PASSWORD) or config.ini"
             )
 
-        # Initialize driver with context manager support
-        with PlaywrightDriver(headless=settings.HEADLESS) as driver:
-            # Create controller and run automation
-            controller = Controller(driver.page)
-            controller.run(settings.USERNAME, settings.PASSWORD)
+        if settings.ACCOUNTS_FILE:
+            import asyncio
+
+            from controller.multi_account import run_accounts
+
+            summaries = asyncio.run(run_accounts(settings=settings))
+            failed = [name for name, summary in summaries.items() if summary is None]
+            if failed:
+                raise AutomationError(f"Accounts failed: {', '.join(failed)}")
+        elif settings.ENGINE == "async":
+            import asyncio
+
+            asyncio.run(run_async(settings))
+        elif settings.SHARDS > 1:
+            from controller.sharding import run_sharded
+
+            run_sharded(settings.USERNAME, settings.PASSWORD, settings=settings)
+        else:
+            from controller.controller import Controller
+            from driver import PlaywrightDriver
+
+            # Initialize driver with context manager support
+            with PlaywrightDriver(settings=settings) as driver:
+                # Create controller and run automation
+                controller = Controller(driver.page, driver=driver, settings=settings)
+                controller.run(settings.USERNAME, settings.PASSWORD)
 
         logger.info("Automation process completed successfully")
         return 0
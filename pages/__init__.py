@@ -1,8 +1,55 @@
 """Page objects for web automation framework."""
 
-from .base_page import BasePage
-from .feed_page import FeedPage
-from .item_page import ItemPage
-from .login_page import LoginPage
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["BasePage", "LoginPage", "ItemPage", "FeedPage"]
+if TYPE_CHECKING:
+    from .async_base_page import AsyncBasePage
+    from .async_feed_page import AsyncFeedPage
+    from .async_item_page import AsyncItemPage
+    from .async_login_page import AsyncLoginPage
+    from .base_page import BasePage
+    from .feed_page import FeedPage
+    from .item_page import ItemPage
+    from .login_page import LoginPage
+    from .page_router import PageRouter
+
+# Exported name -> submodule. Submodules are imported on first attribute access,
+# so importing one module of the package does not load all of them (and both
+# Playwright APIs) as a side effect.
+_EXPORTS = {
+    "AsyncBasePage": ".async_base_page",
+    "AsyncFeedPage": ".async_feed_page",
+    "AsyncItemPage": ".async_item_page",
+    "AsyncLoginPage": ".async_login_page",
+    "BasePage": ".base_page",
+    "FeedPage": ".feed_page",
+    "ItemPage": ".item_page",
+    "LoginPage": ".login_page",
+    "PageRouter": ".page_router",
+}
+
+__all__ = [
+    "BasePage",
+    "LoginPage",
+    "ItemPage",
+    "FeedPage",
+    "PageRouter",
+    "AsyncBasePage",
+    "AsyncLoginPage",
+    "AsyncItemPage",
+    "AsyncFeedPage",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,161 @@
+"""Async base page class with common functionality for asyncio page objects."""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from playwright.async_api import Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from constants.settings import Settings, get_settings
+from pages.base_page import PROBE_STATE_JS
+from utils.exceptions import ElementNotFoundError, TimeoutError
+from utils.screenshots import get_screenshot_service
+from utils.timing import timed
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBasePage:
+    """Base class for all asyncio page objects, mirroring BasePage."""
+
+    def __init__(self, page: Page, settings: Optional[Settings] = None):
+        """Initialize base page with async Playwright page object and settings snapshot."""
+        self.page = page
+        self.settings = settings or get_settings()
+        self.timeout = self.settings.TIMEOUT
+
+    @timed
+    async def navigate_to(self, url: str, wait_until: str = "domcontentloaded") -> None:
+        """Navigate to a URL with error handling."""
+        try:
+            logger.info("Navigating to: %s", url)
+            await self.page.goto(url, wait_until=wait_until, timeout=self.timeout)
+            logger.debug("Successfully navigated to: %s", url)
+        except PlaywrightTimeoutError as e:
+            logger.error(f"Navigation timeout for URL: {url}")
+            raise TimeoutError(f"Failed to navigate to {url}: {e}")
+        except Exception as e:
+            logger.error(f"Navigation failed for URL: {url} - {e}")
+            raise
+
+    @timed
+    async def wait_for_selector(
+        self, selector: str, timeout: Optional[int] = None, state: str = "visible"
+    ) -> Locator:
+        """Wait for element with retry logic."""
+        timeout = timeout or self.timeout
+        try:
+            logger.debug("Waiting for selector: %s", selector)
+            locator = self.page.locator(selector)
+            await locator.wait_for(state=state, timeout=timeout)
+            return locator
+        except PlaywrightTimeoutError:
+            logger.error(f"Element not found: {selector}")
+            raise ElementNotFoundError(f"Element '{selector}' not found within {timeout}ms")
+
+    @timed
+    async def safe_click(self, selector: str, timeout: Optional[int] = None) -> None:
+        """Click element with wait and error handling."""
+        try:
+            locator = await self.wait_for_selector(selector, timeout)
+            logger.debug("Clicking element: %s", selector)
+            await locator.click()
+        except Exception as e:
+            logger.error(f"Failed to click element: {selector} - {e}")
+            raise
+
+    @timed
+    async def safe_fill(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
+        """Fill input with wait and error handling."""
+        try:
+            locator = await self.wait_for_selector(selector, timeout)
+            logger.debug("Filling element: %s", selector)
+            await locator.fill(value)
+        except Exception as e:
+            logger.error(f"Failed to fill element: {selector} - {e}")
+            raise
+
+    @timed
+    async def safe_get_text(self, selector: str, timeout: Optional[int] = None) -> str:
+        """Get text content with wait and error handling."""
+        try:
+            locator = await self.wait_for_selector(selector, timeout)
+            text = await locator.inner_text()
+            logger.debug("Retrieved text from %s: %s...", selector, text[:50])
+            return text
+        except Exception as e:
+            logger.error(f"Failed to get text from element: {selector} - {e}")
+            raise
+
+    @timed
+    async def is_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """Check if element is visible without throwing exception."""
+        try:
+            locator = self.page.locator(selector)
+            await locator.wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    @timed
+    async def probe_state(self, states: Dict[str, str], timeout: int = 5000) -> Optional[str]:
+        """
+        Detect which of several page states is showing (see BasePage.probe_state).
+
+        Args:
+            states: State name -> CSS selector; empty selectors are ignored
+            timeout: Milliseconds to wait for a state; 0 checks once
+
+        Returns:
+            Name of the visible state, or None if none appeared in time
+        """
+        probes = [[name, selector] for name, selector in states.items() if selector]
+        if not probes:
+            return None
+
+        if timeout <= 0:
+            state = await self.page.evaluate(PROBE_STATE_JS, probes)
+        else:
+            try:
+                handle = await self.page.wait_for_function(
+                    PROBE_STATE_JS, arg=probes, polling="raf", timeout=timeout
+                )
+                state = await handle.json_value()
+            except PlaywrightTimeoutError:
+                state = None
+
+        logger.debug("Probed page state: %s", state)
+        return state
+
+    @timed
+    async def take_screenshot(
+        self,
+        name: str = "screenshot",
+        clip: Optional[Dict[str, float]] = None,
+        full_page: Optional[bool] = None,
+    ) -> Optional[Path]:
+        """Take screenshot; the file is written in the background (see BasePage.take_screenshot)."""
+        return await get_screenshot_service(self.settings).capture_async(
+            self.page, name, clip, full_page
+        )
+
+    @timed
+    async def wait_for_navigation(self, timeout: Optional[int] = None) -> None:
+        """Wait for navigation to complete."""
+        timeout = timeout or self.timeout
+        try:
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            logger.debug("Navigation completed")
+        except PlaywrightTimeoutError:
+            logger.warning("Navigation wait timed out")
+            raise TimeoutError("Navigation did not complete in time")
+
+    @property
+    def current_url(self) -> str:
+        """Get current page URL."""
+        return self.page.url
+
+    async def title(self) -> str:
+        """Get page title."""
+        return await self.page.title()
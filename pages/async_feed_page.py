@@ -0,0 +1,150 @@
+"""Async feed page object for browsing and filtering items."""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Locator, Page
+
+from constants.feed_constants import FEED_ITEM, FEED_ITEMS, VIEWS_URL_SUFFIX
+from constants.settings import Settings
+from pages.async_base_page import AsyncBasePage
+from pages.feed_page import FEED_ITEM_RECORDS_JS
+from utils.exceptions import ElementNotFoundError
+from utils.timing import timed
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFeedPage(AsyncBasePage):
+    """Asyncio page object for feed/listing functionality."""
+
+    def __init__(
+        self, page: Page, viewed_my_profile: bool = True, settings: Optional[Settings] = None
+    ):
+        """
+        Initialize feed page.
+
+        Unlike FeedPage, construction does not navigate; await open() to load the feed.
+
+        Args:
+            page: Async Playwright page object
+            viewed_my_profile: Whether to navigate to profile views
+            settings: Settings snapshot (default: get_settings())
+        """
+        super().__init__(page, settings)
+        logger.debug("Initializing AsyncFeedPage")
+
+        self.url = self.settings.BASE_URL
+        if viewed_my_profile:
+            self.url += VIEWS_URL_SUFFIX
+
+    async def open(self) -> "AsyncFeedPage":
+        """Navigate to the feed and return self for chaining."""
+        await self.navigate_to(self.url)
+        return self
+
+    async def iterate_over_items(
+        self,
+        process_item: Callable[[Any], Awaitable[Any]],
+        limit: Optional[int] = None,
+        bulk: bool = False,
+    ) -> List[Any]:
+        """
+        Iterate over feed items and process each one.
+
+        Args:
+            process_item: Async callback function to process each item
+            limit: Maximum number of items to process
+            bulk: Pass plain records from get_item_records() to the callback
+                instead of Locators, fetching all items in one round trip
+
+        Returns:
+            List of processed results
+
+        Raises:
+            ElementNotFoundError: If feed container not found
+        """
+        logger.debug("AsyncFeedPage.iterate_over_items")
+        results = []
+
+        if not FEED_ITEMS:
+            logger.warning("FEED_ITEMS selector is empty, skipping iteration")
+            return results
+
+        if bulk:
+            items: List[Any] = await self.get_item_records(limit)
+        else:
+            items = await (await self._wait_for_feed()).locator(FEED_ITEM).all()
+        logger.info("Found %s items in search results", len(items))
+
+        items_to_process = min(len(items), limit) if limit else len(items)
+
+        for index, item in enumerate(items[:items_to_process]):
+            try:
+                logger.debug("Processing item %s/%s", index + 1, items_to_process)
+                result = await process_item(item)
+                results.append(result)
+            except Exception as e:
+                logger.error(f"Error processing item {index}: {e}")
+                continue
+
+        logger.info("Successfully processed %s items", len(results))
+        return results
+
+    @timed
+    async def get_item_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract every feed item as a plain record in one evaluate_all call.
+
+        See FeedPage.get_item_records for the record layout.
+
+        Args:
+            limit: Maximum number of records to extract (None or 0: no limit)
+
+        Returns:
+            List of item records
+        """
+        if not FEED_ITEMS:
+            logger.warning("FEED_ITEMS selector is empty, no records to extract")
+            return []
+
+        search_results = await self._wait_for_feed()
+        # 0 means no limit, as in iterate_over_items; JS would slice it to nothing
+        records = await search_results.locator(FEED_ITEM).evaluate_all(
+            FEED_ITEM_RECORDS_JS, limit or None
+        )
+        logger.debug("Extracted %s item records", len(records))
+        return records
+
+    def item_locator(self, index: int) -> Locator:
+        """
+        Get the Locator of the feed item at a position.
+
+        Args:
+            index: Zero-based item index (the "index" of a record)
+
+        Returns:
+            Item locator
+        """
+        return self.page.locator(FEED_ITEMS).locator(FEED_ITEM).nth(index)
+
+    async def get_item_count(self) -> int:
+        """Get total number of items in feed."""
+        if not FEED_ITEMS:
+            return 0
+
+        try:
+            search_results = await self.wait_for_selector(FEED_ITEMS, timeout=5000)
+            return await search_results.locator(FEED_ITEM).count()
+        except ElementNotFoundError:
+            logger.warning("Could not count items - feed not found")
+            return 0
+
+    async def _wait_for_feed(self) -> Locator:
+        """Wait for the feed container, taking a screenshot if it never appears."""
+        try:
+            return await self.wait_for_selector(FEED_ITEMS)
+        except ElementNotFoundError:
+            logger.error("Search results container not found")
+            await self.take_screenshot("feed_not_found")
+            raise
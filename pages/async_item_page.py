@@ -0,0 +1,136 @@
+"""Async item page object for individual item interactions."""
+
+import logging
+from typing import Any, Dict, Optional
+
+from playwright.async_api import Page
+
+from constants.item_constants import ITEM_DETAILS
+from constants.settings import Settings
+from pages.async_base_page import AsyncBasePage
+from utils.exceptions import ElementNotFoundError
+from utils.html_extract import UnsupportedSelectorError, extract_text
+from utils.timing import timed
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncItemPage(AsyncBasePage):
+    """Asyncio page object for individual item functionality."""
+
+    def __init__(
+        self, page: Page, item_id: Optional[str] = None, settings: Optional[Settings] = None
+    ):
+        """
+        Initialize item page.
+
+        Args:
+            page: Async Playwright page object
+            item_id: Optional item identifier
+            settings: Settings snapshot (default: get_settings())
+        """
+        super().__init__(page, settings)
+        logger.debug("Initializing AsyncItemPage with ID: %s", item_id)
+        self.item_id = item_id
+
+    @timed
+    async def get_info(self) -> Dict[str, Any]:
+        """
+        Extract item information from the page.
+
+        Returns:
+            Dictionary containing item details
+
+        Raises:
+            ElementNotFoundError: If item details not found
+        """
+        logger.debug("AsyncItemPage.get_info")
+
+        if not ITEM_DETAILS:
+            logger.warning("ITEM_DETAILS selector is empty")
+            return {}
+
+        try:
+            item_info_text = await self.safe_get_text(ITEM_DETAILS)
+
+            return {"id": self.item_id, "raw_text": item_info_text, "url": self.current_url}
+        except ElementNotFoundError as e:
+            logger.error(f"Failed to get item info: {e}")
+            await self.take_screenshot("item_info_error")
+            raise
+
+    @timed
+    async def get_info_http(self, item_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Extract item information without rendering the page (see ItemPage.get_info_http).
+
+        Args:
+            item_id: Item identifier (default: this page's item_id)
+
+        Returns:
+            Dictionary containing item details, or None to fall back to get_info()
+        """
+        item_id = item_id or self.item_id
+        if not ITEM_DETAILS or not item_id:
+            return None
+
+        url = self.item_url(item_id)
+        try:
+            response = await self.page.context.request.get(url, timeout=self.timeout)
+            content_type = response.headers.get("content-type", "")
+            if not response.ok or "html" not in content_type:
+                logger.debug(
+                    "HTTP fast path unusable for %s: %s %s", url, response.status, content_type
+                )
+                return None
+
+            item_info_text = extract_text(await response.text(), ITEM_DETAILS)
+        except UnsupportedSelectorError as e:
+            logger.debug("HTTP fast path cannot evaluate ITEM_DETAILS: %s", e)
+            return None
+        except Exception as e:
+            logger.debug("HTTP fast path failed for %s: %s", url, e)
+            return None
+
+        if not item_info_text:
+            logger.debug("Item details not server-rendered for %s, browser required", url)
+            return None
+
+        self.item_id = item_id
+        return {"id": item_id, "raw_text": item_info_text, "url": response.url}
+
+    async def perform_action(self, message: Optional[str] = None) -> None:
+        """
+        Perform action on the item.
+
+        Args:
+            message: Optional message to send/use
+
+        TODO: Implement specific action based on your use case (see ItemPage.perform_action).
+        """
+        logger.debug("AsyncItemPage.perform_action with message: %s", message)
+
+        # TODO: Implement your site-specific action here
+        pass
+
+    async def navigate_to_item(self, item_id: str) -> None:
+        """
+        Navigate to specific item by ID.
+
+        Args:
+            item_id: Item identifier
+        """
+        self.item_id = item_id
+        await self.navigate_to(self.item_url(item_id))
+
+    def item_url(self, item_id: str) -> str:
+        """
+        Build the URL of an item page.
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            Absolute item URL
+        """
+        return f"{self.settings.BASE_URL}/item/{item_id}"
@@ -0,0 +1,97 @@
+"""Async login page object with authentication functionality."""
+
+import logging
+from typing import Optional
+
+from playwright.async_api import Page
+
+from constants.login_constants import (
+    LOGGED_IN_INDICATOR,
+    LOGIN_BUTTON,
+    PASSWORD_INPUT,
+    USERNAME_INPUT,
+)
+from constants.settings import Settings
+from pages.async_base_page import AsyncBasePage
+from pages.login_page import LOGIN_STATES
+from utils.exceptions import LoginError
+from utils.timing import timed
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """Asyncio page object for login functionality."""
+
+    def __init__(self, page: Page, settings: Optional[Settings] = None):
+        """Initialize login page."""
+        super().__init__(page, settings)
+        logger.debug("Initializing AsyncLoginPage")
+
+    @timed
+    async def login(self, username: str, password: str) -> None:
+        """
+        Perform login with credentials.
+
+        Args:
+            username: User's username
+            password: User's password
+
+        Raises:
+            LoginError: If login fails
+        """
+        try:
+            logger.info(f"Attempting login for user: {username}")
+            await self.safe_fill(USERNAME_INPUT, username)
+            await self.safe_fill(PASSWORD_INPUT, password)
+            await self.safe_click(LOGIN_BUTTON)
+
+            # Wait for navigation after login
+            await self.wait_for_navigation()
+            await self._check_login_outcome()
+            logger.info("Login successful")
+        except Exception as e:
+            logger.error(f"Login failed for user {username}: {e}")
+            await self.take_screenshot("login_failure")
+            raise LoginError(f"Login failed: {e}")
+
+    async def detect_state(self, timeout: int = 2000) -> Optional[str]:
+        """
+        Detect the login-related state of the current page in one probe.
+
+        Args:
+            timeout: Milliseconds to wait for any state to appear
+
+        Returns:
+            "captcha", "login_error", "logged_in", "login_form" or None
+        """
+        return await self.probe_state(LOGIN_STATES, timeout=timeout)
+
+    async def is_logged_in(self, timeout: int = 2000) -> bool:
+        """
+        Check if user is already logged in.
+
+        With LOGGED_IN_INDICATOR configured this returns as soon as either the
+        indicator or the login form is visible. Without it, being logged in can
+        only be inferred from the login form staying absent for timeout ms.
+
+        Args:
+            timeout: Milliseconds to wait for a state to appear
+        """
+        state = await self.detect_state(timeout)
+        if LOGGED_IN_INDICATOR:
+            return state == "logged_in"
+        return state is None
+
+    async def _check_login_outcome(self) -> None:
+        """Fail fast on a captcha or error message after submitting the form."""
+        if not LOGGED_IN_INDICATOR:
+            # Without a positive signal, probing would wait out the full timeout on success
+            return
+
+        outcome = {k: v for k, v in LOGIN_STATES.items() if k != "login_form"}
+        state = await self.probe_state(outcome, timeout=self.timeout)
+        if state in ("captcha", "login_error"):
+            raise LoginError(f"Login blocked: {state} shown")
+        if state is None:
+            logger.warning("Logged-in indicator did not appear after login")
@@ -2,32 +2,53 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from playwright.sync_api import Locator, Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from constants.settings import Settings
+from constants.settings import Settings, get_settings
 from utils.exceptions import ElementNotFoundError, TimeoutError
+from utils.screenshots import get_screenshot_service
+from utils.timing import timed
 
 logger = logging.getLogger(__name__)
 
+# Returns the name of the first state (in map order) with a visible element, or null
+PROBE_STATE_JS = """
+states => {
+    const visible = el => {
+        const style = getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        return style.visibility !== "hidden" && style.display !== "none"
+            && rect.width > 0 && rect.height > 0;
+    };
+    for (const [name, selector] of states) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (visible(el)) return name;
+        }
+    }
+    return null;
+}
+"""
+
 
 class BasePage:
     """Base class for all page objects with common functionality."""
 
-    def __init__(self, page: Page):
-        """Initialize base page with Playwright page object."""
+    def __init__(self, page: Page, settings: Optional[Settings] = None):
+        """Initialize base page with Playwright page object and settings snapshot."""
         self.page = page
-        self.settings = Settings()
+        self.settings = settings or get_settings()
         self.timeout = self.settings.TIMEOUT
 
-    def navigate_to(self, url: str) -> None:
+    @timed
+    def navigate_to(self, url: str, wait_until: str = "domcontentloaded") -> None:
         """Navigate to a URL with error handling."""
         try:
-            logger.info(f"Navigating to: {url}")
-            self.page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
-            logger.debug(f"Successfully navigated to: {url}")
+            logger.info("Navigating to: %s", url)
+            self.page.goto(url, wait_until=wait_until, timeout=self.timeout)
+            logger.debug("Successfully navigated to: %s", url)
         except PlaywrightTimeoutError as e:
             logger.error(f"Navigation timeout for URL: {url}")
             raise TimeoutError(f"Failed to navigate to {url}: {e}")
@@ -35,13 +56,14 @@ class BasePage:
             logger.error(f"Navigation failed for URL: {url} - {e}")
             raise
 
+    @timed
     def wait_for_selector(
         self, selector: str, timeout: Optional[int] = None, state: str = "visible"
     ) -> Locator:
         """Wait for element with retry logic."""
         timeout = timeout or self.timeout
         try:
-            logger.debug(f"Waiting for selector: {selector}")
+            logger.debug("Waiting for selector: %s", selector)
             locator = self.page.locator(selector)
             locator.wait_for(state=state, timeout=timeout)
             return locator
@@ -49,37 +71,41 @@ class BasePage:
             logger.error(f"Element not found: {selector}")
             raise ElementNotFoundError(f"Element '{selector}' not found within {timeout}ms")
 
+    @timed
     def safe_click(self, selector: str, timeout: Optional[int] = None) -> None:
         """Click element with wait and error handling."""
         try:
             locator = self.wait_for_selector(selector, timeout)
-            logger.debug(f"Clicking element: {selector}")
+            logger.debug("Clicking element: %s", selector)
             locator.click()
         except Exception as e:
             logger.error(f"Failed to click element: {selector} - {e}")
             raise
 
+    @timed
     def safe_fill(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
         """Fill input with wait and error handling."""
         try:
             locator = self.wait_for_selector(selector, timeout)
-            logger.debug(f"Filling element: {selector}")
+            logger.debug("Filling element: %s", selector)
             locator.fill(value)
         except Exception as e:
             logger.error(f"Failed to fill element: {selector} - {e}")
             raise
 
+    @timed
     def safe_get_text(self, selector: str, timeout: Optional[int] = None) -> str:
         """Get text content with wait and error handling."""
         try:
             locator = self.wait_for_selector(selector, timeout)
             text = locator.inner_text()
-            logger.debug(f"Retrieved text from {selector}: {text[:50]}...")
+            logger.debug("Retrieved text from %s: %s...", selector, text[:50])
             return text
         except Exception as e:
             logger.error(f"Failed to get text from element: {selector} - {e}")
             raise
 
+    @timed
     def is_visible(self, selector: str, timeout: int = 5000) -> bool:
         """Check if element is visible without throwing exception."""
         try:
@@ -89,21 +115,66 @@ class BasePage:
         except PlaywrightTimeoutError:
             return False
 
-    def take_screenshot(self, name: str = "screenshot") -> Path:
-        """Take screenshot and save to configured directory."""
-        screenshot_dir = Path(self.settings.SCREENSHOT_DIR)
-        screenshot_dir.mkdir(parents=True, exist_ok=True)
-
-        from datetime import datetime
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png"
-        filepath = screenshot_dir / filename
-
-        logger.info(f"Taking screenshot: {filepath}")
-        self.page.screenshot(path=str(filepath))
-        return filepath
-
+    @timed
+    def probe_state(self, states: Dict[str, str], timeout: int = 5000) -> Optional[str]:
+        """
+        Detect which of several page states is showing, in one in-page poll.
+
+        All selectors are checked together on every animation frame, so the
+        call returns as soon as any state appears instead of paying a timeout
+        for each state that is absent. When several states are visible at
+        once, the first in map order wins.
+
+        Args:
+            states: State name -> CSS selector (Playwright-only selector
+                syntax such as text= is not supported); empty selectors are ignored
+            timeout: Milliseconds to wait for a state; 0 checks once
+
+        Returns:
+            Name of the visible state, or None if none appeared in time
+        """
+        probes = [[name, selector] for name, selector in states.items() if selector]
+        if not probes:
+            return None
+
+        if timeout <= 0:
+            state = self.page.evaluate(PROBE_STATE_JS, probes)
+        else:
+            try:
+                handle = self.page.wait_for_function(
+                    PROBE_STATE_JS, arg=probes, polling="raf", timeout=timeout
+                )
+                state = handle.json_value()
+            except PlaywrightTimeoutError:
+                state = None
+
+        logger.debug("Probed page state: %s", state)
+        return state
+
+    @timed
+    def take_screenshot(
+        self,
+        name: str = "screenshot",
+        clip: Optional[Dict[str, float]] = None,
+        full_page: Optional[bool] = None,
+    ) -> Optional[Path]:
+        """
+        Take screenshot; the file is written to the configured directory in the background.
+
+        Repeated screenshots of the same name are rate-limited and deduplicated
+        (see ScreenshotService), so this is cheap to call on every failure.
+
+        Args:
+            name: Screenshot kind and file name prefix
+            clip: Region to capture ({"x", "y", "width", "height"})
+            full_page: Capture the full page instead of the viewport (default: from settings)
+
+        Returns:
+            Path the screenshot is written to, or None if it was skipped
+        """
+        return get_screenshot_service(self.settings).capture(self.page, name, clip, full_page)
+
+    @timed
     def wait_for_navigation(self, timeout: Optional[int] = None) -> None:
         """Wait for navigation to complete."""
         timeout = timeout or self.timeout
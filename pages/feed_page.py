@@ -1,39 +1,115 @@
 """Feed page object for browsing and filtering items."""
 
 import logging
-from typing import Any, Callable, List, Optional
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
 from playwright.sync_api import Locator, Page
 
-from constants.feed_constants import FEED_ITEMS, VIEWS_URL_SUFFIX
+from constants.feed_constants import FEED_ITEM, FEED_ITEMS, FEED_NEXT_PAGE, VIEWS_URL_SUFFIX
+from constants.settings import Settings
 from pages.base_page import BasePage
 from utils.exceptions import ElementNotFoundError
+from utils.item_ids import IdPattern, resolve_item_id
+from utils.timing import timed
 
 logger = logging.getLogger(__name__)
 
+# Serializes one feed item element; index is its position among the rendered items
+FEED_ITEM_RECORD_JS = """(el, index) => {
+    const link = el.matches("a[href]") ? el : el.querySelector("a[href]");
+    const attributes = {};
+    for (const attr of el.attributes) attributes[attr.name] = attr.value;
+    return {
+        index,
+        id: el.id || null,
+        text: (el.innerText || "").trim(),
+        href: link ? link.href : null,
+        attributes,
+    };
+}"""
+
+# Serializes every feed item in a single in-page evaluation
+FEED_ITEM_RECORDS_JS = (
+    "(elements, limit) => elements.slice(0, limit ?? elements.length)"
+    f".map({FEED_ITEM_RECORD_JS})"
+)
+
+# Serializes only the items rendered since the last call, given [start, head] from it.
+# An append-only feed keeps its first item, so the items from `start` on are new; when the
+# first item changed (virtualized list recycling nodes, page replaced) all are returned.
+FEED_NEW_RECORDS_JS = f"""
+(elements, [start, head]) => {{
+    const record = {FEED_ITEM_RECORD_JS};
+    const first = elements.length ? (elements[0].textContent || "").slice(0, 200) : "";
+    const from = first === head && start <= elements.length ? start : 0;
+    return {{
+        count: elements.length,
+        head: first,
+        records: elements.slice(from).map((el, offset) => record(el, from + offset)),
+    }};
+}}
+"""
+
+# Cheap fingerprint of the rendered items; changes when items are appended or recycled
+FEED_SIGNATURE_JS = """
+elements => {
+    const first = elements[0], last = elements[elements.length - 1];
+    const text = el => (el ? (el.textContent || "").slice(0, 200) : "");
+    return `${elements.length}|${text(first)}|${text(last)}`;
+}
+"""
+
+# Scrolls the last rendered item (and its scroll container) into view
+ADVANCE_FEED_JS = """
+elements => {
+    const last = elements[elements.length - 1];
+    if (last) last.scrollIntoView({ block: "end" });
+    window.scrollBy(0, window.innerHeight);
+}
+"""
+
 
 class FeedPage(BasePage):
     """Page object for feed/listing functionality."""
 
-    def __init__(self, page: Page, viewed_my_profile: bool = True):
+    def __init__(
+        self,
+        page: Page,
+        viewed_my_profile: bool = True,
+        navigate: bool = True,
+        settings: Optional[Settings] = None,
+    ):
         """
         Initialize feed page.
 
         Args:
             page: Playwright page object
             viewed_my_profile: Whether to navigate to profile views
+            navigate: Load the feed now (pass False when the page already shows
+                it, e.g. from PageRouter, and call open() when needed)
+            settings: Settings snapshot (default: get_settings())
         """
-        super().__init__(page)
+        super().__init__(page, settings)
         logger.debug("Initializing FeedPage")
 
-        url = self.settings.BASE_URL
+        self.url = self.settings.BASE_URL
         if viewed_my_profile:
-            url += VIEWS_URL_SUFFIX
+            self.url += VIEWS_URL_SUFFIX
+
+        if navigate:
+            self.open()
 
-        self.navigate_to(url)
+    def open(self) -> "FeedPage":
+        """Navigate to the feed and return self for chaining."""
+        self.navigate_to(self.url)
+        return self
 
     def iterate_over_items(
-        self, process_item: Callable[[Locator], Any], limit: Optional[int] = None
+        self,
+        process_item: Callable[[Any], Any],
+        limit: Optional[int] = None,
+        bulk: bool = False,
     ) -> List[Any]:
         """
         Iterate over feed items and process each one.
@@ -41,6 +117,8 @@ class FeedPage(BasePage):
         Args:
             process_item: Callback function to process each item
             limit: Maximum number of items to process
+            bulk: Pass plain records from get_item_records() to the callback
+                instead of Locators, fetching all items in one round trip
 
         Returns:
             List of processed results
@@ -55,17 +133,12 @@ class FeedPage(BasePage):
             logger.warning("FEED_ITEMS selector is empty, skipping iteration")
             return results
 
-        # Wait for and locate the search results container
-        try:
-            search_results = self.wait_for_selector(FEED_ITEMS)
-        except ElementNotFoundError:
-            logger.error("Search results container not found")
-            self.take_screenshot("feed_not_found")
-            raise
-
-        # Find all item elements within the search results
-        items = search_results.locator(".item").all()
-        logger.info(f"Found {len(items)} items in search results")
+        if bulk:
+            items: List[Any] = self.get_item_records(limit)
+        else:
+            # Find all item elements within the search results
+            items = self._wait_for_feed().locator(FEED_ITEM).all()
+        logger.info("Found %s items in search results", len(items))
 
         # Determine how many items to process
         items_to_process = min(len(items), limit) if limit else len(items)
@@ -73,7 +146,7 @@ class FeedPage(BasePage):
         # Iterate over each item
         for index, item in enumerate(items[:items_to_process]):
             try:
-                logger.debug(f"Processing item {index + 1}/{items_to_process}")
+                logger.debug("Processing item %s/%s", index + 1, items_to_process)
                 result = process_item(item)
                 results.append(result)
             except Exception as e:
@@ -81,9 +154,120 @@ class FeedPage(BasePage):
                 # Continue processing other items
                 continue
 
-        logger.info(f"Successfully processed {len(results)} items")
+        logger.info("Successfully processed %s items", len(results))
         return results
 
+    @timed
+    def get_item_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract every feed item as a plain record in one evaluate_all call.
+
+        Each record has "index", "id", "text", "href" (first link, absolute)
+        and "attributes" (all attributes of the item element).
+
+        Args:
+            limit: Maximum number of records to extract (None or 0: no limit)
+
+        Returns:
+            List of item records
+
+        Raises:
+            ElementNotFoundError: If feed container not found
+        """
+        if not FEED_ITEMS:
+            logger.warning("FEED_ITEMS selector is empty, no records to extract")
+            return []
+
+        # 0 means no limit, as in iterate_over_items; JS would slice it to nothing
+        records = (
+            self._wait_for_feed()
+            .locator(FEED_ITEM)
+            .evaluate_all(FEED_ITEM_RECORDS_JS, limit or None)
+        )
+        logger.debug("Extracted %s item records", len(records))
+        return records
+
+    def stream_items(
+        self,
+        limit: Optional[int] = None,
+        id_pattern: Optional[IdPattern] = None,
+        max_idle_rounds: int = 2,
+        settle_timeout: int = 3000,
+        poll_interval: int = 250,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield feed item records while scrolling or paginating the feed.
+
+        Each round extracts the items rendered since the previous round in one
+        call (all rendered items if the list was recycled), yields the ones not
+        seen before, then scrolls the last item into view and waits for the
+        rendered items to change. Items are deduplicated by resolved item id
+        (falling back to href, then text), so virtualized lists that recycle
+        DOM nodes are handled. After max_idle_rounds rounds without new items
+        the FEED_NEXT_PAGE link is followed if configured; otherwise the
+        stream ends.
+
+        Args:
+            limit: Maximum number of records to yield
+            id_pattern: Regex for ids in hrefs (default: ITEM_ID_PATTERN)
+            max_idle_rounds: Rounds without new items before the feed is exhausted
+            settle_timeout: Milliseconds to wait for new items after each scroll
+            poll_interval: Milliseconds between checks while waiting
+
+        Yields:
+            Item records (see get_item_records) with an added "item_id" key
+
+        Raises:
+            ElementNotFoundError: If feed container not found
+        """
+        logger.debug("FeedPage.stream_items")
+
+        if not FEED_ITEMS:
+            logger.warning("FEED_ITEMS selector is empty, nothing to stream")
+            return
+
+        items = self._wait_for_feed().locator(FEED_ITEM)
+        seen: Set[str] = set()
+        yielded = 0
+        idle_rounds = 0
+        # Rendered item count and first item text after the previous round
+        start, head = 0, None
+
+        while True:
+            new_items = 0
+            batch = items.evaluate_all(FEED_NEW_RECORDS_JS, [start, head])
+            start, head = batch["count"], batch["head"]
+            for record in batch["records"]:
+                record["item_id"] = resolve_item_id(record, id_pattern)
+                key = record["item_id"] or record["href"] or f"text:{record['text']}"
+                if key in seen:
+                    continue
+
+                seen.add(key)
+                new_items += 1
+                yielded += 1
+                yield record
+
+                if limit and yielded >= limit:
+                    logger.info("Feed stream reached limit of %s items", limit)
+                    return
+
+            idle_rounds = 0 if new_items else idle_rounds + 1
+            logger.debug("Feed stream round: %s new, %s total", new_items, yielded)
+
+            if idle_rounds >= max_idle_rounds:
+                if not self._go_to_next_page():
+                    logger.info("Feed stream exhausted after %s items", yielded)
+                    return
+                items = self._wait_for_feed().locator(FEED_ITEM)
+                idle_rounds = 0
+                start, head = 0, None
+                continue
+
+            signature = items.evaluate_all(FEED_SIGNATURE_JS)
+            items.evaluate_all(ADVANCE_FEED_JS)
+            self._wait_for_change(items, signature, settle_timeout, poll_interval)
+
     def search(self, query: str) -> None:
         """
         Perform search with query.
@@ -91,12 +275,24 @@ class FeedPage(BasePage):
         Args:
             query: Search query string
         """
-        logger.debug(f"FeedPage.search: {query}")
+        logger.debug("FeedPage.search: %s", query)
         # Implement search functionality based on your site
         # self.safe_fill(self.search_input, query)
         # self.safe_click(self.search_button)
         logger.warning("Search method not fully implemented")
 
+    def item_locator(self, index: int) -> Locator:
+        """
+        Get the Locator of the feed item at a position.
+
+        Args:
+            index: Zero-based item index (the "index" of a record)
+
+        Returns:
+            Item locator
+        """
+        return self.page.locator(FEED_ITEMS).locator(FEED_ITEM).nth(index)
+
     def get_item_count(self) -> int:
         """Get total number of items in feed."""
         if not FEED_ITEMS:
@@ -104,8 +300,41 @@ class FeedPage(BasePage):
 
         try:
             search_results = self.wait_for_selector(FEED_ITEMS, timeout=5000)
-            items = search_results.locator(".item").all()
-            return len(items)
+            return search_results.locator(FEED_ITEM).count()
         except ElementNotFoundError:
             logger.warning("Could not count items - feed not found")
             return 0
+
+    def _wait_for_change(
+        self, items: Locator, signature: str, timeout: int, poll_interval: int
+    ) -> bool:
+        """Poll until the rendered items differ from signature or timeout (ms) elapses."""
+        deadline = time.monotonic() + timeout / 1000
+        while time.monotonic() < deadline:
+            self.page.wait_for_timeout(poll_interval)
+            if items.evaluate_all(FEED_SIGNATURE_JS) != signature:
+                return True
+        return False
+
+    def _go_to_next_page(self) -> bool:
+        """Follow the FEED_NEXT_PAGE link if configured and visible."""
+        if not FEED_NEXT_PAGE:
+            return False
+
+        next_link = self.page.locator(FEED_NEXT_PAGE).first
+        if not next_link.is_visible():
+            return False
+
+        logger.info("Following next feed page")
+        next_link.click()
+        self.wait_for_navigation()
+        return True
+
+    def _wait_for_feed(self) -> Locator:
+        """Wait for the feed container, taking a screenshot if it never appears."""
+        try:
+            return self.wait_for_selector(FEED_ITEMS)
+        except ElementNotFoundError:
+            logger.error("Search results container not found")
+            self.take_screenshot("feed_not_found")
+            raise
@@ -6,8 +6,11 @@ from typing import Any, Dict, Optional
 from playwright.sync_api import Page
 
 from constants.item_constants import ITEM_DETAILS
+from constants.settings import Settings
 from pages.base_page import BasePage
 from utils.exceptions import ElementNotFoundError
+from utils.html_extract import UnsupportedSelectorError, extract_text
+from utils.timing import timed
 
 logger = logging.getLogger(__name__)
 
@@ -15,18 +18,22 @@ logger = logging.getLogger(__name__)
 class ItemPage(BasePage):
     """Page object for individual item functionality."""
 
-    def __init__(self, page: Page, item_id: Optional[str] = None):
+    def __init__(
+        self, page: Page, item_id: Optional[str] = None, settings: Optional[Settings] = None
+    ):
         """
         Initialize item page.
 
         Args:
             page: Playwright page object
             item_id: Optional item identifier
+            settings: Settings snapshot (default: get_settings())
         """
-        super().__init__(page)
-        logger.debug(f"Initializing ItemPage with ID: {item_id}")
+        super().__init__(page, settings)
+        logger.debug("Initializing ItemPage with ID: %s", item_id)
         self.item_id = item_id
 
+    @timed
     def get_info(self) -> Dict[str, Any]:
         """
         Extract item information from the page.
@@ -53,6 +60,52 @@ class ItemPage(BasePage):
             self.take_screenshot("item_info_error")
             raise
 
+    @timed
+    def get_info_http(self, item_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Extract item information without rendering the page.
+
+        Fetches the item URL through the context's APIRequestContext (sharing
+        the logged-in cookies) and applies ITEM_DETAILS to the HTML in Python.
+        Returns None whenever the browser is needed instead: non-2xx or
+        non-HTML responses, selectors the Python matcher cannot evaluate, or
+        details that are missing/empty until JavaScript runs.
+
+        Args:
+            item_id: Item identifier (default: this page's item_id)
+
+        Returns:
+            Dictionary containing item details, or None to fall back to get_info()
+        """
+        item_id = item_id or self.item_id
+        if not ITEM_DETAILS or not item_id:
+            return None
+
+        url = self.item_url(item_id)
+        try:
+            response = self.page.context.request.get(url, timeout=self.timeout)
+            content_type = response.headers.get("content-type", "")
+            if not response.ok or "html" not in content_type:
+                logger.debug(
+                    "HTTP fast path unusable for %s: %s %s", url, response.status, content_type
+                )
+                return None
+
+            item_info_text = extract_text(response.text(), ITEM_DETAILS)
+        except UnsupportedSelectorError as e:
+            logger.debug("HTTP fast path cannot evaluate ITEM_DETAILS: %s", e)
+            return None
+        except Exception as e:
+            logger.debug("HTTP fast path failed for %s: %s", url, e)
+            return None
+
+        if not item_info_text:
+            logger.debug("Item details not server-rendered for %s, browser required", url)
+            return None
+
+        self.item_id = item_id
+        return {"id": item_id, "raw_text": item_info_text, "url": response.url}
+
     def perform_action(self, message: Optional[str] = None) -> None:
         """
         Perform action on the item.
@@ -66,18 +119,31 @@ class ItemPage(BasePage):
             - Like/favorite: self.safe_click('#like-button')
             - Skip: self.safe_click('#skip-button')
         """
-        logger.debug(f"ItemPage.perform_action with message: {message}")
+        logger.debug("ItemPage.perform_action with message: %s", message)
 
         # TODO: Implement your site-specific action here
         pass
 
-    def navigate_to_item(self, item_id: str) -> None:
+    def navigate_to_item(self, item_id: str, wait_until: str = "domcontentloaded") -> None:
         """
         Navigate to specific item by ID.
 
         Args:
             item_id: Item identifier
+            wait_until: Load state to wait for ("commit" returns as soon as the
+                response starts, leaving the load to finish in the background)
         """
         self.item_id = item_id
-        url = f"{self.settings.BASE_URL}/item/{item_id}"
-        self.navigate_to(url)
+        self.navigate_to(self.item_url(item_id), wait_until=wait_until)
+
+    def item_url(self, item_id: str) -> str:
+        """
+        Build the URL of an item page.
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            Absolute item URL
+        """
+        return f"{self.settings.BASE_URL}/item/{item_id}"
@@ -1,24 +1,43 @@
 """Login page object with authentication functionality."""
 
 import logging
+from typing import Optional
 
 from playwright.sync_api import Page
 
-from constants.login_constants import LOGIN_BUTTON, PASSWORD_INPUT, USERNAME_INPUT
+from constants.login_constants import (
+    CAPTCHA,
+    LOGGED_IN_INDICATOR,
+    LOGIN_BUTTON,
+    LOGIN_ERROR,
+    PASSWORD_INPUT,
+    USERNAME_INPUT,
+)
+from constants.settings import Settings
 from pages.base_page import BasePage
 from utils.exceptions import LoginError
+from utils.timing import timed
 
 logger = logging.getLogger(__name__)
 
+# Probe order doubles as priority when several states are visible at once
+LOGIN_STATES = {
+    "captcha": CAPTCHA,
+    "login_error": LOGIN_ERROR,
+    "logged_in": LOGGED_IN_INDICATOR,
+    "login_form": LOGIN_BUTTON,
+}
+
 
 class LoginPage(BasePage):
     """Page object for login functionality."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, settings: Optional[Settings] = None):
         """Initialize login page."""
-        super().__init__(page)
+        super().__init__(page, settings)
         logger.debug("Initializing LoginPage")
 
+    @timed
     def login(self, username: str, password: str) -> None:
         """
         Perform login with credentials.
@@ -38,13 +57,50 @@ class LoginPage(BasePage):
 
             # Wait for navigation after login
             self.wait_for_navigation()
+            self._check_login_outcome()
             logger.info("Login successful")
         except Exception as e:
             logger.error(f"Login failed for user {username}: {e}")
             self.take_screenshot("login_failure")
             raise LoginError(f"Login failed: {e}")
 
-    def is_logged_in(self) -> bool:
-        """Check if user is already logged in."""
-        # Override this method based on your site's logged-in indicator
-        return not self.is_visible(LOGIN_BUTTON, timeout=2000)
+    def detect_state(self, timeout: int = 2000) -> Optional[str]:
+        """
+        Detect the login-related state of the current page in one probe.
+
+        Args:
+            timeout: Milliseconds to wait for any state to appear
+
+        Returns:
+            "captcha", "login_error", "logged_in", "login_form" or None
+        """
+        return self.probe_state(LOGIN_STATES, timeout=timeout)
+
+    def is_logged_in(self, timeout: int = 2000) -> bool:
+        """
+        Check if user is already logged in.
+
+        With LOGGED_IN_INDICATOR configured this returns as soon as either the
+        indicator or the login form is visible. Without it, being logged in can
+        only be inferred from the login form staying absent for timeout ms.
+
+        Args:
+            timeout: Milliseconds to wait for a state to appear
+        """
+        state = self.detect_state(timeout)
+        if LOGGED_IN_INDICATOR:
+            return state == "logged_in"
+        return state is None
+
+    def _check_login_outcome(self) -> None:
+        """Fail fast on a captcha or error message after submitting the form."""
+        if not LOGGED_IN_INDICATOR:
+            # Without a positive signal, probing would wait out the full timeout on success
+            return
+
+        outcome = {k: v for k, v in LOGIN_STATES.items() if k != "login_form"}
+        state = self.probe_state(outcome, timeout=self.timeout)
+        if state in ("captcha", "login_error"):
+            raise LoginError(f"Login blocked: {state} shown")
+        if state is None:
+            logger.warning("Logged-in indicator did not appear after login")
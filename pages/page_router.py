@@ -0,0 +1,155 @@
+"""Navigation-aware registry that hands out page objects without redundant page loads."""
+
+import logging
+from typing import Dict, Optional, Type, TypeVar
+from urllib.parse import urlsplit, urlunsplit
+
+from playwright.sync_api import Page
+
+from constants.settings import Settings, get_settings
+from pages.base_page import BasePage
+from pages.feed_page import FeedPage
+from pages.item_page import ItemPage
+from pages.login_page import LoginPage
+
+logger = logging.getLogger(__name__)
+
+PageT = TypeVar("PageT", bound=BasePage)
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for comparison (no fragment, no trailing slash)."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), parts.query, ""))
+
+
+class PageRouter:
+    """
+    Hand out page objects for one Playwright page, navigating only when needed.
+
+    The page's own URL is the source of truth for where it is, so navigations
+    done elsewhere (clicks, redirects, pushState) are taken into account.
+    Page objects are created once per type and reused. The router remembers
+    the last feed URL it showed, so back_to_feed() can return with
+    page.go_back() (served from the back/forward cache when the browser
+    keeps one) instead of reloading the feed.
+    """
+
+    def __init__(self, page: Page, settings: Optional[Settings] = None):
+        """
+        Initialize router.
+
+        Args:
+            page: Playwright page object
+            settings: Settings snapshot shared by the page objects (default: get_settings())
+        """
+        self.page = page
+        self.settings = settings or get_settings()
+        self.skipped_navigations = 0
+        self._pages: Dict[type, BasePage] = {}
+        self._feeds: Dict[bool, FeedPage] = {}
+        self._last_feed: Optional[FeedPage] = None
+
+    def is_at(self, url: str) -> bool:
+        """Whether the page is currently showing url."""
+        return normalize_url(self.page.url) == normalize_url(url)
+
+    def goto(self, url: str, wait_until: str = "domcontentloaded", force: bool = False) -> bool:
+        """
+        Navigate to url unless the page is already there.
+
+        Args:
+            url: Target URL
+            wait_until: Load state to wait for when navigating
+            force: Navigate even if already at url (reload)
+
+        Returns:
+            True if a navigation happened
+        """
+        if not force and self.is_at(url):
+            self.skipped_navigations += 1
+            logger.debug("Already at %s, skipping navigation", url)
+            return False
+
+        self.get(BasePage).navigate_to(url, wait_until=wait_until)
+        return True
+
+    def get(self, page_class: Type[PageT]) -> PageT:
+        """
+        Get the page object of a type without navigating.
+
+        Args:
+            page_class: Page object class constructed from the Playwright page
+                alone without navigating (use feed() for FeedPage)
+
+        Returns:
+            Page object bound to this router's page
+        """
+        if page_class not in self._pages:
+            self._pages[page_class] = page_class(self.page, settings=self.settings)
+        return self._pages[page_class]
+
+    def feed(self, viewed_my_profile: bool = True, force: bool = False) -> FeedPage:
+        """
+        Get the feed page, navigating only if the page is not already showing it.
+
+        Args:
+            viewed_my_profile: Whether to use the profile views feed
+            force: Reload even if already on the feed
+
+        Returns:
+            Feed page object
+        """
+        if viewed_my_profile not in self._feeds:
+            self._feeds[viewed_my_profile] = FeedPage(
+                self.page, viewed_my_profile, navigate=False, settings=self.settings
+            )
+
+        feed_page = self._feeds[viewed_my_profile]
+        self.goto(feed_page.url, force=force)
+        self._last_feed = feed_page
+        return feed_page
+
+    def item(self, item_id: str, wait_until: str = "domcontentloaded") -> ItemPage:
+        """
+        Get the page object of an item, navigating only if it is not already shown.
+
+        Args:
+            item_id: Item identifier
+            wait_until: Load state to wait for when navigating
+
+        Returns:
+            Item page object
+        """
+        item_page = self.get(ItemPage)
+        item_page.item_id = item_id
+        self.goto(item_page.item_url(item_id), wait_until=wait_until)
+        return item_page
+
+    def login(self) -> LoginPage:
+        """Get the login page object at BASE_URL."""
+        self.goto(self.settings.BASE_URL)
+        return self.get(LoginPage)
+
+    def back_to_feed(self) -> FeedPage:
+        """
+        Return to the last feed shown, preferring history over a reload.
+
+        Returns:
+            Feed page object
+        """
+        feed_page = self._last_feed
+        if feed_page is None:
+            return self.feed()
+
+        if not self.is_at(feed_page.url):
+            try:
+                self.page.go_back(wait_until="domcontentloaded", timeout=self.settings.TIMEOUT)
+            except Exception as e:
+                logger.debug("History navigation failed: %s", e)
+
+            if not self.is_at(feed_page.url):
+                logger.debug("Previous history entry is not the feed, reloading it")
+                self.goto(feed_page.url)
+
+        return feed_page
@@ -1,23 +1,88 @@
 """Pytest configuration and fixtures for web automation tests."""
 
 import logging
-from typing import Generator
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Generator
 
 import pytest
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 
-from constants.settings import Settings
+from constants.settings import Settings, get_settings, set_settings
 from pages.feed_page import FeedPage
 from pages.item_page import ItemPage
 from pages.login_page import LoginPage
 
 logger = logging.getLogger(__name__)
 
+# Settings holding artifact paths; each xdist worker gets its own subdirectory
+WORKER_PATH_SETTINGS = ("SCREENSHOT_DIR", "REPORT_DIR", "SESSION_DIR", "ASSET_CACHE_DIR")
+
+# Session fixture -> xdist group, checked in order, for --group-by-fixture
+FIXTURE_GROUPS = (("auth_state", "authenticated"), ("browser", "browser"))
+
+
+def pytest_addoption(parser):
+    """Register command-line options for parallel runs."""
+    parser.addoption(
+        "--group-by-fixture",
+        action="store_true",
+        default=False,
+        help="schedule tests sharing the login/browser session fixtures onto the same "
+        "xdist worker (use with -n N --dist loadgroup)",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Mark tests with an xdist_group by the session fixture they depend on.
+
+    Only with --group-by-fixture; tests that already have an xdist_group
+    marker keep it. Unit tests stay ungrouped and spread over all workers.
+    """
+    if not config.getoption("--group-by-fixture"):
+        return
+
+    for item in items:
+        if item.get_closest_marker("xdist_group"):
+            continue
+        for fixture, group in FIXTURE_GROUPS:
+            if fixture in item.fixturenames:
+                item.add_marker(pytest.mark.xdist_group(group))
+                break
+
+
+@pytest.fixture(scope="session")
+def settings(worker_id: str) -> Settings:
+    """
+    Provide settings instance for tests.
+
+    Under pytest-xdist every worker is a separate process, so its snapshot
+    moves artifact paths into a per-worker subdirectory to keep workers from
+    overwriting each other's screenshots and reports. The snapshot is also
+    made the process default, so page objects built without explicit
+    settings use the same paths.
+    """
+    settings = get_settings()
+    if worker_id != "master":
+        settings = set_settings(
+            settings.with_overrides(
+                **{
+                    key: str(Path(getattr(settings, key)) / worker_id)
+                    for key in WORKER_PATH_SETTINGS
+                }
+            )
+        )
+        logger.info(f"Artifact paths isolated for worker {worker_id}")
+    return settings
+
 
 @pytest.fixture(scope="session")
-def settings() -> Settings:
-    """Provide settings instance for tests."""
-    return Settings()
+def user_data_dir(tmp_path_factory: pytest.TempPathFactory, worker_id: str) -> Path:
+    """Browser profile directory private to this worker, for tests that launch a driver."""
+    return tmp_path_factory.mktemp(f"browser_data_{worker_id}")
 
 
 @pytest.fixture(scope="session")
@@ -59,6 +124,48 @@ def context(browser: Browser) -> Generator[BrowserContext, None, None]:
     context.close()
 
 
+@pytest.fixture(scope="session")
+def auth_state(browser: Browser, settings: Settings) -> Dict[str, Any]:
+    """
+    Log in once per session and provide the resulting storage state.
+
+    The dict is shared by every authenticated test; authenticated_page
+    refreshes it in place if the site rejects it.
+    """
+    if not settings.USERNAME or not settings.PASSWORD:
+        pytest.skip("Username and password required for authenticated tests")
+
+    context = browser.new_context(
+        viewport={"width": 1920, "height": 1080}, ignore_https_errors=True
+    )
+    try:
+        page = context.new_page()
+        page.set_default_timeout(settings.TIMEOUT)
+        page.goto(settings.BASE_URL)
+        LoginPage(page).login(settings.USERNAME, settings.PASSWORD)
+        logger.info("Session authenticated, storage state captured")
+        return context.storage_state()
+    except Exception as e:
+        logger.error(f"Session authentication failed: {e}")
+        pytest.fail(f"Failed to authenticate test session: {e}")
+    finally:
+        context.close()
+
+
+@pytest.fixture(scope="function")
+def authenticated_context(
+    browser: Browser, auth_state: Dict[str, Any]
+) -> Generator[BrowserContext, None, None]:
+    """Create new browser context seeded with the session's login state."""
+    context = browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        ignore_https_errors=True,
+        storage_state=auth_state,
+    )
+    yield context
+    context.close()
+
+
 @pytest.fixture(scope="function")
 def page(context: BrowserContext, settings: Settings) -> Generator[Page, None, None]:
     """Create new page for each test."""
@@ -70,22 +177,30 @@ def page(context: BrowserContext, settings: Settings) -> Generator[Page, None, N
 
 
 @pytest.fixture(scope="function")
-def authenticated_page(page: Page, settings: Settings) -> Generator[Page, None, None]:
-    """Provide authenticated page for tests requiring login."""
+def authenticated_page(
+    authenticated_context: BrowserContext, auth_state: Dict[str, Any], settings: Settings
+) -> Generator[Page, None, None]:
+    """Provide authenticated page for tests requiring login, re-logging in if the state is rejected."""
+    page = authenticated_context.new_page()
+    page.set_default_timeout(settings.TIMEOUT)
     login_page = LoginPage(page)
 
-    if not settings.USERNAME or not settings.PASSWORD:
-        pytest.skip("Username and password required for authenticated tests")
-
     try:
         page.goto(settings.BASE_URL)
-        login_page.login(settings.USERNAME, settings.PASSWORD)
+        if not login_page.is_logged_in():
+            logger.warning("Saved session state rejected, logging in again")
+            login_page.login(settings.USERNAME, settings.PASSWORD)
+            auth_state.clear()
+            auth_state.update(authenticated_context.storage_state())
         logger.info("Test page authenticated")
-        yield page
     except Exception as e:
         logger.error(f"Authentication failed: {e}")
+        page.close()
         pytest.fail(f"Failed to authenticate test page: {e}")
 
+    yield page
+    page.close()
+
 
 @pytest.fixture
 def login_page(page: Page) -> LoginPage:
@@ -106,21 +221,24 @@ def item_page(page: Page) -> ItemPage:
 
 
 @pytest.fixture(autouse=True)
-def screenshot_on_failure(request, page: Page, settings: Settings):
+def screenshot_on_failure(request, settings: Settings):
     """Automatically take screenshot on test failure."""
+    # Only browser tests have a page; unit tests run without launching one
+    page = None
+    for name in ("authenticated_page", "page"):
+        if name in request.fixturenames:
+            page = request.getfixturevalue(name)
+            break
     yield
 
     # Check if test failed (handle cases where rep_call doesn't exist)
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
+    if page and hasattr(request.node, "rep_call") and request.node.rep_call.failed:
         try:
-            from datetime import datetime
-            from pathlib import Path
-
             screenshot_dir = Path(settings.SCREENSHOT_DIR)
             screenshot_dir.mkdir(parents=True, exist_ok=True)
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            test_name = request.node.name
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            test_name = re.sub(r"[^\w.-]", "_", request.node.name)
             filename = f"failure_{test_name}_{timestamp}.png"
             filepath = screenshot_dir / filename
 
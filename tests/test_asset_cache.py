@@ -0,0 +1,133 @@
+"""Tests for the persistent static asset cache."""
+
+import time
+
+from utils.asset_cache import AssetCache, freshness_lifetime
+
+URL = "https://example-site.com/static/app.js"
+
+
+def test_freshness_lifetime():
+    """Test Cache-Control and Expires parsing."""
+    assert freshness_lifetime({"cache-control": "public, max-age=600"}) == 600
+    assert freshness_lifetime({"cache-control": "no-cache"}) == 0
+    assert freshness_lifetime({"cache-control": "no-store"}) is None
+    assert freshness_lifetime({"expires": "Thu, 01 Jan 1970 00:00:00 GMT"}) == 0
+    assert freshness_lifetime({}) == 0
+
+
+def test_store_and_lookup_fresh(tmp_path):
+    """Test a cacheable response is served fresh and survives a reload."""
+    cache = AssetCache(str(tmp_path))
+    assert cache.store(URL, 200, {"Cache-Control": "max-age=600", "Content-Length": "3"}, b"abc")
+
+    entry = cache.lookup(URL)
+    assert cache.is_fresh(entry)
+    assert "content-length" not in entry["headers"]
+    assert cache.read(entry) == b"abc"
+
+    cache.save()
+    reloaded = AssetCache(str(tmp_path))
+    assert reloaded.read(reloaded.lookup(URL)) == b"abc"
+
+
+def test_uncacheable_responses_not_stored(tmp_path):
+    """Test no-store, non-200 and unvalidatable zero-lifetime responses are skipped."""
+    cache = AssetCache(str(tmp_path))
+    assert not cache.store(URL, 200, {"cache-control": "no-store"}, b"a")
+    assert not cache.store(URL, 404, {"cache-control": "max-age=60"}, b"a")
+    assert not cache.store(URL, 200, {"cache-control": "no-cache"}, b"a")
+    assert cache.lookup(URL) is None
+
+
+def test_stale_entry_revalidation(tmp_path):
+    """Test stale entries carry validators and a 304 makes them fresh again."""
+    cache = AssetCache(str(tmp_path))
+    cache.store(URL, 200, {"cache-control": "no-cache", "etag": '"v1"'}, b"abc")
+
+    entry = cache.lookup(URL)
+    assert not cache.is_fresh(entry)
+    assert cache.conditional_headers(entry) == {"if-none-match": '"v1"'}
+
+    cache.refresh(entry, {"Cache-Control": "max-age=60"})
+    assert cache.is_fresh(entry)
+
+
+def test_identical_bodies_stored_once(tmp_path):
+    """Test content addressing deduplicates bodies across URLs."""
+    cache = AssetCache(str(tmp_path))
+    cache.store(URL, 200, {"cache-control": "max-age=60"}, b"same")
+    cache.store(URL + "?v=2", 200, {"cache-control": "max-age=60"}, b"same")
+
+    assert len(list((tmp_path / "objects").rglob("*"))) == 2  # one prefix dir, one object
+    assert cache.total_bytes == 4
+
+
+def test_lru_eviction(tmp_path):
+    """Test the least recently used entry is evicted when over the size cap."""
+    cache = AssetCache(str(tmp_path), max_bytes=10)
+    headers = {"cache-control": "max-age=60"}
+    cache.store("https://a/1.js", 200, headers, b"11111")
+    time.sleep(0.01)
+    cache.store("https://a/2.js", 200, headers, b"22222")
+    time.sleep(0.01)
+    cache.read(cache.lookup("https://a/1.js"))
+    time.sleep(0.01)
+    cache.store("https://a/3.js", 200, headers, b"33333")
+
+    assert cache.lookup("https://a/2.js") is None
+    assert cache.lookup("https://a/1.js") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.total_bytes == 10
+
+
+def test_replaced_body_is_deleted(tmp_path):
+    """Test storing a new body for a URL removes the old one unless still referenced."""
+    cache = AssetCache(str(tmp_path))
+    headers = {"cache-control": "max-age=60"}
+    cache.store(URL, 200, headers, b"old")
+    cache.store(URL, 200, headers, b"old")
+    cache.store(URL, 200, headers, b"new!")
+
+    assert cache.read(cache.lookup(URL)) == b"new!"
+    assert len([path for path in (tmp_path / "objects").rglob("*") if path.is_file()]) == 1
+    assert cache.total_bytes == 4
+
+
+def test_concurrent_saves_merge_indexes(tmp_path):
+    """Test caches sharing a directory keep each other's entries when saving."""
+    headers = {"cache-control": "max-age=60"}
+    first, second = AssetCache(str(tmp_path)), AssetCache(str(tmp_path))
+    first.store("https://a/1.js", 200, headers, b"one")
+    second.store("https://a/2.js", 200, headers, b"two")
+
+    first.save()
+    second.save()
+
+    reloaded = AssetCache(str(tmp_path))
+    assert reloaded.read(reloaded.lookup("https://a/1.js")) == b"one"
+    assert reloaded.read(reloaded.lookup("https://a/2.js")) == b"two"
+    assert reloaded.total_bytes == 6
+
+
+def test_merge_keeps_newest_entry_and_evictions(tmp_path):
+    """Test the more recently used entry wins and URLs evicted here stay evicted."""
+    headers = {"cache-control": "max-age=60"}
+    seed = AssetCache(str(tmp_path))
+    seed.store("https://a/1.js", 200, headers, b"11111")
+    seed.store("https://a/2.js", 200, headers, b"22222")
+    seed.save()
+
+    first, second = AssetCache(str(tmp_path), max_bytes=10), AssetCache(str(tmp_path))
+    time.sleep(0.01)
+    second.store("https://a/2.js", 200, headers, b"2222b")
+    second.save()
+    time.sleep(0.01)
+    first.store("https://a/3.js", 200, headers, b"33333")  # evicts 1.js
+    first.save()
+
+    reloaded = AssetCache(str(tmp_path))
+    assert reloaded.lookup("https://a/1.js") is None
+    assert reloaded.read(reloaded.lookup("https://a/2.js")) == b"2222b"
+    assert reloaded.lookup("https://a/3.js") is not None
+    assert reloaded.total_bytes <= 10
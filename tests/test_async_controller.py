@@ -0,0 +1,157 @@
+"""Tests for concurrent item processing in the asyncio controller against fake pages."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from controller.async_controller import AsyncController
+from controller.multi_account import FairScheduler
+
+
+def run(coro):
+    """Run a coroutine on a separate thread; sync Playwright fixtures may own this loop."""
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class FakePage:
+    """Stand-in async page whose context opens more fake pages."""
+
+    def __init__(self, opened=None):
+        self.opened = opened if opened is not None else []
+        self.context = self
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self.opened)
+        self.opened.append(page)
+        return page
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+def controller_with(item_action, concurrency):
+    controller = AsyncController(FakePage(), concurrency=concurrency)
+    controller.facade.item_action = item_action
+    return controller
+
+
+def test_process_items_limits_pages_in_flight():
+    """Test at most `concurrency` items run at once, each worker on its own page."""
+    active = 0
+    peak = 0
+    pages_used = set()
+
+    async def item_action(item_id, page=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        pages_used.add(id(page))
+        await asyncio.sleep(0.001)
+        active -= 1
+        return {"id": item_id}
+
+    controller = controller_with(item_action, concurrency=3)
+    results = []
+
+    summary = run(
+        controller.process_items(
+            list(range(10)), on_result=lambda item_id, details: results.append(details)
+        )
+    )
+
+    assert (summary.total, summary.succeeded, summary.failed, summary.workers) == (10, 10, 0, 3)
+    assert peak == 3
+    assert len(pages_used) == len(controller.page.opened) == 3
+    assert sorted(result["id"] for result in results) == list(range(10))
+    assert all(page.closed for page in controller.page.opened)
+
+
+def test_process_items_counts_failures_and_continues():
+    """Test a failing item is counted and the other items are still processed."""
+
+    async def item_action(item_id, page=None):
+        await asyncio.sleep(0)
+        if item_id % 3 == 0:
+            raise RuntimeError(f"item {item_id} broke")
+        return {"id": item_id}
+
+    controller = controller_with(item_action, concurrency=2)
+
+    summary = run(controller.process_items(list(range(7))))
+
+    assert (summary.total, summary.succeeded, summary.failed) == (7, 4, 3)
+    assert all(page.closed for page in controller.page.opened)
+
+
+def test_process_items_without_items_opens_no_pages():
+    """Test an empty item list returns at once without opening worker pages."""
+    controller = controller_with(None, concurrency=2)
+
+    summary = run(controller.process_items([]))
+
+    assert summary.total == 0
+    assert controller.page.opened == []
+
+
+def test_process_items_waits_for_scheduler_slots():
+    """Test items only run while holding a scheduler slot, even with more workers."""
+    active = 0
+    peak = 0
+
+    async def item_action(item_id, page=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return {"id": item_id}
+
+    scheduler = FairScheduler(limit=1)
+    controller = controller_with(item_action, concurrency=3)
+    controller.scheduler = scheduler
+
+    summary = run(controller.process_items(list(range(5))))
+
+    assert summary.succeeded == 5
+    assert peak == 1
+    assert scheduler.in_use == 0
+
+
+def test_failing_result_callback_fails_the_item():
+    """Test an item whose result cannot be handed off counts as failed only."""
+
+    async def item_action(item_id, page=None):
+        return {"id": item_id}
+
+    def on_result(item_id, details):
+        if item_id == 1:
+            raise RuntimeError("result writer failed")
+
+    controller = controller_with(item_action, concurrency=2)
+
+    summary = run(controller.process_items([0, 1, 2], on_result=on_result))
+
+    assert (summary.total, summary.succeeded, summary.failed) == (3, 2, 1)
+
+
+def test_process_items_awaits_async_result_callback():
+    """Test an awaitable returned by on_result is awaited before the item counts."""
+    stored = []
+
+    async def item_action(item_id, page=None):
+        return {"id": item_id}
+
+    async def on_result(item_id, details):
+        await asyncio.sleep(0)
+        stored.append(item_id)
+
+    controller = controller_with(item_action, concurrency=2)
+
+    summary = run(controller.process_items([0, 1, 2], on_result=on_result))
+
+    assert summary.succeeded == 3
+    assert sorted(stored) == [0, 1, 2]
@@ -0,0 +1,56 @@
+"""Tests for the synthetic benchmark site and the regression comparison."""
+
+import http.cookiejar
+import urllib.request
+
+import pytest
+
+from benchmarks.run_benchmarks import compare
+from benchmarks.synthetic_site import SITE_SELECTORS, SyntheticSite
+from utils.html_extract import extract_text
+
+
+@pytest.fixture
+def site():
+    with SyntheticSite(items=5, payload_kb=2) as running:
+        yield running
+
+
+def test_login_sets_session_and_shows_feed(site):
+    """Test the login form posts to a session cookie and redirects to the feed."""
+    opener = urllib.request.build_opener(
+        urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+    )
+    assert 'name="username"' in opener.open(f"{site.url}/").read().decode()
+
+    response = opener.open(f"{site.url}/login", data=b"username=bench&password=bench")
+    feed = response.read().decode()
+
+    assert response.url == f"{site.url}/"
+    assert feed.count('class="item"') == 5
+    assert extract_text(feed, SITE_SELECTORS["LOGGED_IN_INDICATOR"]) is not None
+    assert extract_text(opener.open(f"{site.url}/item/3").read().decode(), ".details")
+
+
+def test_static_assets_are_cacheable(site):
+    """Test static assets carry validators the asset cache can use."""
+    response = urllib.request.urlopen(f"{site.url}/static/app.js")
+
+    assert response.headers["Cache-Control"] == "public, max-age=3600"
+    assert response.headers["ETag"]
+
+
+def test_compare_flags_throughput_drops_beyond_threshold():
+    """Test only scenarios slower than the allowed regression are reported."""
+    baseline = {
+        "scenarios": [{"name": "a", "items_per_sec": 10}, {"name": "b", "items_per_sec": 10}]
+    }
+    report = {
+        "scenarios": [
+            {"name": "a", "items_per_sec": 8.5},
+            {"name": "b", "items_per_sec": 7.0},
+            {"name": "new", "items_per_sec": 1.0},
+        ]
+    }
+
+    assert compare(report, baseline, max_regression=0.2) == ["b: 7.0 items/s (baseline 10)"]
@@ -0,0 +1,160 @@
+"""Tests for item processing in the sync controller against fake pages."""
+
+from controller.controller import Controller
+
+FEED_URL = "https://example.com/feed"
+
+
+class _FakeTab:
+    """Stand-in sync page whose context opens more fake tabs."""
+
+    def __init__(self, url="about:blank", opened=None):
+        self.url = url
+        self.opened = opened if opened is not None else []
+        self.context = self
+        self.closed = False
+
+    def new_page(self):
+        tab = _FakeTab(opened=self.opened)
+        self.opened.append(tab)
+        return tab
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def goto(self, url, **kwargs):
+        self.url = url
+
+    def wait_for_load_state(self, state=None, **kwargs):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _controller(concurrency=1):
+    controller = Controller(_FakeTab(FEED_URL), concurrency=concurrency)
+
+    def item_action(item_id, page=None, use_http=True):
+        (page or controller.page).goto(f"https://example.com/item/{item_id}")
+        return {"id": item_id}
+
+    controller.facade.item_action = item_action
+    return controller
+
+
+def _feed_stream(page, count):
+    """Yield ids like FeedPage.stream_items, which reads the feed shown on page."""
+    for item_id in range(count):
+        if page.url != FEED_URL:
+            return
+        yield item_id
+
+
+def test_stream_keeps_reading_feed_while_items_are_processed():
+    """Test streamed items are processed in a worker tab, leaving the feed page in place."""
+    controller = _controller(concurrency=1)
+
+    summary = controller.process_items(_feed_stream(controller.page, 5))
+
+    assert (summary.total, summary.succeeded) == (5, 5)
+    assert controller.page.url == FEED_URL
+    assert len(controller.page.opened) == 1
+    assert controller.page.opened[0].closed
+
+
+def test_list_with_concurrency_one_uses_controller_page():
+    """Test a collected list is processed serially on the controller's page."""
+    controller = _controller(concurrency=1)
+
+    summary = controller.process_items([1, 2])
+
+    assert summary.succeeded == 2
+    assert controller.page.opened == []
+    assert controller.page.url.endswith("/item/2")
+
+
+def test_failing_result_callback_fails_the_item():
+    """Test an item whose result cannot be handed off counts as failed only."""
+    controller = _controller(concurrency=1)
+    failures = []
+
+    def on_result(item_id, details):
+        if item_id == 2:
+            raise RuntimeError("result writer failed")
+
+    summary = controller.process_items(
+        [1, 2, 3], on_result=on_result, on_failure=lambda item_id, e: failures.append(item_id)
+    )
+
+    assert (summary.succeeded, summary.failed) == (2, 1)
+    assert failures == [2]
+
+
+def test_run_with_failures_resumes_remaining_items(settings, tmp_path):
+    """Test a run whose browser dies mid-way is not finished and resumes the rest."""
+    run_settings = settings.with_overrides(
+        REPORT_DIR=str(tmp_path), RESULT_SINK="none", RESUME=True, FEED_STREAM=False
+    )
+    processed = []
+    collections = []
+
+    def controller_with(broken_from=None):
+        controller = Controller(_FakeTab(FEED_URL), settings=run_settings)
+        controller.facade.login = lambda username=None, password=None: None
+
+        def collect_item_ids(filter_func=None, limit=None):
+            collections.append(1)
+            return list(range(6))
+
+        def item_action(item_id, page=None, use_http=True):
+            if broken_from is not None and item_id >= broken_from:
+                raise RuntimeError("browser closed")
+            processed.append(item_id)
+            return {"id": item_id}
+
+        controller.facade.collect_item_ids = collect_item_ids
+        controller.facade.item_action = item_action
+        return controller
+
+    first = controller_with(broken_from=3).run("user", "secret")
+    second = controller_with().run("user", "secret")
+    third = controller_with().run("user", "secret")
+
+    assert (first.succeeded, first.failed) == (3, 3)
+    assert (second.total, second.succeeded) == (3, 3)
+    assert processed == [0, 1, 2, 3, 4, 5, 0, 1, 2, 3, 4, 5]
+    # Only the first and the third (after the resumed run finished) collect the feed
+    assert len(collections) == 2
+    assert third.succeeded == 6
+
+
+def test_collect_fallback_returns_to_feed_after_failed_click():
+    """Test every click-through fallback starts from the feed, even after a failure."""
+    controller = _controller()
+    facade = controller.facade
+    clicks = []
+
+    class _Item:
+        def __init__(self, index):
+            self.index = index
+
+        def click(self):
+            clicks.append((self.index, controller.page.url))
+            controller.page.goto(f"https://example.com/item/{self.index}")
+            if self.index == 0:
+                raise RuntimeError("timed out")
+
+    class _Feed:
+        def get_item_records(self, limit):
+            return [{"index": 0}, {"index": 1}]
+
+        def item_locator(self, index):
+            return _Item(index)
+
+    facade.router.feed = lambda **kwargs: _Feed()
+    facade.router.back_to_feed = lambda: controller.page.goto(FEED_URL)
+
+    facade.collect_item_ids(id_pattern=r"/item/(\d+)")
+
+    assert clicks == [(0, FEED_URL), (1, FEED_URL)]
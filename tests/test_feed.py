@@ -36,6 +36,26 @@ def test_iterate_over_items(authenticated_page: Page):
     # assert len(results) <= 5  # Uncomment when FEED_ITEMS is configured
 
 
+def test_iterate_over_items_bulk(authenticated_page: Page):
+    """Test iterating over feed items as plain records."""
+    feed_page = FeedPage(authenticated_page, viewed_my_profile=True)
+
+    results = feed_page.iterate_over_items(lambda record: record["href"], limit=5, bulk=True)
+
+    assert isinstance(results, list)
+    # assert len(results) <= 5  # Uncomment when FEED_ITEMS is configured
+
+
+def test_get_item_records(authenticated_page: Page):
+    """Test bulk extraction of feed item records."""
+    feed_page = FeedPage(authenticated_page, viewed_my_profile=True)
+    records = feed_page.get_item_records(limit=5)
+
+    assert isinstance(records, list)
+    for record in records:
+        assert {"index", "id", "text", "href", "attributes"} <= record.keys()
+
+
 def test_get_item_count(authenticated_page: Page):
     """Test getting item count from feed."""
     feed_page = FeedPage(authenticated_page, viewed_my_profile=True)
@@ -0,0 +1,182 @@
+"""Tests for feed record extraction and streaming against a fake page."""
+
+import pytest
+
+import pages.feed_page as feed_module
+from pages.feed_page import (
+    ADVANCE_FEED_JS,
+    FEED_ITEM_RECORDS_JS,
+    FEED_NEW_RECORDS_JS,
+    FEED_SIGNATURE_JS,
+    FeedPage,
+)
+
+
+class _FakeItems:
+    """Locator of the rendered feed items, evaluating the known scripts in Python."""
+
+    def __init__(self, page):
+        self.page = page
+
+    def _elements(self):
+        return self.page.rendered if self.page.on_feed else []
+
+    def all(self):
+        return list(self._elements())
+
+    def evaluate_all(self, script, arg=None):
+        elements = self._elements()
+        if script == FEED_ITEM_RECORDS_JS:
+            # Mirrors JS `limit ?? elements.length`: only null/undefined mean "all"
+            end = len(elements) if arg is None else arg
+            return [_record(element, index) for index, element in enumerate(elements[:end])]
+        if script == FEED_NEW_RECORDS_JS:
+            start, head = arg
+            first = elements[0] if elements else ""
+            begin = start if first == head and start <= len(elements) else 0
+            records = [_record(element, index) for index, element in enumerate(elements)]
+            self.page.transferred += len(records) - begin
+            return {"count": len(elements), "head": first, "records": records[begin:]}
+        if script == FEED_SIGNATURE_JS:
+            return f"{len(elements)}|{elements[:1]}|{elements[-1:]}"
+        if script == ADVANCE_FEED_JS:
+            self.page.scrolls += 1
+            if self.page.more:
+                self.page.rendered = self.page.more.pop(0)
+            return None
+        raise AssertionError(f"unexpected script: {script[:40]}")
+
+
+class _FakeLocator:
+    def __init__(self, page):
+        self.page = page
+
+    def wait_for(self, **kwargs):
+        pass
+
+    def locator(self, selector):
+        return _FakeItems(self.page)
+
+
+class _FakeNextLink:
+    """FEED_NEXT_PAGE link, visible while the fake page has further pages."""
+
+    def __init__(self, page):
+        self.page = page
+        self.first = self
+
+    def is_visible(self):
+        return bool(self.page.next_pages)
+
+    def click(self):
+        self.page.rendered = self.page.next_pages.pop(0)
+
+
+class _FakeFeedPage:
+    """
+    Stand-in page showing a list of feed items.
+
+    Each scroll replaces the rendered items with the next entry of `more`
+    (so appends and recycled windows can both be modelled); following the
+    next-page link shows the next entry of `next_pages`.
+    """
+
+    def __init__(self, count, more=(), next_pages=()):
+        self.rendered = [f"item-{n}" for n in range(count)]
+        self.more = [list(items) for items in more]
+        self.next_pages = [list(items) for items in next_pages]
+        self.on_feed = True
+        self.url = "about:blank"
+        self.transferred = 0
+        self.scrolls = 0
+
+    def locator(self, selector):
+        if selector == feed_module.FEED_NEXT_PAGE:
+            return _FakeNextLink(self)
+        return _FakeLocator(self)
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+    def wait_for_load_state(self, state=None, **kwargs):
+        pass
+
+
+def _record(element, index):
+    return {
+        "index": index,
+        "id": element,
+        "text": element,
+        "href": f"https://example.com/item/{element}",
+        "attributes": {},
+    }
+
+
+def _items(*numbers):
+    return [f"item-{n}" for n in numbers]
+
+
+def _stream(page, **kwargs):
+    kwargs.setdefault("settle_timeout", 10)
+    kwargs.setdefault("poll_interval", 0)
+    feed_page = FeedPage(page, navigate=False)
+    return [record["item_id"] for record in feed_page.stream_items(**kwargs)]
+
+
+@pytest.fixture
+def feed_selector(monkeypatch):
+    monkeypatch.setattr(feed_module, "FEED_ITEMS", "#feed")
+
+
+@pytest.fixture
+def next_page_selector(monkeypatch):
+    monkeypatch.setattr(feed_module, "FEED_NEXT_PAGE", "a.next")
+
+
+@pytest.mark.parametrize("limit, expected", [(None, 5), (0, 5), (3, 3)])
+def test_limit_zero_means_no_limit(feed_selector, limit, expected):
+    """Test bulk and locator modes treat limit=0 the same, as no limit."""
+    feed_page = FeedPage(_FakeFeedPage(5), navigate=False)
+
+    assert len(feed_page.get_item_records(limit)) == expected
+    assert len(feed_page.iterate_over_items(lambda item: item, limit, bulk=True)) == expected
+    assert len(feed_page.iterate_over_items(lambda item: item, limit)) == expected
+
+
+def test_stream_extracts_only_new_items(feed_selector):
+    """Test an append-only feed yields every item once, transferring each record once."""
+    page = _FakeFeedPage(3, more=[_items(*range(6)), _items(*range(9))])
+
+    assert _stream(page) == _items(*range(9))
+    assert page.transferred == 9
+
+
+def test_stream_ends_after_idle_rounds(feed_selector):
+    """Test the stream stops after max_idle_rounds rounds without new items."""
+    page = _FakeFeedPage(2)
+
+    assert _stream(page, max_idle_rounds=3) == _items(0, 1)
+    assert page.scrolls == 3
+
+
+def test_stream_handles_recycled_items(feed_selector):
+    """Test a virtualized list that replaces its first items is re-read and deduplicated."""
+    page = _FakeFeedPage(4, more=[_items(2, 3, 4, 5), _items(4, 5, 6)])
+
+    assert _stream(page) == _items(*range(7))
+
+
+def test_stream_follows_next_page(feed_selector, next_page_selector):
+    """Test an exhausted page continues on the next one, reading it from the start."""
+    page = _FakeFeedPage(2, next_pages=[_items(2, 3), _items(3, 4)])
+
+    assert _stream(page) == _items(*range(5))
+    assert page.next_pages == []
+
+
+def test_stream_limit(feed_selector):
+    """Test the stream stops at limit without scrolling further."""
+    page = _FakeFeedPage(5, more=[_items(*range(10))])
+
+    assert _stream(page, limit=3) == _items(0, 1, 2)
+    assert page.scrolls == 0
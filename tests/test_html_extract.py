@@ -0,0 +1,66 @@
+"""Tests for the browserless HTML selector matcher."""
+
+import pytest
+
+from utils.html_extract import UnsupportedSelectorError, extract_text, parse_html, select_first
+
+HTML = """
+<html><body>
+  <div id="main" class="item card">
+    <h1 data-role="title">First <b>item</b></h1>
+    <section class="details"><p>Hello&nbsp;World</p><br>line2 &amp; more</section>
+  </div>
+  <div class="item"><span class="details">Second</span></div>
+  <script>var x = "<p class='details'>not html</p>";</script>
+</body></html>
+"""
+
+
+def test_extract_text_by_class():
+    """Test text of the first match is collected, with entities decoded."""
+    assert extract_text(HTML, ".details") == "Hello\xa0World\nline2 & more"
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        ("#main h1", "First item"),
+        ("div.card > h1", "First item"),
+        ("[data-role=title]", "First item"),
+        ('h1[data-role="title"]', "First item"),
+        ("div > span.details", "Second"),
+        ("aside, span", "Second"),
+    ],
+)
+def test_extract_text_selectors(selector, expected):
+    """Test supported selector forms and combinators."""
+    assert extract_text(HTML, selector) == expected
+
+
+def test_child_combinator_is_strict():
+    """Test '>' does not match deeper descendants."""
+    root = parse_html(HTML)
+    assert select_first(root, "#main .details") is not None
+    assert select_first(root, "body > .details") is None
+
+
+@pytest.mark.parametrize(
+    "selector",
+    ['[title="a b, c"]', "span[title='a b, c']", '[data-x="1,2"]', 'div > [title="a b, c"]'],
+)
+def test_quoted_attribute_values_keep_spaces_and_commas(selector):
+    """Test separators inside quoted attribute values do not split the selector."""
+    html = '<div><span title="a b, c" data-x="1,2">Quoted</span></div>'
+    assert extract_text(html, selector) == "Quoted"
+
+
+def test_extract_text_no_match():
+    """Test missing elements return None rather than raising."""
+    assert extract_text(HTML, ".missing") is None
+
+
+@pytest.mark.parametrize("selector", ["text=Hello", "li:nth-child(2)", "div >> span", "a + b"])
+def test_unsupported_selectors_raise(selector):
+    """Test selectors the matcher cannot evaluate are reported, not misread."""
+    with pytest.raises(UnsupportedSelectorError):
+        extract_text(HTML, selector)
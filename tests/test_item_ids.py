@@ -0,0 +1,40 @@
+"""Tests for item id resolution from feed records."""
+
+import re
+
+from utils.item_ids import match_item_id, resolve_item_id
+
+
+def test_match_item_id_from_url():
+    """Test default pattern extracts the id segment of an item URL."""
+    assert match_item_id("https://example-site.com/item/abc123?ref=feed") == "abc123"
+
+
+def test_match_item_id_no_match():
+    """Test URLs without an item id resolve to None."""
+    assert match_item_id("https://example-site.com/feed") is None
+    assert match_item_id(None) is None
+
+
+def test_match_item_id_custom_pattern():
+    """Test custom patterns, with and without a capture group."""
+    assert match_item_id("/profiles/u-42/", r"/profiles/([^/]+)") == "u-42"
+    assert match_item_id("/p/9876", re.compile(r"\d+")) == "9876"
+
+
+def test_resolve_item_id_prefers_data_attribute():
+    """Test data attributes win over the link href."""
+    record = {"href": "/item/from-href", "attributes": {"data-id": "from-attr"}}
+    assert resolve_item_id(record) == "from-attr"
+
+
+def test_resolve_item_id_from_href():
+    """Test href is used when no id attribute is present."""
+    record = {"href": "https://example-site.com/item/42", "attributes": {"class": "item"}}
+    assert resolve_item_id(record) == "42"
+
+
+def test_resolve_item_id_unresolved():
+    """Test records without attributes or matching href resolve to None."""
+    assert resolve_item_id({"href": None, "attributes": {}}) is None
+    assert resolve_item_id({"href": "/about"}, attributes=()) is None
@@ -0,0 +1,137 @@
+"""Tests for correlation ids, JSON log records and the queued logging mode."""
+
+import asyncio
+import json
+import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.log_context import CorrelationFilter, JsonFormatter, item_id_var, log_context, run_id_var
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Put the root logger's handlers and level back after reconfiguring logging."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    from logger import stop_logging
+
+    stop_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def make_record(message: str, *args) -> logging.LogRecord:
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, message, args, None)
+    CorrelationFilter().filter(record)
+    return record
+
+
+def test_log_context_sets_and_restores_ids():
+    """Test nested contexts override and then restore the outer ids."""
+    with log_context(run_id="run1"):
+        with log_context(item_id=42):
+            assert (run_id_var.get(), item_id_var.get()) == ("run1", "42")
+        assert (run_id_var.get(), item_id_var.get()) == ("run1", None)
+    assert run_id_var.get() is None
+
+
+def test_item_ids_follow_asyncio_tasks():
+    """Test concurrent tasks each see their own item id."""
+
+    async def work(item_id):
+        with log_context(item_id=item_id):
+            await asyncio.sleep(0)
+            return make_record("processing").item_id
+
+    async def main():
+        return await asyncio.gather(*(work(i) for i in range(3)))
+
+    # Run on a separate thread; sync Playwright fixtures may own this thread's event loop
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(asyncio.run, main()).result() == ["0", "1", "2"]
+
+
+def test_json_formatter_includes_correlation_ids():
+    """Test records are one JSON object with message args merged and ids attached."""
+    with log_context(run_id="run1", item_id="7"):
+        record = make_record("Item %s done", "7")
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "Item 7 done"
+    assert entry["level"] == "INFO" and entry["logger"] == "app"
+    assert (entry["run_id"], entry["item_id"]) == ("run1", "7")
+
+
+def test_queued_json_logging(tmp_path, restore_root_logger):
+    """Test the queue mode writes JSON lines from the listener thread with the caller's ids."""
+    from logger import configure_application_logging, stop_logging
+
+    log_file = tmp_path / "app.log"
+    configure_application_logging(
+        log_level="INFO", log_file=str(log_file), use_queue=True, json_format=True
+    )
+    assert isinstance(logging.getLogger().handlers[0], logging.handlers.QueueHandler)
+
+    with log_context(run_id="run1", item_id="9"):
+        logging.getLogger("app").info("Item %s details: %s", "9", {"title": "x"})
+    logging.getLogger("app").debug("suppressed %s", "never formatted")
+    stop_logging()
+
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    entry = next(e for e in entries if e["logger"] == "app")
+    assert entry["message"] == "Item 9 details: {'title': 'x'}"
+    assert (entry["run_id"], entry["item_id"]) == ("run1", "9")
+    assert entry["thread"] == "MainThread"
+    assert not any("suppressed" in e["message"] for e in entries)
+
+
+@pytest.mark.parametrize("json_format", [True, False])
+def test_queued_logging_keeps_tracebacks(tmp_path, restore_root_logger, json_format):
+    """Test exceptions logged in queue mode keep their traceback apart from the message."""
+    from logger import configure_application_logging, stop_logging
+
+    log_file = tmp_path / "app.log"
+    configure_application_logging(
+        log_level="INFO", log_file=str(log_file), use_queue=True, json_format=json_format
+    )
+    try:
+        raise ValueError("bad item")
+    except ValueError:
+        logging.getLogger("app").exception("Item %s failed", "3")
+    stop_logging()
+
+    text = log_file.read_text()
+    if json_format:
+        entry = next(json.loads(line) for line in text.splitlines() if '"app"' in line)
+        assert entry["message"] == "Item 3 failed"
+        assert "ValueError: bad item" in entry["exc_info"]
+    else:
+        assert "Item 3 failed\nTraceback" in text and "ValueError: bad item" in text
+
+
+def test_logging_config_reproduces_configuration(tmp_path, restore_root_logger):
+    """Test a worker process can repeat the parent's configuration from logging_config."""
+    from logger import configure_application_logging, logging_config
+
+    log_file = tmp_path / "app.log"
+    configure_application_logging(
+        log_level="WARNING", log_file=str(log_file), use_queue=False, json_format=True
+    )
+    config = logging_config()
+    assert config["log_level"] == "WARNING" and config["log_file"] == str(log_file)
+
+    configure_application_logging(**config)
+    logging.getLogger("shard").warning("from a shard")
+
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert entries[-1]["message"] == "from a shard"
+    assert logging.getLogger().level == logging.WARNING
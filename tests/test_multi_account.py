@@ -0,0 +1,216 @@
+"""Tests for account files, fair slot scheduling and scheduled async item processing."""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from controller.async_controller import AsyncController
+from controller.multi_account import FairScheduler, load_accounts
+from driver import AsyncPlaywrightDriver
+from utils.exceptions import ConfigurationError
+
+
+def run(coro):
+    """Run a coroutine on a separate thread; sync Playwright fixtures may own this loop."""
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class FakePage:
+    """Stand-in async page whose context opens more fake pages."""
+
+    def __init__(self, opened=None):
+        self.opened = opened if opened is not None else []
+        self.context = self
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self.opened)
+        self.opened.append(page)
+        return page
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+def write_accounts(tmp_path, entries):
+    path = tmp_path / "accounts.json"
+    path.write_text(json.dumps(entries))
+    return path
+
+
+def test_load_accounts(tmp_path, monkeypatch):
+    """Test names default to a file-safe username and passwords can come from the environment."""
+    monkeypatch.setenv("SECOND_PASSWORD", "from-env")
+    path = write_accounts(
+        tmp_path,
+        [
+            {"username": "alice@example.com", "password": "a"},
+            {"username": "bob", "password_env": "SECOND_PASSWORD", "name": "team-b"},
+        ],
+    )
+
+    first, second = load_accounts(path)
+
+    assert (first.name, first.username, first.password) == (
+        "alice_example.com",
+        "alice@example.com",
+        "a",
+    )
+    assert (second.name, second.password) == ("team-b", "from-env")
+    assert "from-env" not in repr(second)
+
+
+@pytest.mark.parametrize(
+    "entries, message",
+    [
+        ([], "non-empty"),
+        ([{"password": "x"}], "no username"),
+        ([{"username": "a", "password_env": "UNSET_PASSWORD_VAR"}], "no password"),
+        (
+            [{"username": "a", "password": "x"}, {"username": "b", "password": "y", "name": "a"}],
+            "Duplicate",
+        ),
+    ],
+)
+def test_load_accounts_rejects_bad_files(tmp_path, entries, message):
+    """Test malformed account lists fail with ConfigurationError."""
+    with pytest.raises(ConfigurationError, match=message):
+        load_accounts(write_accounts(tmp_path, entries))
+
+
+def test_scheduler_takes_turns():
+    """Test a busy client cannot starve others: slots rotate between waiting clients."""
+    scheduler = FairScheduler(limit=1)
+    order = []
+
+    async def work(key, count):
+        for _ in range(count):
+            async with scheduler.slot(key):
+                order.append(key)
+                await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(work("big", 5), work("small", 2), work("tiny", 1))
+
+    run(main())
+
+    assert order[:6] == ["big", "small", "tiny", "big", "small", "big"]
+    assert order.count("big") == 5
+    assert scheduler.in_use == 0
+
+
+def test_scheduler_limits_slots_and_survives_cancellation():
+    """Test no more than limit slots are held and cancelled waiters give theirs back."""
+    scheduler = FairScheduler(limit=2)
+    peak = 0
+
+    async def work(key):
+        nonlocal peak
+        async with scheduler.slot(key):
+            peak = max(peak, scheduler.in_use)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        tasks = [asyncio.create_task(work(k % 3)) for k in range(9)]
+        await asyncio.sleep(0)
+        tasks[-1].cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    run(main())
+
+    assert peak == 2
+    assert scheduler.in_use == 0
+
+
+def test_controllers_share_scheduler_slots():
+    """Test accounts' item workers only run while holding a shared slot, in turns."""
+    scheduler = FairScheduler(limit=2)
+    active = 0
+    peak = 0
+    processed = []
+
+    def controller_for(account):
+        controller = AsyncController(FakePage(), concurrency=2, scheduler=scheduler)
+
+        async def item_action(item_id, page=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            processed.append(account)
+            return {"id": item_id}
+
+        controller.facade.item_action = item_action
+        return controller
+
+    first, second = controller_for("a"), controller_for("b")
+
+    async def main():
+        return await asyncio.gather(
+            first.process_items(list(range(6))), second.process_items(list(range(2)))
+        )
+
+    summaries = run(main())
+
+    assert [summary.succeeded for summary in summaries] == [6, 2]
+    assert peak == 2
+    # The short account is served in the second round instead of after the long one
+    assert processed[:4] == ["a", "a", "b", "b"]
+    assert all(page.closed for page in first.page.opened + second.page.opened)
+
+
+class FakeBrowser:
+    """Stand-in launched browser counting the contexts it opens."""
+
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    async def new_context(self, **options):
+        context = FakePage()
+        context.set_default_timeout = lambda timeout: None
+        context.pages = []
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self, browser):
+        self.chromium = self
+        self.browser = browser
+
+    async def start(self):
+        return self
+
+    async def launch(self, **options):
+        return self.browser
+
+    async def stop(self):
+        pass
+
+
+@pytest.mark.parametrize("default_page, contexts", [(True, 1), (False, 0)])
+def test_driver_default_page_is_optional(monkeypatch, default_page, contexts):
+    """Test a non-persistent driver only opens its own context and page when asked to."""
+    browser = FakeBrowser()
+    monkeypatch.setattr("driver.async_playwright", lambda: FakePlaywright(browser))
+    driver = AsyncPlaywrightDriver(persistent=False, default_page=default_page)
+
+    async def main():
+        async with driver:
+            opened = len(browser.contexts)
+            has_page = driver.page is not None
+        return opened, has_page
+
+    assert run(main()) == (contexts, default_page)
+    assert browser.closed
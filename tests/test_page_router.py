@@ -0,0 +1,82 @@
+"""Tests for navigation-aware page object routing."""
+
+from pages.feed_page import FeedPage
+from pages.page_router import PageRouter, normalize_url
+
+
+class _FakePage:
+    """Minimal stand-in recording navigations and keeping a history stack."""
+
+    def __init__(self, url: str = "about:blank"):
+        self.history = [url]
+        self.gotos = []
+
+    @property
+    def url(self):
+        return self.history[-1]
+
+    def goto(self, url, **kwargs):
+        self.gotos.append(url)
+        self.history.append(url)
+
+    def go_back(self, **kwargs):
+        if len(self.history) > 1:
+            self.history.pop()
+
+
+def test_normalize_url():
+    """Test fragments and trailing slashes do not affect comparison."""
+    assert normalize_url("https://a.com/feed/#top") == normalize_url("https://a.com/feed")
+    assert normalize_url("https://a.com/feed?p=2") != normalize_url("https://a.com/feed")
+
+
+def test_feed_page_without_navigation():
+    """Test FeedPage can be constructed without loading the feed."""
+    page = _FakePage()
+    feed_page = FeedPage(page, navigate=False)
+    assert page.gotos == []
+    assert feed_page.open() is feed_page
+    assert page.gotos == [feed_page.url]
+
+
+def test_feed_navigates_once(settings):
+    """Test repeated feed requests reuse the loaded page and page object."""
+    page = _FakePage()
+    router = PageRouter(page)
+
+    first = router.feed(viewed_my_profile=False)
+    second = router.feed(viewed_my_profile=False)
+
+    assert first is second
+    assert page.gotos == [settings.BASE_URL]
+    assert router.skipped_navigations == 1
+
+    router.feed(viewed_my_profile=False, force=True)
+    assert len(page.gotos) == 2
+
+
+def test_back_to_feed_uses_history(settings):
+    """Test returning from an item goes back in history instead of reloading."""
+    page = _FakePage()
+    router = PageRouter(page)
+    router.feed(viewed_my_profile=False)
+
+    item_page = router.item("42")
+    assert item_page.item_id == "42"
+    assert page.url == f"{settings.BASE_URL}/item/42"
+
+    router.item("42")
+    router.back_to_feed()
+    assert page.url == settings.BASE_URL
+    assert len(page.gotos) == 2
+
+
+def test_back_to_feed_reloads_when_history_lost(settings):
+    """Test the feed is loaded again if history does not lead back to it."""
+    page = _FakePage()
+    router = PageRouter(page)
+    router.feed(viewed_my_profile=False)
+    page.history = [f"{settings.BASE_URL}/item/1"]
+
+    router.back_to_feed()
+    assert page.url == settings.BASE_URL
@@ -0,0 +1,56 @@
+"""Tests for the pytest-xdist grouping and per-worker isolation fixtures."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tests.conftest import pytest_collection_modifyitems
+
+
+class FakeItem:
+    def __init__(self, *fixturenames, group=None):
+        self.fixturenames = list(fixturenames)
+        self.markers = [pytest.mark.xdist_group(group).mark] if group else []
+
+    def get_closest_marker(self, name):
+        return next((mark for mark in self.markers if mark.name == name), None)
+
+    def add_marker(self, marker):
+        self.markers.append(marker.mark)
+
+
+def config(group_by_fixture):
+    return SimpleNamespace(getoption=lambda name: group_by_fixture)
+
+
+def test_group_by_fixture_assigns_groups():
+    """Test tests are grouped by their session fixture and explicit groups are kept."""
+    authenticated = FakeItem("authenticated_page", "auth_state", "browser")
+    browser = FakeItem("page", "context", "browser")
+    unit = FakeItem("tmp_path")
+    pinned = FakeItem("page", "browser", group="custom")
+
+    pytest_collection_modifyitems(config(True), [authenticated, browser, unit, pinned])
+
+    assert authenticated.get_closest_marker("xdist_group").args == ("authenticated",)
+    assert browser.get_closest_marker("xdist_group").args == ("browser",)
+    assert unit.get_closest_marker("xdist_group") is None
+    assert pinned.get_closest_marker("xdist_group").args == ("custom",)
+
+
+def test_grouping_is_opt_in():
+    """Test no groups are assigned without --group-by-fixture."""
+    item = FakeItem("browser")
+
+    pytest_collection_modifyitems(config(False), [item])
+
+    assert item.get_closest_marker("xdist_group") is None
+
+
+def test_worker_paths_are_private(worker_id, settings, user_data_dir):
+    """Test artifact paths and the browser profile are specific to the running worker."""
+    assert user_data_dir.name.startswith(f"browser_data_{worker_id}")
+    if worker_id != "master":
+        assert Path(settings.SCREENSHOT_DIR).name == worker_id
+        assert Path(settings.REPORT_DIR).name == worker_id
@@ -0,0 +1,85 @@
+"""Tests for browser-side page load metrics."""
+
+import json
+
+from utils.perf_metrics import PerfCollector
+
+
+class _FakeSession:
+    def __init__(self, script_seconds):
+        self.script_seconds = script_seconds
+
+    def send(self, method):
+        if method != "Performance.getMetrics":
+            return {}
+        return {
+            "metrics": [
+                {"name": "JSHeapUsedSize", "value": 2_000_000},
+                {"name": "ScriptDuration", "value": self.script_seconds.pop(0)},
+                {"name": "Timestamp", "value": 123.0},
+            ]
+        }
+
+
+class _FakeContext:
+    def __init__(self, session):
+        self.session = session
+        self.sessions_opened = 0
+
+    def new_cdp_session(self, page):
+        self.sessions_opened += 1
+        return self.session
+
+
+class _FakePage:
+    url = "https://example-site.com/item/1"
+
+    def __init__(self, ttfb_values, script_seconds):
+        self.ttfb_values = ttfb_values
+        self.context = _FakeContext(_FakeSession(script_seconds))
+
+    def evaluate(self, expression):
+        return {"ttfb_ms": self.ttfb_values.pop(0), "request_count": 12}
+
+
+def test_collect_combines_timing_and_cdp():
+    """Test samples merge page timing with CDP metrics and reuse the CDP session."""
+    page = _FakePage([100.0, 300.0], [0.25, 0.75])
+    collector = PerfCollector()
+
+    first = collector.collect(page, item_id="1")
+    second = collector.collect(page, item_id="2")
+
+    assert first == {
+        "item_id": "1",
+        "url": page.url,
+        "ttfb_ms": 100.0,
+        "request_count": 12,
+        "js_heap_used_bytes": 2_000_000,
+        "script_ms": 250.0,
+    }
+    # Cumulative CDP durations are reported per sample
+    assert second["script_ms"] == 500.0
+    assert page.context.sessions_opened == 1
+
+
+def test_summary_and_report(tmp_path):
+    """Test per-metric aggregation skips labels and the report holds the samples."""
+    collector = PerfCollector()
+    page = _FakePage([100.0, 300.0], [0.1, 0.2])
+    collector.collect(page, item_id=1)
+    collector.collect(page, item_id=2)
+
+    summary = collector.summary()
+    assert "item_id" not in summary
+    assert summary["ttfb_ms"] == {
+        "count": 2,
+        "mean": 200.0,
+        "p50": 100.0,
+        "p95": 100.0,
+        "max": 300.0,
+    }
+
+    report = json.loads(collector.write_report(str(tmp_path)).read_text())
+    assert len(report["samples"]) == 2
+    assert PerfCollector().write_report(str(tmp_path)) is None
@@ -0,0 +1,66 @@
+"""Tests for batched page state probing."""
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+
+
+class _Handle:
+    def __init__(self, value):
+        self.value = value
+
+    def json_value(self):
+        return self.value
+
+
+class _FakePage:
+    """Stand-in that answers probes with a fixed state and records the calls."""
+
+    def __init__(self, state=None):
+        self.state = state
+        self.calls = []
+
+    def evaluate(self, expression, arg):
+        self.calls.append(("evaluate", arg))
+        return self.state
+
+    def wait_for_function(self, expression, arg=None, polling=None, timeout=None):
+        self.calls.append(("wait_for_function", arg))
+        if self.state is None:
+            raise PlaywrightTimeoutError("timeout")
+        return _Handle(self.state)
+
+
+def test_probe_state_single_round_trip():
+    """Test all non-empty selectors are probed together in one call."""
+    page = _FakePage("feed")
+    state = BasePage(page).probe_state({"login": "form", "feed": ".feed", "error": ""})
+
+    assert state == "feed"
+    assert page.calls == [("wait_for_function", [["login", "form"], ["feed", ".feed"]])]
+
+
+def test_probe_state_immediate_check():
+    """Test timeout 0 checks once without waiting."""
+    page = _FakePage("login")
+    assert BasePage(page).probe_state({"login": "form"}, timeout=0) == "login"
+    assert page.calls[0][0] == "evaluate"
+
+
+def test_probe_state_none_visible():
+    """Test a timeout resolves to None instead of raising."""
+    assert BasePage(_FakePage()).probe_state({"login": "form"}, timeout=10) is None
+
+
+def test_probe_state_no_selectors():
+    """Test an empty probe returns without touching the page."""
+    page = _FakePage("x")
+    assert BasePage(page).probe_state({"a": ""}) is None
+    assert page.calls == []
+
+
+def test_is_logged_in_from_probe():
+    """Test login state is inferred from the single probe result."""
+    assert LoginPage(_FakePage()).is_logged_in()
+    assert not LoginPage(_FakePage("login_form")).is_logged_in()
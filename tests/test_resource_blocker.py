@@ -0,0 +1,47 @@
+"""Tests for resource blocking decisions and counters."""
+
+import pytest
+
+from utils.resource_blocker import TRACKER_DOMAINS, ResourceBlocker
+
+
+class _StubSettings:
+    BLOCK_PRESET = "lean"
+    BLOCK_RESOURCE_TYPES = ["stylesheet"]
+    BLOCK_DOMAINS = ["ads.example.com"]
+
+
+def test_blocks_by_resource_type():
+    """Test configured resource types are blocked regardless of host."""
+    blocker = ResourceBlocker(resource_types=["image", "font"])
+    assert blocker.should_block("https://example-site.com/logo.png", "image")
+    assert not blocker.should_block("https://example-site.com/", "document")
+
+
+def test_blocks_domain_and_subdomains():
+    """Test domain blocking matches subdomains but not lookalike hosts."""
+    blocker = ResourceBlocker(domains=["doubleclick.net"])
+    assert blocker.should_block("https://doubleclick.net/x.js", "script")
+    assert blocker.should_block("https://stats.g.doubleclick.net/x.js", "script")
+    assert not blocker.should_block("https://notdoubleclick.net/x.js", "script")
+
+
+def test_from_settings_merges_preset_and_extras():
+    """Test presets combine with extra configured types and domains."""
+    blocker = ResourceBlocker.from_settings(_StubSettings())
+    assert {"image", "media", "font", "stylesheet"} <= blocker.resource_types
+    assert "ads.example.com" in blocker.domains
+    assert not set(TRACKER_DOMAINS) & set(blocker.domains)
+
+
+def test_from_settings_rejects_unknown_preset():
+    """Test unknown preset names fail at configuration time."""
+    settings = _StubSettings()
+    settings.BLOCK_PRESET = "everything"
+    with pytest.raises(ValueError):
+        ResourceBlocker.from_settings(settings)
+
+
+def test_disabled_blocker():
+    """Test an empty configuration disables blocking."""
+    assert not ResourceBlocker().enabled
@@ -0,0 +1,162 @@
+"""Tests for batched result sinks."""
+
+import asyncio
+import csv
+import json
+import queue
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.result_sinks import BatchedResultWriter, CsvSink, JsonlSink, SqliteSink
+
+
+def _records(count):
+    return [{"id": str(i), "raw_text": f"item {i}", "url": f"/item/{i}"} for i in range(count)]
+
+
+def test_jsonl_sink_writes_all_records(tmp_path):
+    """Test every queued record is written once the writer closes."""
+    path = tmp_path / "items.jsonl"
+    with BatchedResultWriter(JsonlSink(path), batch_size=3) as writer:
+        for record in _records(10):
+            writer.write(record)
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == _records(10)
+    assert writer.written == 10
+
+
+def test_csv_sink_encodes_nested_and_late_keys(tmp_path):
+    """Test nested values are JSON-encoded and new keys land in the extra column."""
+    path = tmp_path / "items.csv"
+    with BatchedResultWriter(CsvSink(path), batch_size=1) as writer:
+        writer.write({"id": "1", "tags": ["a", "b"]})
+        writer.write({"id": "2", "tags": [], "late": "x"})
+
+    with path.open() as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["tags"] == '["a", "b"]'
+    assert json.loads(rows[1]["extra"]) == {"late": "x"}
+
+
+def test_sqlite_sink_inserts_rows(tmp_path):
+    """Test records land in the items table with their id."""
+    path = tmp_path / "items.sqlite"
+    with BatchedResultWriter(SqliteSink(path), batch_size=4) as writer:
+        for record in _records(6):
+            writer.write(record)
+
+    rows = sqlite3.connect(path).execute("SELECT item_id, data FROM items").fetchall()
+    assert [row[0] for row in rows] == [str(i) for i in range(6)]
+    assert json.loads(rows[0][1])["url"] == "/item/0"
+
+
+def test_writer_flushes_on_interval(tmp_path):
+    """Test a partial batch is flushed after flush_interval without closing."""
+    path = tmp_path / "items.jsonl"
+    writer = BatchedResultWriter(JsonlSink(path), batch_size=100, flush_interval=0.05)
+    writer.write({"id": "1"})
+    for _ in range(100):
+        if writer.written:
+            break
+        time.sleep(0.01)
+    assert writer.written == 1
+    writer.close()
+
+
+def test_writer_surfaces_sink_errors(tmp_path):
+    """Test writes fail loudly once the sink has failed."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    writer = BatchedResultWriter(JsonlSink(blocker / "items.jsonl"))
+    writer.close()
+
+    assert writer.error is not None
+    with pytest.raises(RuntimeError):
+        writer.write({"id": "1"})
+
+
+def test_on_written_runs_after_batch_is_stored(tmp_path):
+    """Test a record's callback sees it in the file and is skipped when its batch fails."""
+    path = tmp_path / "items.jsonl"
+    stored_when_called = {}
+
+    class FailingSecondBatch(JsonlSink):
+        batches = 0
+
+        def write_batch(self, records):
+            self.batches += 1
+            if self.batches == 2:
+                raise OSError("disk full")
+            super().write_batch(records)
+
+    def on_written(item_id):
+        return lambda: stored_when_called.setdefault(
+            item_id, f'"id": "{item_id}"' in path.read_text()
+        )
+
+    writer = BatchedResultWriter(FailingSecondBatch(path), batch_size=2)
+    for record in _records(4):
+        writer.write(record, on_written=on_written(record["id"]))
+    writer.close()
+
+    assert stored_when_called == {"0": True, "1": True}
+    assert isinstance(writer.error, OSError)
+
+
+def test_idle_writer_blocks_with_zero_interval(tmp_path, monkeypatch):
+    """Test an idle writer waits for records instead of polling, even with flush_interval=0."""
+    gets = []
+
+    class CountingQueue(queue.Queue):
+        def get(self, block=True, timeout=None):
+            gets.append(timeout)
+            return super().get(block, timeout)
+
+    monkeypatch.setattr("utils.result_sinks.queue.Queue", CountingQueue)
+    writer = BatchedResultWriter(JsonlSink(tmp_path / "items.jsonl"), flush_interval=0)
+    time.sleep(0.05)
+    writer.write({"id": "1"})
+    for _ in range(100):
+        if writer.written:
+            break
+        time.sleep(0.01)
+    writer.close()
+
+    assert writer.written == 1
+    assert len(gets) <= 3
+
+
+def test_write_async_waits_for_space_off_the_loop(tmp_path):
+    """Test a full queue makes write_async wait without blocking other coroutines."""
+
+    class SlowSink(JsonlSink):
+        def write_batch(self, records):
+            time.sleep(0.02)
+            super().write_batch(records)
+
+    writer = BatchedResultWriter(SlowSink(tmp_path / "items.jsonl"), batch_size=1, max_queue=1)
+    ticks = []
+
+    async def ticker(done):
+        while not done.is_set():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.005)
+
+    async def main():
+        done = asyncio.Event()
+        ticking = asyncio.create_task(ticker(done))
+        for record in _records(5):
+            await writer.write_async(record)
+        done.set()
+        await ticking
+
+    with ThreadPoolExecutor(1) as executor:
+        executor.submit(asyncio.run, main()).result()
+    writer.close()
+
+    assert writer.written == 5
+    assert len(ticks) > 5
@@ -0,0 +1,73 @@
+"""Tests for the run checkpoint journal."""
+
+from controller.run_journal import RunJournal
+
+
+def test_pending_excludes_done_and_retries_failed(tmp_path):
+    """Test resumed runs skip completed items but retry failed ones."""
+    journal = RunJournal(tmp_path / "journal.jsonl")
+    journal.start(["a", "b", "c", "d"])
+    journal.mark_done("a")
+    journal.mark_failed("b", RuntimeError("boom"))
+    journal.mark_done("c")
+    journal.close()
+
+    state = RunJournal(tmp_path / "journal.jsonl").load()
+    assert state.pending == ["b", "d"]
+    assert state.failed == {"b": "boom"}
+    assert state.resumable
+
+
+def test_finished_run_is_not_resumable(tmp_path):
+    """Test a completed run starts fresh next time."""
+    journal = RunJournal(tmp_path / "journal.jsonl")
+    journal.start(["a"])
+    journal.mark_done("a")
+    journal.finish()
+    journal.close()
+
+    assert not journal.load().resumable
+
+
+def test_start_discards_previous_run(tmp_path):
+    """Test starting a run replaces the old journal."""
+    journal = RunJournal(tmp_path / "journal.jsonl")
+    journal.start(["old"])
+    journal.start(["new"])
+    journal.close()
+
+    assert journal.load().items == ["new"]
+
+
+def test_track_records_streamed_items(tmp_path):
+    """Test streamed ids are journaled once and known ids are skipped."""
+    journal = RunJournal(tmp_path / "journal.jsonl")
+    journal.start(streaming=True)
+    tracked = list(journal.track(["a", "b", "a", "c"], skip=["b"]))
+    journal.mark_done("a")
+    journal.close()
+
+    state = journal.load()
+    assert tracked == ["a", "c"]
+    assert state.streaming
+    assert state.pending == ["c"]
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    """Test a partially written line from a crash does not break loading."""
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(path)
+    journal.start(["a", "b"])
+    journal.mark_done("a")
+    journal.close()
+    with path.open("a") as f:
+        f.write('{"event": "done", "id": "b"')
+
+    assert journal.load().pending == ["b"]
+
+
+def test_missing_journal_is_empty(tmp_path):
+    """Test loading without a journal yields nothing to resume."""
+    state = RunJournal(tmp_path / "missing.jsonl").load()
+    assert state.items == []
+    assert not state.resumable
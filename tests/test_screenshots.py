@@ -0,0 +1,128 @@
+"""Tests for the background screenshot service."""
+
+import pytest
+
+from utils.screenshots import ScreenshotService
+
+
+class FakePage:
+    """Stand-in page whose screenshot returns queued images."""
+
+    def __init__(self, *images: bytes):
+        self.images = list(images)
+        self.calls = []
+
+    def screenshot(self, **options):
+        self.calls.append(options)
+        return self.images.pop(0) if self.images else b"image"
+
+
+class FakeAsyncPage(FakePage):
+    async def screenshot(self, **options):
+        return FakePage.screenshot(self, **options)
+
+
+def test_capture_writes_in_background(tmp_path):
+    """Test the image is written under a unique name with the configured options."""
+    service = ScreenshotService(str(tmp_path), image_type="jpeg", quality=60)
+    page = FakePage(b"jpeg bytes")
+
+    path = service.capture(page, "item_info_error")
+    service.close()
+
+    assert path.parent == tmp_path and path.suffix == ".jpg"
+    assert path.read_bytes() == b"jpeg bytes"
+    assert page.calls[0]["type"] == "jpeg" and page.calls[0]["quality"] == 60
+    assert page.calls[0]["full_page"] is False
+
+
+def test_clip_overrides_full_page(tmp_path):
+    """Test a clipped capture never asks for the full page."""
+    service = ScreenshotService(str(tmp_path), full_page=True)
+    page = FakePage()
+    clip = {"x": 0, "y": 0, "width": 100, "height": 50}
+
+    service.capture(page, "clipped", clip=clip)
+    service.close()
+
+    assert page.calls[0]["clip"] == clip
+    assert page.calls[0]["full_page"] is False
+    assert "quality" not in page.calls[0]
+
+
+def test_same_kind_is_rate_limited(tmp_path):
+    """Test repeated captures of one kind are skipped before the browser is asked."""
+    service = ScreenshotService(str(tmp_path), min_interval=60)
+    page = FakePage(b"a", b"b", b"c")
+
+    assert service.capture(page, "login_failure") is not None
+    assert service.capture(page, "login_failure") is None
+    assert service.capture(page, "feed_not_found") is not None
+    service.close()
+
+    assert len(page.calls) == 2
+    assert service.suppressed == 1
+
+
+def test_identical_images_are_not_written(tmp_path):
+    """Test an image identical to the previous one of its kind is dropped."""
+    service = ScreenshotService(str(tmp_path), min_interval=0)
+    page = FakePage(b"outage", b"outage", b"recovered")
+
+    paths = [service.capture(page, "item_info_error") for _ in range(3)]
+    service.close()
+
+    assert paths[1] is None
+    assert service.duplicates == 1
+    assert sorted(p.read_bytes() for p in tmp_path.iterdir()) == [b"outage", b"recovered"]
+
+
+def test_disk_budget_evicts_oldest(tmp_path):
+    """Test the oldest screenshots are deleted to stay within the budget."""
+    (tmp_path / "old_20200101_000000_000000.png").write_bytes(b"x" * 10)
+    service = ScreenshotService(str(tmp_path), max_bytes=25, min_interval=0)
+    assert service.total_bytes == 10
+
+    page = FakePage(b"1" * 10, b"2" * 10)
+    first = service.capture(page, "a")
+    second = service.capture(page, "b")
+    service.close()
+
+    assert not (tmp_path / "old_20200101_000000_000000.png").exists()
+    assert first.exists() and second.exists()
+    assert service.total_bytes == 20
+    assert service.evicted == 1
+
+
+def test_capture_async(tmp_path):
+    """Test async pages share the same pipeline."""
+    service = ScreenshotService(str(tmp_path))
+
+    # Drive the coroutine directly; a sync Playwright fixture may own the event loop
+    with pytest.raises(StopIteration) as stop:
+        service.capture_async(FakeAsyncPage(b"async"), "async_kind").send(None)
+    service.close()
+
+    assert stop.value.value.read_bytes() == b"async"
+
+
+def test_unsupported_type(tmp_path):
+    """Test unknown image types are rejected up front."""
+    with pytest.raises(ValueError):
+        ScreenshotService(str(tmp_path), image_type="webp")
+
+
+def test_exit_hook_registered_once(tmp_path, monkeypatch):
+    """Test restarting the writer thread does not register another exit hook."""
+    registered = []
+    monkeypatch.setattr("utils.screenshots.atexit.register", registered.append)
+    service = ScreenshotService(str(tmp_path))
+    page = FakePage(b"a", b"b")
+
+    service.capture(page, "first")
+    service.close()
+    service.capture(page, "second")
+    service.close()
+
+    assert registered == [service.close]
+    assert service.captured == 2
@@ -0,0 +1,76 @@
+"""Tests for the authenticated session cache."""
+
+import os
+import time
+
+from utils.session_cache import SessionCache
+
+
+class _FakeContext:
+    """Minimal stand-in exposing storage_state()."""
+
+    def __init__(self, state):
+        self.state = state
+
+    def storage_state(self):
+        return self.state
+
+
+def _state(expires: float = -1):
+    return {
+        "cookies": [
+            {
+                "name": "sid",
+                "value": "abc",
+                "domain": "example-site.com",
+                "path": "/",
+                "expires": expires,
+            }
+        ],
+        "origins": [],
+    }
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    """Test a saved state is returned for the same site and user."""
+    cache = SessionCache(str(tmp_path))
+    cache.save(_FakeContext(_state()), "https://example-site.com", "alice")
+
+    assert cache.load("https://example-site.com", "alice") == _state()
+    assert cache.load("https://example-site.com", "bob") is None
+
+
+def test_saved_state_is_owner_only(tmp_path):
+    """Test cached credentials are not world-readable."""
+    cache = SessionCache(str(tmp_path))
+    path = cache.save(_FakeContext(_state()), "https://example-site.com", "alice")
+
+    assert os.stat(path).st_mode & 0o077 == 0
+
+
+def test_load_discards_entries_older_than_max_age(tmp_path):
+    """Test entries past max_age are treated as expired and removed."""
+    cache = SessionCache(str(tmp_path), max_age=60)
+    path = cache.save(_FakeContext(_state()), "https://example-site.com", "alice")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.load("https://example-site.com", "alice") is None
+    assert not path.exists()
+
+
+def test_load_discards_expired_cookies(tmp_path):
+    """Test entries whose cookies have all expired are discarded."""
+    cache = SessionCache(str(tmp_path))
+    cache.save(_FakeContext(_state(expires=time.time() - 10)), "https://example-site.com", "alice")
+
+    assert cache.load("https://example-site.com", "alice") is None
+
+
+def test_load_ignores_corrupt_file(tmp_path):
+    """Test unreadable cache files are dropped instead of raising."""
+    cache = SessionCache(str(tmp_path))
+    path = cache.path_for("https://example-site.com", "alice")
+    path.write_text("{not json")
+
+    assert cache.load("https://example-site.com", "alice") is None
@@ -0,0 +1,110 @@
+"""Tests for loading, validating and deriving settings snapshots."""
+
+import dataclasses
+import pickle
+from pathlib import Path
+
+import pytest
+
+from constants.settings import Settings
+from utils.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    path = tmp_path / "config.ini"
+    path.write_text(
+        "[Settings]\n"
+        "base_url = https://example.com\n"
+        "headless = no\n"
+        "timeout = 5000\n"
+        "screenshot_min_interval = 2.5\n"
+        "block_domains = ads.example.com, , tracker.example.com\n"
+        "browser_endpoint =\n"
+        "engine = ASYNC\n"
+    )
+    return path
+
+
+def test_values_are_coerced_once(config_file):
+    """Test config values are parsed to their field types at load time."""
+    settings = Settings.load(config_file, environ={})
+
+    assert settings.HEADLESS is False
+    assert settings.TIMEOUT == 5000
+    assert settings.SCREENSHOT_MIN_INTERVAL == 2.5
+    assert settings.BLOCK_DOMAINS == ("ads.example.com", "tracker.example.com")
+    assert settings.BROWSER_ENDPOINT is None
+    assert settings.ENGINE == "async"
+    assert settings.SESSION_DIR == ".sessions"
+    assert settings.config_path == config_file
+
+
+def test_environment_overrides_config(config_file):
+    """Test environment variables win over config.ini, and empty ones are ignored."""
+    environ = {"BASE_URL": "https://staging.example.com", "ENGINE": "", "APP_USERNAME": "alice"}
+    settings = Settings.load(config_file, environ=environ)
+
+    assert settings.BASE_URL == "https://staging.example.com"
+    assert settings.ENGINE == "async"
+    assert settings.USERNAME == "alice"
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("sink_batch_size = lots", "sink_batch_size"),
+        ("feed_stream = maybe", "feed_stream"),
+        ("concurrency = 0", "concurrency"),
+        ("result_sink = parquet", "result_sink"),
+    ],
+)
+def test_invalid_values_fail_at_load(config_file, line, message):
+    """Test bad values raise ConfigurationError naming the setting."""
+    config_file.write_text(config_file.read_text() + line + "\n")
+
+    with pytest.raises(ConfigurationError, match=message):
+        Settings.load(config_file, environ={})
+
+
+def test_base_url_is_required(tmp_path, monkeypatch):
+    """Test a snapshot cannot be built without a base URL."""
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(ConfigurationError, match="Base URL"):
+        Settings.load(environ={})
+    with pytest.raises(ConfigurationError, match="not found"):
+        Settings.load(tmp_path / "missing.ini", environ={})
+
+
+def test_snapshot_is_frozen(config_file):
+    """Test settings cannot be changed or given new attributes."""
+    settings = Settings.load(config_file, environ={})
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.TIMEOUT = 1
+    assert not hasattr(settings, "__dict__")
+
+
+def test_with_overrides_derives_a_copy(config_file):
+    """Test overrides are coerced and validated without touching the original."""
+    settings = Settings.load(config_file, environ={})
+    derived = settings.with_overrides(CONCURRENCY="4", REPORT_DIR="reports/gw1")
+
+    assert (derived.CONCURRENCY, derived.REPORT_DIR) == (4, "reports/gw1")
+    assert (settings.CONCURRENCY, settings.REPORT_DIR) == (1, "reports")
+    assert derived.TIMEOUT == settings.TIMEOUT
+    assert settings.with_overrides() is settings
+
+    with pytest.raises(ConfigurationError, match="Unknown setting"):
+        settings.with_overrides(TIMEOUTS=1)
+    with pytest.raises(ConfigurationError, match="shards"):
+        settings.with_overrides(SHARDS=0)
+
+
+def test_snapshot_pickles_for_worker_processes(config_file):
+    """Test a snapshot survives the trip to a spawned shard process."""
+    settings = Settings.load(config_file, environ={}, PASSWORD="secret")
+
+    assert pickle.loads(pickle.dumps(settings)) == settings
+    assert "secret" not in repr(settings)
@@ -0,0 +1,64 @@
+"""Tests for splitting items across shards, profile copies and merged summaries."""
+
+import pytest
+
+from controller.run_summary import RunSummary
+from controller.sharding import copy_profile, remove_profile, split_items
+
+
+@pytest.mark.parametrize(
+    "items, shards, expected",
+    [
+        ([], 3, []),
+        ([1, 2, 3, 4, 5], 2, [[1, 3, 5], [2, 4]]),
+        ([1, 2], 4, [[1], [2]]),
+        ([1, 2, 3], 0, [[1, 2, 3]]),
+    ],
+)
+def test_split_items(items, shards, expected):
+    """Test items are striped over at most `shards` non-empty slices."""
+    assert split_items(items, shards) == expected
+
+
+def test_copy_profile_skips_lock_files(tmp_path):
+    """Test the shard copy keeps profile data but not Chromium's lock files."""
+    source = tmp_path / "profile"
+    (source / "Default").mkdir(parents=True)
+    (source / "Default" / "Cookies").write_text("session")
+    (source / "SingletonLock").write_text("")
+    (source / "lockfile").write_text("")
+
+    target = copy_profile(f"{source}/", 1)
+
+    assert target == f"{source}_shard1"
+    assert (tmp_path / "profile_shard1" / "Default" / "Cookies").read_text() == "session"
+    assert not (tmp_path / "profile_shard1" / "SingletonLock").exists()
+    assert not (tmp_path / "profile_shard1" / "lockfile").exists()
+
+    remove_profile(target)
+    remove_profile(target)
+    assert not (tmp_path / "profile_shard1").exists()
+    assert (source / "Default" / "Cookies").exists()
+
+
+def test_copy_missing_profile_creates_empty_directory(tmp_path):
+    """Test a shard still gets its own directory when there is no profile to copy."""
+    target = copy_profile(str(tmp_path / "missing"), 0)
+
+    assert list((tmp_path / "missing_shard0").iterdir()) == []
+    assert target == str(tmp_path / "missing_shard0")
+
+
+def test_merge_summaries():
+    """Test counts and workers add up and elapsed is the longest overlapping run."""
+    merged = RunSummary.merge(
+        [
+            RunSummary(total=4, succeeded=3, failed=1, elapsed=2.0, workers=2),
+            RunSummary(total=2, succeeded=2, elapsed=4.0),
+        ]
+    )
+
+    assert (merged.total, merged.succeeded, merged.failed, merged.workers) == (6, 5, 1, 3)
+    assert merged.elapsed == 4.0
+    assert merged.items_per_sec == 1.5
+    assert RunSummary.merge([]) == RunSummary(workers=0)
@@ -0,0 +1,94 @@
+"""Tests for import cost and side effects at startup (run in fresh interpreters)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules imported at startup, including by every spawned shard process
+ENTRY_MODULES = ("main", "logger", "constants.settings", "pages", "controller")
+
+# Fails the import check with the offending modules and root logger handlers
+IMPORT_CHECK = """
+import logging, sys
+import {module}
+heavy = sorted(name for name in sys.modules if name.startswith("playwright"))
+assert not heavy, f"loaded {{heavy[:5]}}"
+assert not logging.getLogger().handlers, f"configured {{logging.getLogger().handlers}}"
+"""
+
+
+def run_python(code: str, cwd: Path, *flags: str, **env: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=cwd,
+        env={"PYTHONPATH": str(ROOT), "PATH": "", **env},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+@pytest.mark.parametrize("module", ENTRY_MODULES)
+def test_import_is_cheap_and_side_effect_free(module, tmp_path):
+    """Test entry modules load no Playwright, configure no logging and write no files."""
+    result = run_python(IMPORT_CHECK.format(module=module), tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_package_exports_resolve_lazily():
+    """Test package attributes still resolve, importing their submodule on first access."""
+    code = (
+        "import sys, pages, controller\n"
+        "assert 'pages.login_page' not in sys.modules\n"
+        "from pages import LoginPage\n"
+        "from controller import Controller\n"
+        "assert LoginPage.__module__ == 'pages.login_page'\n"
+        "assert 'playwright.async_api' not in sys.modules\n"
+    )
+    result = run_python(code, ROOT)
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_async_facade_skips_sync_stack():
+    """Test the async facade loads neither the sync facade nor its page router."""
+    code = (
+        "import sys, controller.async_facade\n"
+        "sync = [m for m in ('controller.facade', 'pages.page_router') if m in sys.modules]\n"
+        "assert not sync, f'loaded {sync}'\n"
+    )
+    result = run_python(code, ROOT)
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_logger_import_has_no_side_effects(tmp_path):
+    """Test importing logger neither creates log files nor configures the root logger."""
+    code = "import logging, logger\nassert not logging.getLogger().handlers\n"
+    result = run_python(code, tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_settings_without_config_file(tmp_path):
+    """Test Settings falls back to environment and defaults when config.ini is missing."""
+    code = (
+        "from constants.settings import get_settings\n"
+        "from utils.exceptions import ConfigurationError\n"
+        "try:\n"
+        "    settings = get_settings()\n"
+        "except ConfigurationError:\n"
+        "    print('missing')\n"
+        "else:\n"
+        "    assert settings.config_path is None and settings.TIMEOUT == 30000\n"
+    )
+
+    assert run_python(code, tmp_path).stdout.strip() == "missing"
+    assert run_python(code, tmp_path, BASE_URL="https://example.com").stdout.strip() == ""
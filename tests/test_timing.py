@@ -0,0 +1,72 @@
+"""Tests for page action latency histograms."""
+
+import json
+
+import pytest
+
+from utils.timing import TIMINGS, ActionTimings, LatencyHistogram, timed
+
+
+def test_histogram_percentiles():
+    """Test percentiles land within bucket precision of the true values."""
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.05)
+    assert histogram.percentile(95) == pytest.approx(0.95, rel=0.05)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.05)
+    assert histogram.percentile(100) == pytest.approx(1.0, rel=0.05)
+
+
+def test_summary_and_report(tmp_path):
+    """Test spans aggregate per key and the report is written as JSON."""
+    timings = ActionTimings()
+    timings.record("FeedPage", "safe_click", ".a", 0.2)
+    timings.record("FeedPage", "safe_click", ".a", 0.4, ok=False)
+    timings.record("ItemPage", "navigate_to", None, 0.1)
+
+    rows = timings.summary()
+    assert [r["action"] for r in rows] == ["safe_click", "navigate_to"]
+    assert rows[0]["count"] == 2 and rows[0]["errors"] == 1
+
+    path = timings.write_report(str(tmp_path))
+    assert json.loads(path.read_text()) == rows
+
+    timings.reset()
+    assert timings.write_report(str(tmp_path)) is None
+
+
+class _Page:
+    @timed
+    def safe_click(self, selector, timeout=None):
+        return selector
+
+    @timed
+    def fail(self, selector):
+        raise ValueError(selector)
+
+    @timed
+    async def navigate_to(self, url):
+        return url
+
+
+def test_timed_decorator_records_spans():
+    """Test sync/async methods record spans keyed by class, action and selector."""
+    TIMINGS.reset()
+    page = _Page()
+    page.safe_click(".x")
+    page.safe_click(selector=".x")
+    with pytest.raises(ValueError):
+        page.fail(".y")
+    # No awaits inside, so the coroutine completes on its first step (no event loop needed;
+    # the sync Playwright fixtures may leave one running in this thread)
+    with pytest.raises(StopIteration):
+        page.navigate_to("https://example-site.com").send(None)
+
+    rows = {(r["page"], r["action"], r["selector"]): r for r in TIMINGS.summary()}
+    assert rows[("_Page", "safe_click", ".x")]["count"] == 2
+    assert rows[("_Page", "fail", ".y")]["errors"] == 1
+    assert rows[("_Page", "navigate_to", None)]["count"] == 1
+    TIMINGS.reset()
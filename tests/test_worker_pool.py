@@ -0,0 +1,117 @@
+"""Tests for pipelined item processing on worker tabs against fake pages."""
+
+import pytest
+
+from controller.facade import Facade
+from controller.worker_pool import TabWorkerPool
+
+
+class _FakeTab:
+    """Stand-in sync page logging navigation starts and finishes to a shared list."""
+
+    def __init__(self, name, events, broken=()):
+        self.name = name
+        self.events = events
+        self.broken = broken
+        self.url = "about:blank"
+
+    def goto(self, url, wait_until=None, **kwargs):
+        item_id = url.rsplit("/", 1)[-1]
+        if item_id in self.broken:
+            raise RuntimeError(f"cannot load {url}")
+        self.url = url
+        self.events.append(("start", self.name, item_id, wait_until))
+
+    def wait_for_load_state(self, state=None, **kwargs):
+        self.events.append(("loaded", self.name, self.url.rsplit("/", 1)[-1], state))
+
+
+def _pool(tab_count, broken=(), http_items=(), failing_items=()):
+    events = []
+    tabs = [_FakeTab(f"tab{n}", events, broken) for n in range(tab_count)]
+    facade = Facade(tabs[0])
+
+    def fetch_item_info(item_id):
+        return {"id": item_id, "http": True} if item_id in http_items else None
+
+    def item_action(item_id, page=None, use_http=True):
+        assert page is not None and not use_http
+        if item_id in failing_items:
+            raise ValueError(f"no details for {item_id}")
+        return {"id": item_id, "tab": page.name}
+
+    facade.fetch_item_info = fetch_item_info
+    facade.item_action = item_action
+    return TabWorkerPool(facade, tabs), events
+
+
+def test_requires_a_page():
+    """Test a pool without tabs is rejected."""
+    with pytest.raises(ValueError):
+        TabWorkerPool(Facade(_FakeTab("tab", [])), [])
+
+
+def test_navigations_overlap_across_tabs():
+    """Test every idle tab starts its navigation before the oldest one is finished."""
+    pool, events = _pool(2)
+    results = {}
+
+    summary = pool.process(
+        ["a", "b", "c"], on_result=lambda item_id, details: results.update({item_id: details})
+    )
+
+    assert (summary.total, summary.succeeded, summary.failed, summary.workers) == (3, 3, 0, 2)
+    assert [event[:3] for event in events[:3]] == [
+        ("start", "tab0", "a"),
+        ("start", "tab1", "b"),
+        ("loaded", "tab0", "a"),
+    ]
+    assert all(event[3] == "commit" for event in events if event[0] == "start")
+    assert results["c"]["tab"] == "tab0"
+
+
+def test_failures_are_counted_and_tabs_reused():
+    """Test failed navigations and actions are reported and their tab takes the next item."""
+    pool, events = _pool(1, broken=("b",), failing_items=("c",))
+    failures = []
+
+    summary = pool.process(
+        ["a", "b", "c", "d"], on_failure=lambda item_id, error: failures.append(item_id)
+    )
+
+    assert (summary.total, summary.succeeded, summary.failed) == (4, 2, 2)
+    assert failures == ["b", "c"]
+    assert ("loaded", "tab0", "d", "domcontentloaded") in events
+
+
+def test_http_fast_path_items_skip_tabs():
+    """Test items served over HTTP are reported without navigating a tab."""
+    pool, events = _pool(2, http_items=("a", "c"))
+    results = []
+
+    summary = pool.process(
+        iter(["a", "b", "c"]), on_result=lambda item_id, details: results.append(details)
+    )
+
+    assert summary.succeeded == 3
+    assert [event[2] for event in events if event[0] == "start"] == ["b"]
+    assert sorted(result["id"] for result in results) == ["a", "b", "c"]
+
+
+def test_failing_result_callback_fails_the_item():
+    """Test tab and HTTP results whose callback raises count as failed only."""
+    pool, _ = _pool(2, http_items=("a",))
+    failures = []
+
+    def on_result(item_id, details):
+        if item_id in ("a", "b"):
+            raise RuntimeError("result writer failed")
+
+    summary = pool.process(
+        ["a", "b", "c"],
+        on_result=on_result,
+        on_failure=lambda item_id, error: failures.append(item_id),
+    )
+
+    assert (summary.total, summary.succeeded, summary.failed) == (3, 1, 2)
+    assert failures == ["a", "b"]
@@ -0,0 +1,437 @@
+"""Persistent, content-addressed cache of static assets served through request routing."""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: index saves are merged but not locked
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import BrowserContext, Route
+
+
+logger = logging.getLogger(__name__)
+
+# Resource types worth caching across runs
+CACHEABLE_TYPES = frozenset({"script", "stylesheet", "image", "font", "media"})
+
+# Headers that describe the original transfer rather than the (decoded) stored body
+DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+)
+
+MAX_AGE_PATTERN = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+def freshness_lifetime(headers: Dict[str, str]) -> Optional[float]:
+    """
+    Get how long a response may be served without revalidation.
+
+    Args:
+        headers: Response headers (lowercase names)
+
+    Returns:
+        Lifetime in seconds (0 means revalidate on every use), or None if the
+        response must not be stored
+    """
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0
+
+    match = MAX_AGE_PATTERN.search(cache_control)
+    if match:
+        return int(match.group(1))
+
+    if "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"]).timestamp()
+        except (TypeError, ValueError):
+            return 0
+        return max(0.0, expires - time.time())
+
+    return 0
+
+
+class AssetCache:
+    """
+    On-disk HTTP cache for static assets, shared by every run using cache_dir.
+
+    Bodies are stored once under their SHA-256 (objects/<hash>) and an index
+    maps each URL to its body, headers, validators and expiry. Fresh entries
+    are fulfilled without touching the network; stale entries with an ETag or
+    Last-Modified are revalidated with a conditional request, and a 304 serves
+    the stored body. Total body size is capped, evicting least recently used
+    URLs first. Only GET requests for CACHEABLE_TYPES with status 200 are
+    considered; anything else falls through to other route handlers. Several
+    processes may share cache_dir: save() merges their saved entries under a
+    file lock instead of overwriting them.
+    """
+
+    def __init__(self, cache_dir: str = ".asset_cache", max_bytes: int = 256 * 1_048_576):
+        """
+        Initialize asset cache.
+
+        Args:
+            cache_dir: Directory holding the index and stored bodies
+            max_bytes: Size cap for stored bodies
+        """
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_served = 0
+        self.evictions = 0
+
+        self._index: Dict[str, Dict[str, Any]] = {}
+        # References per body and size of the distinct bodies, kept in step with _index
+        self._refs: Dict[str, int] = {}
+        self._bytes = 0
+        # When this process dropped a URL, so merging does not bring back older entries
+        self._removed: Dict[str, float] = {}
+        for url, entry in self._load_index().items():
+            self._set_entry(url, entry)
+        self._dirty = False
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> Optional["AssetCache"]:
+        """Build the cache from settings, or None when the asset cache is disabled."""
+        if not settings.ASSET_CACHE:
+            return None
+        return cls(settings.ASSET_CACHE_DIR, settings.ASSET_CACHE_MAX_MB * 1_048_576)
+
+    def attach(self, context: "BrowserContext") -> None:
+        """
+        Install the cache on a sync browser context.
+
+        Attach before other route handlers that call route.fallback() (such as
+        ResourceBlocker): Playwright runs the most recently registered handler
+        first, so blocked requests never reach the cache.
+        """
+        context.route("**/*", self._handle_route)
+        logger.info(f"Asset cache enabled: {self.cache_dir} ({len(self._index)} entries)")
+
+    async def attach_async(self, context: "AsyncBrowserContext") -> None:
+        """Install the cache on an async browser context (see attach)."""
+        await context.route("**/*", self._handle_route_async)
+        logger.info(f"Asset cache enabled: {self.cache_dir} ({len(self._index)} entries)")
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the index entry for a URL if its body is still on disk.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Index entry or None
+        """
+        entry = self._index.get(url)
+        if entry and not self._object_path(entry["sha256"]).exists():
+            self._remove_entry(url)
+            self._dirty = True
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return time.time() < entry["expires"]
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Request headers that revalidate an entry."""
+        headers = {}
+        if entry["headers"].get("etag"):
+            headers["if-none-match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            headers["if-modified-since"] = entry["headers"]["last-modified"]
+        return headers
+
+    def can_revalidate(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry has validators for a conditional request."""
+        return bool(self.conditional_headers(entry))
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> bool:
+        """
+        Store a response if it is cacheable.
+
+        Args:
+            url: Request URL
+            status: Response status
+            headers: Response headers
+            body: Decoded response body
+
+        Returns:
+            True if the response was stored
+        """
+        headers = {k.lower(): v for k, v in headers.items()}
+        if status != 200 or "*" in headers.get("vary", ""):
+            return False
+
+        lifetime = freshness_lifetime(headers)
+        if lifetime is None:
+            return False
+        if lifetime == 0 and "etag" not in headers and "last-modified" not in headers:
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        self._set_entry(
+            url,
+            {
+                "sha256": digest,
+                "size": len(body),
+                "status": status,
+                "headers": {k: v for k, v in headers.items() if k not in DROPPED_HEADERS},
+                "expires": now + lifetime,
+                "last_used": now,
+            },
+        )
+        self._dirty = True
+        self._evict()
+        return True
+
+    def refresh(self, entry: Dict[str, Any], headers: Dict[str, str]) -> None:
+        """Update an entry's expiry and validators from a 304 response."""
+        headers = {k.lower(): v for k, v in headers.items()}
+        for name in ("etag", "last-modified", "cache-control", "expires"):
+            if name in headers:
+                entry["headers"][name] = headers[name]
+        entry["expires"] = time.time() + (freshness_lifetime(entry["headers"]) or 0)
+        self._dirty = True
+
+    def read(self, entry: Dict[str, Any]) -> bytes:
+        """Read an entry's body and mark it as recently used."""
+        body = self._object_path(entry["sha256"]).read_bytes()
+        entry["last_used"] = time.time()
+        self.bytes_served += len(body)
+        self._dirty = True
+        return body
+
+    def save(self) -> None:
+        """
+        Write the index to disk if it changed.
+
+        Entries saved by other processes since this index was loaded are merged
+        in first, under a lock on the index: URLs only they stored are kept,
+        and for URLs both know, the more recently used entry wins.
+        """
+        if not self._dirty:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._index_lock():
+            self._merge(self._load_index())
+            self._evict()
+            tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._index))
+            os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def close(self) -> None:
+        """Persist the index and log the run's counters."""
+        try:
+            self.save()
+        except OSError as e:
+            logger.warning(f"Failed to save asset cache index: {e}")
+        self.log_stats()
+
+    @property
+    def total_bytes(self) -> int:
+        """Size of the distinct bodies referenced by the index."""
+        return self._bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this run."""
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            "bytes_served": self.bytes_served,
+            "evictions": self.evictions,
+            "entries": len(self._index),
+            "total_bytes": self.total_bytes,
+        }
+
+    def log_stats(self) -> None:
+        """Log the run's cache counters."""
+        stats = self.stats()
+        logger.info(
+            f"Asset cache: {stats['hits']} hits, {stats['revalidated']} revalidated, "
+            f"{stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+            f"{stats['bytes_served'] / 1_048_576:.1f} MiB served from disk, "
+            f"{stats['evictions']} evicted"
+        )
+
+    def _cacheable(self, method: str, resource_type: str) -> bool:
+        return method == "GET" and resource_type in CACHEABLE_TYPES
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index, starting empty if it is missing or unreadable."""
+        try:
+            return json.loads(self.index_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable asset cache index {self.index_path}: {e}")
+            return {}
+
+    @contextlib.contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the index across processes."""
+        with open(self.cache_dir / "index.lock", "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # Closing the file releases the lock
+            yield
+
+    def _merge(self, saved: Dict[str, Dict[str, Any]]) -> None:
+        """Adopt entries from a saved index that are newer than what this process knows."""
+        for url, entry in saved.items():
+            ours = self._index.get(url)
+            if ours is not None and ours["last_used"] >= entry["last_used"]:
+                continue
+            if entry["last_used"] <= self._removed.get(url, 0.0):
+                continue
+            if self._object_path(entry["sha256"]).exists():
+                self._set_entry(url, entry)
+
+    def _set_entry(self, url: str, entry: Dict[str, Any]) -> None:
+        """Add or replace a URL's entry, counting its body once per distinct hash."""
+        old = self._index.get(url)
+        self._index[url] = entry
+        refs = self._refs.get(entry["sha256"], 0)
+        if not refs:
+            self._bytes += entry["size"]
+        self._refs[entry["sha256"]] = refs + 1
+        # Released after the new reference is counted, so an unchanged body is kept
+        if old is not None and self._release(old):
+            self._object_path(old["sha256"]).unlink(missing_ok=True)
+
+    def _remove_entry(self, url: str) -> bool:
+        """Drop a URL's entry; True if no other URL references its body."""
+        entry = self._index.pop(url)
+        self._removed[url] = time.time()
+        return self._release(entry)
+
+    def _release(self, entry: Dict[str, Any]) -> bool:
+        refs = self._refs[entry["sha256"]] - 1
+        if refs:
+            self._refs[entry["sha256"]] = refs
+            return False
+        del self._refs[entry["sha256"]]
+        self._bytes -= entry["size"]
+        return True
+
+    def _evict(self) -> None:
+        """Drop least recently used URLs until the stored bodies fit in max_bytes."""
+        if self._bytes <= self.max_bytes:
+            return
+
+        for url, entry in sorted(self._index.items(), key=lambda item: item[1]["last_used"]):
+            if self._bytes <= self.max_bytes:
+                break
+            self.evictions += 1
+            if self._remove_entry(url):
+                self._object_path(entry["sha256"]).unlink(missing_ok=True)
+        self._dirty = True
+
+    def _handle_route(self, route: "Route") -> None:
+        request = route.request
+        if not self._cacheable(request.method, request.resource_type):
+            route.fallback()
+            return
+
+        entry = self.lookup(request.url)
+        if entry and self.is_fresh(entry):
+            self.hits += 1
+            route.fulfill(status=entry["status"], headers=entry["headers"], body=self.read(entry))
+            return
+
+        try:
+            if entry and self.can_revalidate(entry):
+                response = route.fetch(
+                    headers={**request.headers, **self.conditional_headers(entry)}
+                )
+                if response.status == 304:
+                    self.revalidated += 1
+                    self.refresh(entry, response.headers)
+                    body = self.read(entry)
+                    route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+                    return
+            else:
+                response = route.fetch()
+        except Exception as e:
+            logger.debug(f"Asset cache fetch failed for {request.url}: {e}")
+            route.fallback()
+            return
+
+        self.misses += 1
+        self.store(request.url, response.status, response.headers, response.body())
+        route.fulfill(response=response)
+
+    async def _handle_route_async(self, route: "AsyncRoute") -> None:
+        request = route.request
+        if not self._cacheable(request.method, request.resource_type):
+            await route.fallback()
+            return
+
+        entry = self.lookup(request.url)
+        if entry and self.is_fresh(entry):
+            self.hits += 1
+            await route.fulfill(
+                status=entry["status"], headers=entry["headers"], body=self.read(entry)
+            )
+            return
+
+        try:
+            if entry and self.can_revalidate(entry):
+                response = await route.fetch(
+                    headers={**request.headers, **self.conditional_headers(entry)}
+                )
+                if response.status == 304:
+                    self.revalidated += 1
+                    self.refresh(entry, response.headers)
+                    body = self.read(entry)
+                    await route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+                    return
+            else:
+                response = await route.fetch()
+        except Exception as e:
+            logger.debug(f"Asset cache fetch failed for {request.url}: {e}")
+            await route.fallback()
+            return
+
+        self.misses += 1
+        self.store(request.url, response.status, response.headers, await response.body())
+        await route.fulfill(response=response)
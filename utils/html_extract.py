@@ -0,0 +1,269 @@
+"""Minimal HTML parsing and CSS selector matching for browserless extraction."""
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Elements that never have children or an end tag
+VOID_ELEMENTS = frozenset(
+    "area base br col embed hr img input link meta param source track wbr".split()
+)
+
+# Elements whose text is never rendered
+SKIP_TEXT_ELEMENTS = frozenset(["script", "style", "template", "noscript", "head"])
+
+# tag, #id, .class and [attr], [attr=value], [attr="value"] parts of a compound selector
+_SIMPLE_SELECTOR = re.compile(
+    r"""
+    (?P<tag>^[a-zA-Z][\w-]*|^\*)
+    |\#(?P<id>[\w-]+)
+    |\.(?P<cls>[\w-]+)
+    |\[\s*(?P<attr>[\w:-]+)\s*(?:=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?\]
+    """,
+    re.VERBOSE,
+)
+
+# Selector list separators, child combinators, whitespace and compound selectors;
+# [attr] parts are kept whole, so quoted values may contain spaces, commas and '>'
+_SELECTOR_TOKEN = re.compile(
+    r"""
+    (?P<space>\s+)
+    |(?P<sep>[>,])
+    |(?P<compound>(?:[^\s>,\[\]]+|\[(?:"[^"]*"|'[^']*'|[^\]"'])*\])+)
+    """,
+    re.VERBOSE,
+)
+
+
+class UnsupportedSelectorError(ValueError):
+    """Raised when a selector uses syntax the Python matcher does not support."""
+
+
+class Element:
+    """Parsed HTML element."""
+
+    __slots__ = ("tag", "attrs", "parent", "children")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["Element"]):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children: List[object] = []
+
+    def iter_elements(self) -> Iterator["Element"]:
+        """Yield descendant elements in document order."""
+        for child in self.children:
+            if isinstance(child, Element):
+                yield child
+                yield from child.iter_elements()
+
+    def text(self) -> str:
+        """Rendered-ish text: descendant text with whitespace collapsed, scripts/styles skipped."""
+        parts: List[str] = []
+        self._collect_text(parts)
+        return re.sub(r"[ \t\r\f\v]+", " ", re.sub(r"\s*\n\s*", "\n", "".join(parts))).strip()
+
+    def _collect_text(self, parts: List[str]) -> None:
+        for child in self.children:
+            if isinstance(child, Element):
+                if child.tag in SKIP_TEXT_ELEMENTS:
+                    continue
+                if child.tag == "br":
+                    parts.append("\n")
+                child._collect_text(parts)
+            else:
+                parts.append(child)
+
+
+class _TreeBuilder(HTMLParser):
+    """Build an Element tree, tolerating unclosed and stray end tags."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document", {}, None)
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        element = Element(tag, {k: v or "" for k, v in attrs}, self._stack[-1])
+        self._stack[-1].children.append(element)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        element = Element(tag, {k: v or "" for k, v in attrs}, self._stack[-1])
+        self._stack[-1].children.append(element)
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                del self._stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+
+Compound = Tuple[
+    Optional[str], Optional[str], Tuple[str, ...], Tuple[Tuple[str, Optional[str]], ...]
+]
+
+
+def parse_html(html: str) -> Element:
+    """
+    Parse an HTML document.
+
+    Args:
+        html: Document source
+
+    Returns:
+        Document root element
+    """
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def select_first(root: Element, selector: str) -> Optional[Element]:
+    """
+    Find the first element matching a CSS selector.
+
+    Supports selector lists, descendant and child combinators, and compound
+    selectors of tag, #id, .class and [attr] / [attr=value].
+
+    Args:
+        root: Document or element to search within
+        selector: CSS selector
+
+    Returns:
+        First matching element in document order, or None
+
+    Raises:
+        UnsupportedSelectorError: If the selector uses other syntax
+    """
+    alternatives = [_parse_complex(part) for part in _split_selector_list(selector)]
+    for element in root.iter_elements():
+        if any(_matches(element, steps) for steps in alternatives):
+            return element
+    return None
+
+
+def extract_text(html: str, selector: str) -> Optional[str]:
+    """
+    Get the text of the first element matching a selector in an HTML document.
+
+    Args:
+        html: Document source
+        selector: CSS selector
+
+    Returns:
+        Element text, or None if nothing matches
+
+    Raises:
+        UnsupportedSelectorError: If the selector is not supported
+    """
+    element = select_first(parse_html(html), selector)
+    return element.text() if element is not None else None
+
+
+def _tokenize(selector: str) -> List[str]:
+    """Split a selector into compounds, '>' and ',' tokens, dropping whitespace."""
+    tokens: List[str] = []
+    position = 0
+    while position < len(selector):
+        match = _SELECTOR_TOKEN.match(selector, position)
+        if not match:
+            raise UnsupportedSelectorError(f"Unsupported selector syntax: '{selector}'")
+        if not match.group("space"):
+            tokens.append(match.group())
+        position = match.end()
+    return tokens
+
+
+def _split_selector_list(selector: str) -> List[List[str]]:
+    """Split 'a, b > c' into the token lists of its complex selectors."""
+    parts: List[List[str]] = [[]]
+    for token in _tokenize(selector):
+        if token == ",":
+            parts.append([])
+        else:
+            parts[-1].append(token)
+    return parts
+
+
+def _parse_complex(tokens: List[str]) -> List[Tuple[str, Compound]]:
+    """Parse the tokens of 'a > b c' into [(combinator, compound), ...] from left to right."""
+    selector = " ".join(tokens)
+    if not tokens:
+        raise UnsupportedSelectorError("Empty selector in selector list")
+    if tokens[0] == ">" or tokens[-1] == ">":
+        raise UnsupportedSelectorError(f"Dangling combinator in '{selector}'")
+
+    steps: List[Tuple[str, Compound]] = []
+    combinator = " "
+    for token in tokens:
+        if token == ">":
+            if combinator == ">":
+                raise UnsupportedSelectorError(
+                    f"Playwright selector chains are not supported: '{selector}'"
+                )
+            combinator = ">"
+            continue
+        steps.append((combinator, _parse_compound(token)))
+        combinator = " "
+    return steps
+
+
+def _parse_compound(token: str) -> Compound:
+    tag = element_id = None
+    classes: List[str] = []
+    attrs: List[Tuple[str, Optional[str]]] = []
+    position = 0
+    while position < len(token):
+        match = _SIMPLE_SELECTOR.match(token, position)
+        if not match or match.end() == position:
+            raise UnsupportedSelectorError(f"Unsupported selector syntax: '{token}'")
+        if match.group("tag"):
+            tag = None if match.group("tag") == "*" else match.group("tag").lower()
+        elif match.group("id"):
+            element_id = match.group("id")
+        elif match.group("cls"):
+            classes.append(match.group("cls"))
+        else:
+            value = next((v for v in match.group("dq", "sq", "bare") if v is not None), None)
+            attrs.append((match.group("attr").lower(), value))
+        position = match.end()
+    return tag, element_id, tuple(classes), tuple(attrs)
+
+
+def _matches_compound(element: Element, compound: Compound) -> bool:
+    tag, element_id, classes, attrs = compound
+    if tag and element.tag != tag:
+        return False
+    if element_id and element.attrs.get("id") != element_id:
+        return False
+    if classes and not set(classes) <= set(element.attrs.get("class", "").split()):
+        return False
+    for name, value in attrs:
+        if name not in element.attrs or (value is not None and element.attrs[name] != value):
+            return False
+    return True
+
+
+def _matches(element: Element, steps: List[Tuple[str, Compound]]) -> bool:
+    """Match right to left, walking up the ancestors."""
+    combinator, compound = steps[-1]
+    if not _matches_compound(element, compound):
+        return False
+    if len(steps) == 1:
+        return True
+
+    parent = element.parent
+    if combinator == ">":
+        return parent is not None and parent.tag != "#document" and _matches(parent, steps[:-1])
+
+    while parent is not None and parent.tag != "#document":
+        if _matches(parent, steps[:-1]):
+            return True
+        parent = parent.parent
+    return False
@@ -0,0 +1,56 @@
+"""Resolve item identifiers from feed item records and URLs."""
+
+import re
+from typing import Any, Dict, Iterable, Optional, Pattern, Union
+
+from constants.item_constants import ITEM_ID_ATTRIBUTES, ITEM_ID_PATTERN
+
+IdPattern = Union[str, Pattern[str]]
+
+
+def match_item_id(url: Optional[str], pattern: Optional[IdPattern] = None) -> Optional[str]:
+    """
+    Extract an item id from a URL.
+
+    Args:
+        url: URL or path to search
+        pattern: Regex whose first group (or whole match) is the id
+            (default: ITEM_ID_PATTERN)
+
+    Returns:
+        Item id or None if the pattern does not match
+    """
+    if not url:
+        return None
+
+    match = re.search(pattern or ITEM_ID_PATTERN, url)
+    if not match:
+        return None
+    return match.group(1) if match.groups() else match.group(0)
+
+
+def resolve_item_id(
+    record: Dict[str, Any],
+    pattern: Optional[IdPattern] = None,
+    attributes: Optional[Iterable[str]] = None,
+) -> Optional[str]:
+    """
+    Resolve an item id from a feed item record without navigating.
+
+    Data attributes are checked first, then the item's link href.
+
+    Args:
+        record: Feed item record (see FeedPage.get_item_records)
+        pattern: Regex for ids in hrefs (default: ITEM_ID_PATTERN)
+        attributes: Attribute names holding the id (default: ITEM_ID_ATTRIBUTES)
+
+    Returns:
+        Item id or None if it cannot be resolved from the DOM
+    """
+    item_attributes = record.get("attributes") or {}
+    for name in attributes if attributes is not None else ITEM_ID_ATTRIBUTES:
+        value = item_attributes.get(name)
+        if value:
+            return value
+
+    return match_item_id(record.get("href"), pattern)
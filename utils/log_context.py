@@ -0,0 +1,80 @@
+"""Run and item correlation ids for log records, and a JSON log formatter."""
+
+import contextlib
+import contextvars
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+run_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("run_id", default=None)
+item_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("item_id", default=None)
+
+
+def new_run_id() -> str:
+    """Generate a short id for a run."""
+    return uuid.uuid4().hex[:12]
+
+
+@contextlib.contextmanager
+def log_context(run_id: Optional[str] = None, item_id: Any = None) -> Iterator[None]:
+    """
+    Tag log records emitted inside the block with a run and/or item id.
+
+    Ids are context variables, so they follow the current thread or asyncio
+    task: worker tabs and concurrent pages each log their own item id.
+
+    Args:
+        run_id: Run id to set (None keeps the current one)
+        item_id: Item id to set (None keeps the current one)
+    """
+    tokens = []
+    if run_id is not None:
+        tokens.append((run_id_var, run_id_var.set(run_id)))
+    if item_id is not None:
+        tokens.append((item_id_var, item_id_var.set(str(item_id))))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """
+    Copy the current run and item ids onto each record as record.run_id / record.item_id.
+
+    Attach it to handlers that receive records on the emitting thread (a
+    QueueHandler or the handlers of a synchronous setup), since the ids are
+    read from that thread's context.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = run_id_var.get()
+        record.item_id = item_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including correlation ids."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key in ("run_id", "item_id"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
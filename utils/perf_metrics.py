@@ -0,0 +1,217 @@
+"""Browser-side performance metrics for page loads (Navigation/Resource Timing and CDP)."""
+
+import json
+import logging
+import statistics
+import threading
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page as AsyncPage
+    from playwright.sync_api import Page
+
+
+logger = logging.getLogger(__name__)
+
+# Timing of the current document and its subresources, relative to navigation start
+PAGE_TIMING_JS = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    const resources = performance.getEntriesByType("resource");
+    const round = value => Math.round(value * 10) / 10;
+    let resourceBytes = 0;
+    for (const entry of resources) resourceBytes += entry.transferSize || 0;
+    if (!nav) return { request_count: resources.length, transfer_bytes: resourceBytes };
+    return {
+        ttfb_ms: round(nav.responseStart - nav.requestStart),
+        response_ms: round(nav.responseEnd - nav.responseStart),
+        dom_content_loaded_ms: round(nav.domContentLoadedEventEnd - nav.startTime),
+        load_ms: nav.loadEventEnd ? round(nav.loadEventEnd - nav.startTime) : null,
+        document_bytes: nav.transferSize,
+        transfer_bytes: nav.transferSize + resourceBytes,
+        request_count: resources.length + 1,
+    };
+}
+"""
+
+# Chromium Performance.getMetrics name -> (output key, scale); *_ms values are
+# cumulative per page in CDP and are reported as the delta since the previous sample
+CDP_METRICS = {
+    "JSHeapUsedSize": ("js_heap_used_bytes", 1),
+    "JSHeapTotalSize": ("js_heap_total_bytes", 1),
+    "Nodes": ("dom_nodes", 1),
+    "ScriptDuration": ("script_ms", 1000),
+    "LayoutDuration": ("layout_ms", 1000),
+    "TaskDuration": ("task_ms", 1000),
+}
+
+# Sample keys that identify the page load rather than measure it
+SAMPLE_LABELS = ("item_id", "url")
+
+
+class PerfCollector:
+    """
+    Collect load metrics of a page after it navigated, and aggregate them per run.
+
+    Each sample combines the document's Navigation Timing (TTFB, DOM content
+    loaded), Resource Timing totals (requests, bytes transferred) and, on
+    Chromium, CDP Performance.getMetrics (JS heap, DOM nodes, script and
+    layout time). CDP sessions are opened once per page and reused, so worker
+    tabs processing many items report per-item script/layout time.
+    """
+
+    def __init__(self):
+        self.samples: List[Dict[str, Any]] = []
+        self._sessions: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
+        self._totals: weakref.WeakKeyDictionary[Any, Dict[str, float]] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> Optional["PerfCollector"]:
+        """Build the collector from settings, or None when perf metrics are disabled."""
+        if not settings.PERF_METRICS:
+            return None
+        return cls()
+
+    def collect(self, page: "Page", item_id: Any = None) -> Dict[str, Any]:
+        """
+        Collect metrics for the document currently loaded in a sync page.
+
+        Args:
+            page: Page that has finished navigating
+            item_id: Item the page shows, recorded with the sample
+
+        Returns:
+            Metrics (missing keys mean the browser did not report them)
+        """
+        metrics: Dict[str, Any] = {"item_id": item_id, "url": page.url}
+        try:
+            metrics.update(page.evaluate(PAGE_TIMING_JS))
+        except Exception as e:
+            logger.debug(f"Page timing unavailable for {page.url}: {e}")
+
+        try:
+            session = self._sessions.get(page)
+            if session is None:
+                session = page.context.new_cdp_session(page)
+                session.send("Performance.enable")
+                self._sessions[page] = session
+            metrics.update(self._cdp_metrics(page, session.send("Performance.getMetrics")))
+        except Exception as e:
+            logger.debug(f"CDP metrics unavailable for {page.url}: {e}")
+
+        self._add(metrics)
+        return metrics
+
+    async def collect_async(self, page: "AsyncPage", item_id: Any = None) -> Dict[str, Any]:
+        """Collect metrics for the document currently loaded in an async page (see collect)."""
+        metrics: Dict[str, Any] = {"item_id": item_id, "url": page.url}
+        try:
+            metrics.update(await page.evaluate(PAGE_TIMING_JS))
+        except Exception as e:
+            logger.debug(f"Page timing unavailable for {page.url}: {e}")
+
+        try:
+            session = self._sessions.get(page)
+            if session is None:
+                session = await page.context.new_cdp_session(page)
+                await session.send("Performance.enable")
+                self._sessions[page] = session
+            metrics.update(self._cdp_metrics(page, await session.send("Performance.getMetrics")))
+        except Exception as e:
+            logger.debug(f"CDP metrics unavailable for {page.url}: {e}")
+
+        self._add(metrics)
+        return metrics
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate the run's samples.
+
+        Returns:
+            Metric name -> count, mean, p50, p95 and max
+        """
+        with self._lock:
+            samples = list(self.samples)
+
+        values: Dict[str, List[float]] = {}
+        for sample in samples:
+            for key, value in sample.items():
+                if key in SAMPLE_LABELS:
+                    continue
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    values.setdefault(key, []).append(value)
+
+        summary = {}
+        for key, series in values.items():
+            series.sort()
+            summary[key] = {
+                "count": len(series),
+                "mean": round(statistics.fmean(series), 1),
+                "p50": series[int(0.50 * (len(series) - 1))],
+                "p95": series[int(0.95 * (len(series) - 1))],
+                "max": series[-1],
+            }
+        return summary
+
+    def write_report(self, report_dir: str, name: str = "perf") -> Optional[Path]:
+        """
+        Write the run's summary and samples to a timestamped JSON file.
+
+        Args:
+            report_dir: Directory for the report
+            name: File name prefix (e.g. per shard)
+
+        Returns:
+            Path of the report, or None if nothing was collected
+        """
+        if not self.samples:
+            return None
+
+        summary = self.summary()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = Path(report_dir) / f"{name}_{timestamp}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"summary": summary, "samples": self.samples}, indent=2))
+
+        for key in ("ttfb_ms", "dom_content_loaded_ms", "transfer_bytes"):
+            if key in summary:
+                logger.info(
+                    f"Page loads {key}: p50 {summary[key]['p50']}, p95 {summary[key]['p95']}"
+                )
+        logger.info(f"Performance metrics for {len(self.samples)} page loads written to {path}")
+        return path
+
+    def _add(self, metrics: Dict[str, Any]) -> None:
+        with self._lock:
+            self.samples.append(metrics)
+
+    def _cdp_metrics(self, page: Any, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Pick and scale CDP_METRICS, turning cumulative durations into per-sample deltas."""
+        totals = self._totals.setdefault(page, {})
+        metrics = {}
+        for metric in response.get("metrics", []):
+            if metric["name"] not in CDP_METRICS:
+                continue
+            key, scale = CDP_METRICS[metric["name"]]
+            value = metric["value"] * scale
+            if key.endswith("_ms"):
+                value, totals[key] = value - totals.get(key, 0.0), value
+            metrics[key] = round(value, 1)
+        return metrics
+
+
+def write_perf_report(
+    collector: Optional[PerfCollector], report_dir: str, name: str = "perf"
+) -> Optional[Path]:
+    """Write a collector's report without letting a reporting error fail the run."""
+    if collector is None:
+        return None
+    try:
+        return collector.write_report(report_dir, name)
+    except Exception as e:
+        logger.warning(f"Failed to write performance metrics: {e}")
+        return None
@@ -0,0 +1,199 @@
+"""Request routing that blocks unneeded resources by type and domain."""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import BrowserContext, Response, Route
+
+
+logger = logging.getLogger(__name__)
+
+# Third-party analytics/ad hosts blocked by the "aggressive" preset
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "scorecardresearch.com",
+)
+
+# Preset name -> (resource types, domains)
+BLOCK_PRESETS: Dict[str, tuple] = {
+    "none": ((), ()),
+    "lean": (("image", "media", "font"), ()),
+    "aggressive": (
+        ("image", "media", "font", "stylesheet", "texttrack", "manifest"),
+        TRACKER_DOMAINS,
+    ),
+}
+
+# Fallback per-type sizes (bytes) for the savings estimate when no response
+# of that type has been observed yet
+TYPICAL_SIZES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "stylesheet": 20_000,
+    "script": 60_000,
+}
+DEFAULT_SIZE = 10_000
+
+
+class ResourceBlocker:
+    """
+    Abort requests for blocked resource types or domains.
+
+    Blocked requests are aborted; everything else is handed on with
+    route.fallback() so other route handlers still see it. Bytes saved are an
+    estimate: the average Content-Length seen for allowed responses of the same
+    type, or TYPICAL_SIZES before any have been seen.
+    """
+
+    def __init__(self, resource_types: Iterable[str] = (), domains: Iterable[str] = ()):
+        """
+        Initialize blocker.
+
+        Args:
+            resource_types: Playwright resource types to block (image, font, ...)
+            domains: Hosts to block, including their subdomains
+        """
+        self.resource_types = frozenset(t.strip().lower() for t in resource_types if t.strip())
+        self.domains = tuple(d.strip().lower().lstrip(".") for d in domains if d.strip())
+
+        self.blocked_requests = 0
+        self.allowed_requests = 0
+        self.bytes_saved = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self._observed_sizes: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ResourceBlocker":
+        """
+        Build a blocker from the block_preset/block_resource_types/block_domains settings.
+
+        Args:
+            settings: Settings instance
+
+        Returns:
+            Configured blocker (possibly disabled)
+        """
+        preset = settings.BLOCK_PRESET
+        if preset not in BLOCK_PRESETS:
+            raise ValueError(
+                f"Unknown block preset '{preset}', expected one of {list(BLOCK_PRESETS)}"
+            )
+
+        preset_types, preset_domains = BLOCK_PRESETS[preset]
+        return cls(
+            resource_types=[*preset_types, *settings.BLOCK_RESOURCE_TYPES],
+            domains=[*preset_domains, *settings.BLOCK_DOMAINS],
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether anything is configured to be blocked."""
+        return bool(self.resource_types or self.domains)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """
+        Decide whether a request is blocked.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type
+
+        Returns:
+            True if the request should be aborted
+        """
+        if resource_type in self.resource_types:
+            return True
+
+        if self.domains:
+            host = (urlsplit(url).hostname or "").lower()
+            return any(host == d or host.endswith("." + d) for d in self.domains)
+
+        return False
+
+    def attach(self, context: "BrowserContext") -> None:
+        """Install the blocker on a sync browser context."""
+        if not self.enabled:
+            return
+        context.route("**/*", self._handle_route)
+        context.on("response", self._observe_response)
+        logger.info(f"Resource blocking enabled: {self.describe()}")
+
+    async def attach_async(self, context: "AsyncBrowserContext") -> None:
+        """Install the blocker on an async browser context."""
+        if not self.enabled:
+            return
+        await context.route("**/*", self._handle_route_async)
+        context.on("response", self._observe_response)
+        logger.info(f"Resource blocking enabled: {self.describe()}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this run."""
+        return {
+            "blocked_requests": self.blocked_requests,
+            "allowed_requests": self.allowed_requests,
+            "estimated_bytes_saved": self.bytes_saved,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+    def log_stats(self) -> None:
+        """Log the run's blocking counters."""
+        if self.enabled:
+            logger.info(
+                f"Blocked {self.blocked_requests} requests "
+                f"(~{self.bytes_saved / 1_048_576:.1f} MiB saved): {self.blocked_by_type}"
+            )
+
+    def describe(self) -> str:
+        """Human-readable configuration."""
+        return f"types={sorted(self.resource_types)} domains={list(self.domains)}"
+
+    def _record(self, url: str, resource_type: str) -> bool:
+        """Apply the blocking decision and update counters."""
+        if not self.should_block(url, resource_type):
+            self.allowed_requests += 1
+            return False
+
+        self.blocked_requests += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.bytes_saved += self._estimate_size(resource_type)
+        return True
+
+    def _estimate_size(self, resource_type: str) -> int:
+        """Estimate the size of a blocked response."""
+        count, total = self._observed_sizes.get(resource_type, (0, 0))
+        if count:
+            return total // count
+        return TYPICAL_SIZES.get(resource_type, DEFAULT_SIZE)
+
+    def _observe_response(self, response: "Response") -> None:
+        """Track Content-Length of allowed responses for the savings estimate."""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            resource_type = response.request.resource_type
+            count, total = self._observed_sizes.get(resource_type, (0, 0))
+            self._observed_sizes[resource_type] = (count + 1, total + int(length))
+
+    def _handle_route(self, route: "Route") -> None:
+        request = route.request
+        if self._record(request.url, request.resource_type):
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    async def _handle_route_async(self, route: "AsyncRoute") -> None:
+        request = route.request
+        if self._record(request.url, request.resource_type):
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
@@ -0,0 +1,311 @@
+"""Pluggable result sinks with batched background writing."""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Record = Dict[str, Any]
+
+
+class ResultSink(ABC):
+    """Destination for item records, written in batches from a single thread."""
+
+    extension = ""
+
+    def __init__(self, path: Path):
+        """
+        Initialize sink.
+
+        Args:
+            path: Output file path
+        """
+        self.path = Path(path)
+
+    def open(self) -> None:
+        """Prepare the destination; called on the writer thread."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @abstractmethod
+    def write_batch(self, records: List[Record]) -> None:
+        """Persist a batch of records."""
+
+    def close(self) -> None:
+        """Flush and release the destination."""
+
+
+class _FileSink(ResultSink):
+    """Base for append-only text file sinks; fsyncs once, on close."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._file: Optional[Any] = None
+
+    def open(self) -> None:
+        super().open()
+        self._file = self.path.open("a", newline="", encoding="utf-8")
+
+    def close(self) -> None:
+        if self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+
+class JsonlSink(_FileSink):
+    """One JSON object per line."""
+
+    extension = "jsonl"
+
+    def write_batch(self, records: List[Record]) -> None:
+        self._file.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+        self._file.flush()
+
+
+class CsvSink(_FileSink):
+    """
+    CSV with columns taken from the first batch.
+
+    Nested values are JSON-encoded; keys that first appear after the header
+    was written go to an "extra" column as JSON.
+    """
+
+    extension = "csv"
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._writer: Optional[csv.DictWriter] = None
+        self._fieldnames: List[str] = []
+
+    def write_batch(self, records: List[Record]) -> None:
+        if self._writer is None:
+            self._fieldnames = list(dict.fromkeys(key for r in records for key in r)) + ["extra"]
+            self._writer = csv.DictWriter(self._file, fieldnames=self._fieldnames)
+            if self._file.tell() == 0:
+                self._writer.writeheader()
+
+        self._writer.writerows(self._row(record) for record in records)
+        self._file.flush()
+
+    def _row(self, record: Record) -> Dict[str, Any]:
+        row: Dict[str, Any] = {}
+        extra: Dict[str, Any] = {}
+        for key, value in record.items():
+            target = row if key in self._fieldnames else extra
+            target[key] = (
+                json.dumps(value, default=str) if isinstance(value, (dict, list)) else value
+            )
+        if extra:
+            row["extra"] = json.dumps(extra, default=str)
+        return row
+
+
+class SqliteSink(ResultSink):
+    """SQLite table of (item_id, data JSON, recorded_at); one transaction per batch."""
+
+    extension = "sqlite"
+
+    def __init__(self, path: Path, table: str = "items"):
+        super().__init__(path)
+        self.table = table
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def open(self) -> None:
+        super().open()
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} "
+            "(item_id TEXT, data TEXT NOT NULL, recorded_at REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def write_batch(self, records: List[Record]) -> None:
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {self.table} (item_id, data, recorded_at) VALUES (?, ?, ?)",
+                [(r.get("id"), json.dumps(r, default=str), now) for r in records],
+            )
+
+    def close(self) -> None:
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+
+SINKS = {"jsonl": JsonlSink, "csv": CsvSink, "sqlite": SqliteSink}
+
+_STOP = object()
+
+
+class BatchedResultWriter:
+    """
+    Buffer records and hand them to a sink from a background thread.
+
+    write() only enqueues, so the browser loop never waits on disk unless the
+    bounded queue is full (backpressure keeps memory flat on huge runs). The
+    writer thread flushes whenever batch_size records are buffered or the
+    oldest buffered record has waited flush_interval seconds; while idle it
+    blocks on the queue. A record's on_written callback runs on the writer
+    thread once its batch is in the sink, e.g. to journal the item as done
+    only after its result is stored.
+    """
+
+    def __init__(
+        self,
+        sink: ResultSink,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        max_queue: int = 10_000,
+    ):
+        """
+        Initialize writer and start its thread.
+
+        Args:
+            sink: Destination for records
+            batch_size: Records per batch write
+            flush_interval: Maximum seconds a record waits in the buffer
+            max_queue: Queued records before write() blocks
+        """
+        self.sink = sink
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.error: Optional[BaseException] = None
+
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BatchedResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def write(self, record: Record, on_written: Optional[Callable[[], None]] = None) -> None:
+        """
+        Queue one record for writing.
+
+        Args:
+            record: Record to write
+            on_written: Called on the writer thread after the record's batch is
+                written; never called if the sink fails first
+        """
+        if self.error:
+            raise RuntimeError(f"Result writer failed: {self.error}")
+        self._queue.put((record, on_written))
+
+    async def write_async(
+        self, record: Record, on_written: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Queue one record from a coroutine; a full queue is waited on off the event loop."""
+        if self.error:
+            raise RuntimeError(f"Result writer failed: {self.error}")
+        try:
+            self._queue.put_nowait((record, on_written))
+        except queue.Full:
+            await asyncio.to_thread(self._queue.put, (record, on_written))
+
+    def close(self) -> None:
+        """Flush remaining records, stop the thread and close the sink."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+            logger.info(f"Wrote {self.written} records to {self.sink.path}")
+
+    def _run(self) -> None:
+        batch: List[Tuple[Record, Optional[Callable[[], None]]]] = []
+        # When the oldest buffered record arrived; flush_interval counts from here
+        batch_started = time.monotonic()
+        try:
+            self.sink.open()
+            while True:
+                # With nothing buffered, block until a record arrives instead of
+                # polling (a zero flush_interval would spin a core)
+                timeout = (
+                    max(0.0, self.flush_interval - (time.monotonic() - batch_started))
+                    if batch
+                    else None
+                )
+                try:
+                    entry = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    entry = None
+
+                if entry is _STOP:
+                    break
+                if entry is not None:
+                    if not batch:
+                        batch_started = time.monotonic()
+                    batch.append(entry)
+
+                if batch and (
+                    len(batch) >= self.batch_size
+                    or time.monotonic() - batch_started >= self.flush_interval
+                ):
+                    self._flush(batch)
+                    batch = []
+
+            if batch:
+                self._flush(batch)
+        except Exception as e:
+            logger.error(f"Result writer for {self.sink.path} failed: {e}", exc_info=True)
+            self.error = e
+            # Keep draining so producers never block on a dead writer
+            while self._queue.get() is not _STOP:
+                pass
+        finally:
+            self.sink.close()
+
+    def _flush(self, batch: List[Tuple[Record, Optional[Callable[[], None]]]]) -> None:
+        self.sink.write_batch([record for record, _ in batch])
+        self.written += len(batch)
+        logger.debug(f"Flushed {len(batch)} records to {self.sink.path}")
+        for _, on_written in batch:
+            if on_written:
+                try:
+                    on_written()
+                except Exception as e:
+                    logger.error(f"Result write callback failed: {e}")
+
+
+def open_result_writer(settings: Any, name: str = "items") -> Optional[BatchedResultWriter]:
+    """
+    Create the configured result writer, writing to a timestamped file in REPORT_DIR.
+
+    Args:
+        settings: Settings instance
+        name: File name prefix (e.g. per shard or account)
+
+    Returns:
+        Running writer, or None when result_sink is "none"
+    """
+    kind = settings.RESULT_SINK
+    if kind == "none":
+        return None
+    if kind not in SINKS:
+        raise ValueError(f"Unknown result sink '{kind}', expected one of {['none', *SINKS]}")
+
+    sink_class = SINKS[kind]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = Path(settings.REPORT_DIR) / f"{name}_{timestamp}.{sink_class.extension}"
+    return BatchedResultWriter(
+        sink_class(path),
+        batch_size=settings.SINK_BATCH_SIZE,
+        flush_interval=settings.SINK_FLUSH_INTERVAL,
+    )
@@ -0,0 +1,314 @@
+"""Screenshot capture with background disk writes, rate limiting and a disk budget."""
+
+import atexit
+import hashlib
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page as AsyncPage
+    from playwright.sync_api import Page
+
+
+logger = logging.getLogger(__name__)
+
+# File extensions per screenshot type; existing files of both types count against the budget
+EXTENSIONS = {"png": "png", "jpeg": "jpg"}
+
+# Pending writes beyond this are dropped rather than blocking the page
+QUEUE_SIZE = 64
+
+
+class ScreenshotService:
+    """
+    Capture page screenshots and write them to disk on a background thread.
+
+    The browser encodes the image (JPEG is much cheaper than PNG for large
+    viewports) and returns the bytes; a daemon thread writes them and keeps
+    the directory under max_bytes by deleting the oldest files first.
+
+    Captures of the same kind (the screenshot name, e.g. "item_info_error")
+    are rate-limited to one per min_interval seconds, and a capture whose
+    image is identical to the previous one of its kind is not written. During
+    an outage this turns thousands of identical failure screenshots into a
+    handful.
+    """
+
+    def __init__(
+        self,
+        screenshot_dir: str,
+        max_bytes: int = 200 * 1024 * 1024,
+        image_type: str = "png",
+        quality: Optional[int] = None,
+        full_page: bool = False,
+        min_interval: float = 30.0,
+    ):
+        """
+        Initialize the service and account for screenshots already on disk.
+
+        Args:
+            screenshot_dir: Directory for screenshots
+            max_bytes: Disk budget for the directory (0 = unlimited)
+            image_type: "png" or "jpeg"
+            quality: JPEG quality 0-100 (ignored for PNG)
+            full_page: Capture the full scrollable page instead of the viewport
+            min_interval: Minimum seconds between captures of the same kind (0 = no limit)
+
+        Raises:
+            ValueError: If image_type is not supported
+        """
+        if image_type not in EXTENSIONS:
+            raise ValueError(f"Unsupported screenshot type: {image_type} (use png or jpeg)")
+
+        self.dir = Path(screenshot_dir)
+        self.max_bytes = max_bytes
+        self.image_type = image_type
+        self.quality = quality if image_type == "jpeg" else None
+        self.full_page = full_page
+        self.min_interval = min_interval
+
+        self.captured = 0
+        self.suppressed = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.evicted = 0
+
+        self._last_capture: Dict[str, float] = {}
+        self._last_digest: Dict[str, str] = {}
+        self._files: Deque[Tuple[Path, int]] = deque()
+        self._total_bytes = 0
+        self._queue: queue.Queue[Optional[Tuple[Path, bytes]]] = queue.Queue(QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._scan()
+        # Once per service; close() is a no-op while no writer thread runs
+        atexit.register(self.close)
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ScreenshotService":
+        """Build the service from the SCREENSHOT_* settings."""
+        return cls(
+            settings.SCREENSHOT_DIR,
+            max_bytes=settings.SCREENSHOT_MAX_MB * 1024 * 1024,
+            image_type=settings.SCREENSHOT_TYPE,
+            quality=settings.SCREENSHOT_QUALITY,
+            full_page=settings.SCREENSHOT_FULL_PAGE,
+            min_interval=settings.SCREENSHOT_MIN_INTERVAL,
+        )
+
+    def capture(
+        self,
+        page: "Page",
+        name: str = "screenshot",
+        clip: Optional[Dict[str, float]] = None,
+        full_page: Optional[bool] = None,
+    ) -> Optional[Path]:
+        """
+        Screenshot a sync page and queue the image for writing.
+
+        Args:
+            page: Page to capture
+            name: Screenshot kind, used for rate limiting and as file name prefix
+            clip: Region to capture ({"x", "y", "width", "height"} in CSS pixels)
+            full_page: Override the service's full_page option
+
+        Returns:
+            Path the screenshot will be written to, or None if it was skipped
+        """
+        if not self._admit(name):
+            return None
+        try:
+            data = page.screenshot(**self._options(clip, full_page))
+        except Exception as e:
+            logger.warning(f"Screenshot {name} failed: {e}")
+            return None
+        return self._submit(name, data)
+
+    async def capture_async(
+        self,
+        page: "AsyncPage",
+        name: str = "screenshot",
+        clip: Optional[Dict[str, float]] = None,
+        full_page: Optional[bool] = None,
+    ) -> Optional[Path]:
+        """Screenshot an async page and queue the image for writing (see capture)."""
+        if not self._admit(name):
+            return None
+        try:
+            data = await page.screenshot(**self._options(clip, full_page))
+        except Exception as e:
+            logger.warning(f"Screenshot {name} failed: {e}")
+            return None
+        return self._submit(name, data)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every queued screenshot has been written."""
+        if self._thread is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(f"{self._queue.unfinished_tasks} screenshots still pending")
+                return
+            time.sleep(0.01)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Write pending screenshots, stop the writer thread and log the counts."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        logger.info(
+            f"Screenshots: {self.captured} written, {self.suppressed} rate-limited, "
+            f"{self.duplicates} duplicates, {self.dropped} dropped, {self.evicted} evicted"
+        )
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes of screenshots currently in the directory."""
+        with self._lock:
+            return self._total_bytes
+
+    def _admit(self, name: str) -> bool:
+        """Apply the per-kind rate limit before paying for a capture."""
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_capture.get(name)
+            if last is not None and now - last < self.min_interval:
+                self.suppressed += 1
+                logger.debug(f"Screenshot {name} rate-limited")
+                return False
+            self._last_capture[name] = now
+        return True
+
+    def _options(self, clip: Optional[Dict[str, float]], full_page: Optional[bool]) -> dict:
+        options: Dict[str, Any] = {
+            "type": self.image_type,
+            "full_page": self.full_page if full_page is None else full_page,
+            "animations": "disabled",
+            "caret": "hide",
+            "scale": "css",
+        }
+        if self.quality is not None:
+            options["quality"] = self.quality
+        if clip:
+            options["clip"] = clip
+            options["full_page"] = False
+        return options
+
+    def _submit(self, name: str, data: bytes) -> Optional[Path]:
+        """Drop duplicate images and hand the rest to the writer thread."""
+        digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            if self._last_digest.get(name) == digest:
+                self.duplicates += 1
+                logger.debug(f"Screenshot {name} identical to the previous one, not written")
+                return None
+            self._last_digest[name] = digest
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = self.dir / f"{name}_{timestamp}.{EXTENSIONS[self.image_type]}"
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((path, data))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Screenshot queue full, dropped {path.name}")
+            return None
+        logger.info(f"Taking screenshot: {path}")
+        return path
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._write_loop, name="screenshot-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            except Exception as e:
+                logger.warning(f"Failed to write screenshot: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        with self._lock:
+            self.captured += 1
+            self._files.append((path, len(data)))
+            self._total_bytes += len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete the oldest screenshots until the directory fits the budget; caller holds the lock."""
+        # The newest file is kept even if it alone exceeds the budget
+        while self.max_bytes and self._total_bytes > self.max_bytes and len(self._files) > 1:
+            path, size = self._files.popleft()
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to evict screenshot {path}: {e}")
+            self._total_bytes -= size
+            self.evicted += 1
+
+    def _scan(self) -> None:
+        """Account for screenshots left by earlier runs, oldest first."""
+        if not self.dir.is_dir():
+            return
+        files = []
+        for extension in set(EXTENSIONS.values()):
+            for path in self.dir.glob(f"*.{extension}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(files):
+            self._files.append((path, size))
+            self._total_bytes += size
+        self._evict()
+
+
+_services: Dict[Tuple[Any, ...], ScreenshotService] = {}
+_services_lock = threading.Lock()
+
+
+def get_screenshot_service(settings: Any) -> ScreenshotService:
+    """
+    Get the process-wide screenshot service for the current settings.
+
+    Page objects are created per page and per item, so they share one service
+    (and one writer thread, rate limiter and budget) per configuration.
+    """
+    key = (
+        settings.SCREENSHOT_DIR,
+        settings.SCREENSHOT_MAX_MB,
+        settings.SCREENSHOT_TYPE,
+        settings.SCREENSHOT_QUALITY,
+        settings.SCREENSHOT_FULL_PAGE,
+        settings.SCREENSHOT_MIN_INTERVAL,
+    )
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = ScreenshotService.from_settings(settings)
+        return service
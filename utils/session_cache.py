@@ -0,0 +1,169 @@
+"""On-disk cache of authenticated browser storage state."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.sync_api import BrowserContext
+
+
+logger = logging.getLogger(__name__)
+
+StorageState = Dict[str, Any]
+
+
+class SessionCache:
+    """
+    Cache of Playwright storage_state (cookies + localStorage) per site and user.
+
+    Entries are keyed by BASE_URL and username, written atomically with
+    owner-only permissions, and treated as expired after max_age seconds or
+    once every cookie with an expiry has lapsed.
+    """
+
+    def __init__(self, cache_dir: str = ".sessions", max_age: Optional[int] = None):
+        """
+        Initialize session cache.
+
+        Args:
+            cache_dir: Directory holding cached states
+            max_age: Maximum entry age in seconds (None for no limit)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> Optional["SessionCache"]:
+        """Build the cache from settings, or None when session caching is disabled."""
+        if not settings.SESSION_CACHE:
+            return None
+        return cls(settings.SESSION_DIR, settings.SESSION_MAX_AGE or None)
+
+    def path_for(self, base_url: str, username: str) -> Path:
+        """
+        Get the state file path for a site and user.
+
+        Args:
+            base_url: Site base URL
+            username: Account username
+
+        Returns:
+            Path of the cached storage state (may not exist)
+        """
+        key = hashlib.sha256(f"{base_url}\0{username}".encode()).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, base_url: str, username: str) -> Optional[StorageState]:
+        """
+        Load a cached state if present and not expired.
+
+        Args:
+            base_url: Site base URL
+            username: Account username
+
+        Returns:
+            Storage state or None
+        """
+        path = self.path_for(base_url, username)
+        if not path.exists():
+            return None
+
+        if self.max_age is not None and time.time() - path.stat().st_mtime > self.max_age:
+            logger.info("Cached session is older than max age, discarding")
+            self.invalidate(base_url, username)
+            return None
+
+        try:
+            state = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable cached session {path}: {e}")
+            self.invalidate(base_url, username)
+            return None
+
+        if _cookies_expired(state):
+            logger.info("Cached session cookies have expired, discarding")
+            self.invalidate(base_url, username)
+            return None
+
+        return state
+
+    def save(self, context: "BrowserContext", base_url: str, username: str) -> Path:
+        """Capture and store the storage state of a sync browser context."""
+        return self._write(context.storage_state(), base_url, username)
+
+    async def save_async(
+        self, context: "AsyncBrowserContext", base_url: str, username: str
+    ) -> Path:
+        """Capture and store the storage state of an async browser context."""
+        return self._write(await context.storage_state(), base_url, username)
+
+    def invalidate(self, base_url: str, username: str) -> None:
+        """Remove a cached state."""
+        self.path_for(base_url, username).unlink(missing_ok=True)
+
+    def _write(self, state: StorageState, base_url: str, username: str) -> Path:
+        """Write state atomically with owner-only permissions."""
+        path = self.path_for(base_url, username)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+        logger.info(f"Saved authenticated session to {path}")
+        return path
+
+
+def apply_storage_state(context: "BrowserContext", state: StorageState) -> None:
+    """
+    Restore a storage state into an existing sync context.
+
+    Use this for contexts that cannot take storage_state at creation, such as
+    persistent contexts; for new contexts pass storage_state to new_context().
+    """
+    if state.get("cookies"):
+        context.add_cookies(state["cookies"])
+    script = _local_storage_script(state)
+    if script:
+        context.add_init_script(script=script)
+
+
+async def apply_storage_state_async(context: "AsyncBrowserContext", state: StorageState) -> None:
+    """Restore a storage state into an existing async context (see apply_storage_state)."""
+    if state.get("cookies"):
+        await context.add_cookies(state["cookies"])
+    script = _local_storage_script(state)
+    if script:
+        await context.add_init_script(script=script)
+
+
+def _cookies_expired(state: StorageState) -> bool:
+    """True when the state has expiring cookies and all of them have lapsed."""
+    expiries = [c["expires"] for c in state.get("cookies", []) if c.get("expires", -1) > 0]
+    return bool(expiries) and max(expiries) < time.time()
+
+
+def _local_storage_script(state: StorageState) -> Optional[str]:
+    """Init script seeding localStorage for matching origins without overwriting app writes."""
+    origins = [o for o in state.get("origins", []) if o.get("localStorage")]
+    if not origins:
+        return None
+
+    return (
+        "(() => {"
+        f"const origins = {json.dumps(origins)};"
+        "const entry = origins.find(o => o.origin === window.location.origin);"
+        "if (!entry) return;"
+        "for (const { name, value } of entry.localStorage) {"
+        "if (window.localStorage.getItem(name) === null) window.localStorage.setItem(name, value);"
+        "}"
+        "})();"
+    )
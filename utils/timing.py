@@ -0,0 +1,232 @@
+"""In-memory latency histograms for page object actions."""
+
+import functools
+import inspect
+import json
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Span key: (page class, action, selector)
+SpanKey = Tuple[str, str, Optional[str]]
+
+# Bucket boundaries grow by 5%, so percentiles are accurate to within ~2.5%
+BUCKET_GROWTH = 1.05
+MIN_SECONDS = 1e-4
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with constant memory per key.
+
+    Recording is a log and a dict increment; percentiles are read from
+    bucket counts, so no individual samples are kept.
+    """
+
+    __slots__ = ("count", "errors", "total", "min", "max", "_buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def record(self, seconds: float, ok: bool = True) -> None:
+        """Add one duration in seconds."""
+        self.count += 1
+        self.errors += not ok
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        bucket = int(math.log(max(seconds, MIN_SECONDS) / MIN_SECONDS, BUCKET_GROWTH))
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            q: Percentile in 0-100
+
+        Returns:
+            Duration in seconds (0.0 when empty)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # Midpoint of the bucket, clamped to what was actually observed
+                value = MIN_SECONDS * BUCKET_GROWTH ** (bucket + 0.5)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class ActionTimings:
+    """
+    Process-wide registry of action latency histograms.
+
+    Spans are keyed by page class, action and selector; the histograms are
+    shared across pages and threads of the process.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._histograms: Dict[SpanKey, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, page: str, action: str, selector: Optional[str], seconds: float, ok: bool = True
+    ) -> None:
+        """Record one span."""
+        key = (page, action, selector)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(seconds, ok)
+
+    def reset(self) -> None:
+        """Drop all recorded spans."""
+        with self._lock:
+            self._histograms.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate the recorded spans, slowest total time first.
+
+        Returns:
+            One row per (page, action, selector) with counts and millisecond latencies
+        """
+        with self._lock:
+            items = list(self._histograms.items())
+
+        rows = []
+        for (page, action, selector), histogram in items:
+            rows.append(
+                {
+                    "page": page,
+                    "action": action,
+                    "selector": selector,
+                    "count": histogram.count,
+                    "errors": histogram.errors,
+                    "total_s": round(histogram.total, 3),
+                    "mean_ms": round(histogram.total / histogram.count * 1000, 1),
+                    "p50_ms": round(histogram.percentile(50) * 1000, 1),
+                    "p95_ms": round(histogram.percentile(95) * 1000, 1),
+                    "p99_ms": round(histogram.percentile(99) * 1000, 1),
+                    "max_ms": round(histogram.max * 1000, 1),
+                }
+            )
+        return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+    def write_report(self, report_dir: str, name: str = "timings") -> Optional[Path]:
+        """
+        Write the summary to a timestamped JSON file and log the slowest spans.
+
+        Args:
+            report_dir: Directory for the report
+            name: File name prefix (e.g. per shard)
+
+        Returns:
+            Path of the report, or None if nothing was recorded
+        """
+        rows = self.summary()
+        if not rows:
+            return None
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = Path(report_dir) / f"{name}_{timestamp}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(rows, indent=2))
+
+        for row in rows[:5]:
+            logger.info(
+                f"{row['page']}.{row['action']}({row['selector'] or ''}): "
+                f"{row['count']}x, p50 {row['p50_ms']}ms, p95 {row['p95_ms']}ms, "
+                f"total {row['total_s']}s"
+            )
+        logger.info(f"Action timings written to {path}")
+        return path
+
+
+TIMINGS = ActionTimings()
+
+
+def write_timings(report_dir: str, name: str = "timings") -> Optional[Path]:
+    """Write the TIMINGS report without letting a reporting error fail the run."""
+    try:
+        return TIMINGS.write_report(report_dir, name)
+    except Exception as e:
+        logger.warning(f"Failed to write action timings: {e}")
+        return None
+
+
+def timed(func: F) -> F:
+    """
+    Record a span in TIMINGS for every call of a page object method.
+
+    Works for sync and async methods. The span is keyed by the instance's
+    class, the method name and its selector argument (if it has one); calls
+    that raise are counted as errors. Nested timed calls (e.g. safe_click
+    waiting via wait_for_selector) each record their own span.
+    """
+    action = func.__name__
+    params = list(inspect.signature(func).parameters)
+    selector_index = params.index("selector") - 1 if "selector" in params else None
+
+    def span_key(self: Any, args: tuple, kwargs: dict) -> Tuple[str, Optional[str]]:
+        selector = None
+        if selector_index is not None:
+            if "selector" in kwargs:
+                selector = kwargs["selector"]
+            elif len(args) > selector_index:
+                selector = args[selector_index]
+        return type(self).__name__, selector
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not TIMINGS.enabled:
+                return await func(self, *args, **kwargs)
+            started = time.perf_counter()
+            ok = False
+            try:
+                result = await func(self, *args, **kwargs)
+                ok = True
+                return result
+            finally:
+                page, selector = span_key(self, args, kwargs)
+                TIMINGS.record(page, action, selector, time.perf_counter() - started, ok)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not TIMINGS.enabled:
+            return func(self, *args, **kwargs)
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = func(self, *args, **kwargs)
+            ok = True
+            return result
+        finally:
+            page, selector = span_key(self, args, kwargs)
+            TIMINGS.record(page, action, selector, time.perf_counter() - started, ok)
+
+    return wrapper  # type: ignore[return-value]